@@ -0,0 +1,53 @@
+"""
+Compares the output profiles available to `SaveFile.write`, showing the payload size and the time spent
+serialising, encrypting and writing each of the test saves.
+
+Run from the repository root with `python -m benchmarks.serialisation`, which finds the package
+without it being installed.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import tempfile
+import timeit
+from functools import partial
+from typing import get_args
+
+from great_asset import SaveFile
+from great_asset.utils import DumpProfile, get_json_codec
+
+SAVE_FILES = pathlib.Path(__file__).parent.parent / "tests" / "save_files"
+ROUNDS = 200
+PROFILES: tuple[DumpProfile, ...] = get_args(DumpProfile)
+
+
+def write(save: SaveFile, output: pathlib.Path, profile: DumpProfile) -> None:
+    # an unmodified save is written as the bytes it was loaded from, so flip the credits to always re-serialise it
+    save.update_credits(save.credits ^ 1)
+    save.write(path=output, profile=profile)
+
+
+def main() -> None:
+    print(f"JSON backend: {type(get_json_codec()).__name__}, {ROUNDS} writes per measurement\n")
+    print(f"{'file':<16}{'profile':<10}{'bytes':>10}{'vs pretty':>12}{'ms/write':>12}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for save_path in sorted(SAVE_FILES.glob("LCSaveFile*")):
+            save = SaveFile.from_path(save_path)
+            output = pathlib.Path(directory) / save_path.name
+
+            sizes: dict[str, int] = {}
+            for profile in PROFILES:
+                write(save, output, profile)
+                sizes[profile] = output.stat().st_size
+
+            for profile in PROFILES:
+                elapsed = timeit.timeit(partial(write, save, output, profile), number=ROUNDS)
+                size = sizes[profile]
+                ratio = size / sizes["pretty"]
+                print(f"{save_path.name:<16}{profile:<10}{size:>10}{ratio:>12.0%}{elapsed / ROUNDS * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,11 +31,65 @@ __version__ = "1.2.1"
 CRYPTO_PASSWORD = "lcslime14a5"
 
 import logging
-from typing import Literal, NamedTuple
+from typing import TYPE_CHECKING, Any, List, Literal, NamedTuple
 
-from .enums import *
-from .save_file import ChallengeFile as ChallengeFile, ConfigFile as ConfigFile, SaveFile as SaveFile
-from .vector import Vector as Vector
+if TYPE_CHECKING:
+    from .enums import *
+    from .save_file import ChallengeFile as ChallengeFile, ConfigFile as ConfigFile, SaveFile as SaveFile
+    from .vector import Vector as Vector, VectorArray as VectorArray
+
+__all__ = (
+    "BestiaryEntry",
+    "ChallengeFile",
+    "ConfigFile",
+    "ExtraUnlock",
+    "Item",
+    "Moon",
+    "SaveFile",
+    "Scrap",
+    "ShipUnlock",
+    "Vector",
+    "VectorArray",
+)
+
+# the public names and the modules they live in, these are only imported when first accessed
+# so that importing the package doesn't pull in the crypto and JSON backends
+_LAZY_ATTRIBUTES = {
+    "ShipUnlock": "enums",
+    "ExtraUnlock": "enums",
+    "BestiaryEntry": "enums",
+    "Item": "enums",
+    "Scrap": "enums",
+    "Moon": "enums",
+    "SaveFile": "save_file",
+    "ConfigFile": "save_file",
+    "ChallengeFile": "save_file",
+    "Vector": "vector",
+    "VectorArray": "vector",
+}
+# submodules that used to be imported eagerly, and so could be reached as attributes of the package
+_LAZY_SUBMODULES = frozenset({"crypt", "enums", "item", "save_file", "utils", "vector"})
+
+
+def __getattr__(name: str) -> Any:
+    from importlib import import_module
+
+    if name in _LAZY_SUBMODULES:
+        return import_module(f".{name}", __name__)
+
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    # cache it, so this is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES})
 
 
 class VersionInfo(NamedTuple):
@@ -50,4 +104,4 @@ version_info: VersionInfo = VersionInfo(major=1, minor=2, micro=0, releaselevel=
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
-del logging, NamedTuple, Literal, VersionInfo
+del logging, NamedTuple, Literal, VersionInfo, TYPE_CHECKING, Any
@@ -0,0 +1,279 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+from .utils import _from_json, _to_json, _write_file  # type: ignore[reportPrivateUsage] we allow this here.
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+__all__ = (
+    "DEFAULT_MAX_BYTES",
+    "PayloadCache",
+    "PayloadCacheInfo",
+)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class PayloadCacheInfo(NamedTuple):
+    """
+    The statistics of a :class:`PayloadCache`.
+
+    Attributes
+    -----------
+    hits: :class:`int`
+        The lookups answered from memory.
+    disk_hits: :class:`int`
+        The lookups answered from the on-disk tier.
+    misses: :class:`int`
+        The lookups that had to be decrypted.
+    entries: :class:`int`
+        The payloads currently held in memory.
+    current_bytes: :class:`int`
+        The size of the files the payloads held in memory were decoded from.
+    max_bytes: :class:`int`
+        The most bytes held in memory before the least recently used payloads are dropped.
+    """
+
+    hits: int
+    disk_hits: int
+    misses: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+
+class PayloadCache:
+    """
+    A cache of decoded save payloads, keyed by a hash of the encrypted file they were decoded from,
+    so loading a file identical to one already seen skips the decryption entirely.
+
+    Each lookup returns a shallow copy of the cached payload, which the save file classes treat as copy-on-write:
+    they replace the entries they change rather than changing them in place.
+
+    Parameters
+    -----------
+    max_bytes: :class:`int`
+        The most bytes to hold in memory, measured by the size of the encrypted files, which is close to
+        the size of the JSON they hold. Defaults to :data:`DEFAULT_MAX_BYTES`.
+    directory: :class:`~pathlib.Path` | :class:`str` | ``None``
+        A directory to also persist payloads to, so they outlive the process. The payloads are stored decrypted.
+        Defaults to ``None``, memory only.
+    """
+
+    __slots__ = (
+        "_current_bytes",
+        "_directory",
+        "_disk_hits",
+        "_entries",
+        "_hits",
+        "_lock",
+        "_max_bytes",
+        "_misses",
+    )
+
+    def __init__(self, *, max_bytes: int = DEFAULT_MAX_BYTES, directory: Path | PathLike[Any] | str | None = None) -> None:
+        # digest -> (payload, cost), most recently used last
+        self._entries: OrderedDict[bytes, tuple[Any, int]] = OrderedDict()
+        self._max_bytes: int = max_bytes
+        self._current_bytes: int = 0
+        self._directory: Path | None = Path(directory) if directory is not None else None
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: int = 0
+        self._disk_hits: int = 0
+        self._misses: int = 0
+
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"<PayloadCache entries={len(self._entries)} bytes={self._current_bytes}/{self._max_bytes}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(data: bytes, /) -> bytes:
+        """
+        The key a file is cached under, a BLAKE2b digest of its encrypted bytes.
+
+        Parameters
+        -----------
+        data: :class:`bytes`
+            The encrypted file.
+
+        Returns
+        --------
+        :class:`bytes`
+        """
+        return blake2b(data, digest_size=16).digest()
+
+    def _disk_path(self, key: bytes, /) -> Path | None:
+        if self._directory is None:
+            return None
+        return self._directory / f"{key.hex()}.json"
+
+    def _store(self, key: bytes, payload: Any, cost: int, /) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous[1]
+
+            if cost > self._max_bytes:
+                return
+
+            self._entries[key] = (payload, cost)
+            self._current_bytes += cost
+
+            while self._current_bytes > self._max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted
+
+    def get(self, data: bytes, /, *, key: bytes | None = None) -> Any | None:
+        """
+        Look up the payload of an encrypted file, ``None`` if it isn't cached.
+
+        Parameters
+        -----------
+        data: :class:`bytes`
+            The encrypted file.
+        key: :class:`bytes` | ``None``
+            The :meth:`key` of ``data``, if it's already known, so it isn't hashed again.
+
+        Returns
+        --------
+        Any | ``None``
+            A shallow copy of the payload.
+        """
+        if key is None:
+            key = self.key(data)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return dict(entry[0])
+
+        path = self._disk_path(key)
+        if path is not None:
+            try:
+                payload = _from_json(path.read_bytes())
+            except (OSError, ValueError):
+                pass
+            else:
+                self._store(key, payload, len(data))
+                with self._lock:
+                    self._disk_hits += 1
+                return dict(payload)
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, data: bytes, payload: Any, /, *, key: bytes | None = None) -> None:
+        """
+        Cache the payload decoded from an encrypted file.
+
+        The payload must not be changed in place afterwards, hand out copies of it instead.
+
+        Parameters
+        -----------
+        data: :class:`bytes`
+            The encrypted file.
+        payload: Any
+            The payload decoded from it.
+        key: :class:`bytes` | ``None``
+            The :meth:`key` of ``data``, if it's already known, so it isn't hashed again.
+        """
+        if key is None:
+            key = self.key(data)
+        self._store(key, payload, len(data))
+
+        path = self._disk_path(key)
+        if path is not None and not path.exists():
+            _write_file(path, _to_json(payload, profile="compact"))
+
+    def load(self, data: bytes, decode: Callable[[bytes], Any], /) -> Any:
+        """
+        Look up the payload of an encrypted file, decoding and caching it if it isn't cached.
+
+        Parameters
+        -----------
+        data: :class:`bytes`
+            The encrypted file.
+        decode: Callable[[:class:`bytes`], Any]
+            Decodes the file into its payload on a miss.
+
+        Returns
+        --------
+        Any
+            A shallow copy of the payload.
+        """
+        key = self.key(data)
+        payload = self.get(data, key=key)
+        if payload is None:
+            payload = decode(data)
+            self.put(data, payload, key=key)
+            payload = dict(payload)
+        return payload
+
+    def info(self) -> PayloadCacheInfo:
+        """
+        Returns the hit, miss and size statistics of the cache.
+
+        Returns
+        --------
+        :class:`PayloadCacheInfo`
+        """
+        with self._lock:
+            return PayloadCacheInfo(
+                self._hits, self._disk_hits, self._misses, len(self._entries), self._current_bytes, self._max_bytes
+            )
+
+    def clear(self, *, disk: bool = False) -> None:
+        """
+        Empty the in-memory cache and reset the statistics.
+
+        Parameters
+        -----------
+        disk: :class:`bool`
+            Whether to also delete the payloads persisted to disk. Defaults to ``False``.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._hits = self._disk_hits = self._misses = 0
+
+        if disk and self._directory is not None:
+            for path in self._directory.glob("*.json"):
+                path.unlink(missing_ok=True)
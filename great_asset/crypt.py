@@ -23,24 +23,101 @@ DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
 
+import itertools
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterable, Iterator, NamedTuple
 
 from Crypto import Random
 from Crypto.Cipher import AES
+from Crypto.Hash import SHA1
 from Crypto.Protocol.KDF import PBKDF2
 from Crypto.Util.Padding import pad, unpad
 
-from .utils import _from_json  # type: ignore # allowing this private usage
+from .metrics import _start, _stop  # type: ignore # allowing this private usage
+from .utils import _from_json, _MemberScanner, _run_batch  # type: ignore # allowing this private usage
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
     from os import PathLike
+    from typing import Union
+
+    from .utils import BatchResult
+
+    BatchSource = Union[bytes, str, PathLike[str], Path]
 
 __all__ = (
+    "_read_and_decrypt",
     "encrypt",
     "decrypt",
+    "decrypt_into",
+    "iter_decrypt",
+    "decrypt_stream",
+    "peek",
+    "encrypt_many",
+    "decrypt_many",
+    "key_cache_info",
+    "clear_key_cache",
+    "KeyCacheInfo",
 )
 
+# The game (and therefore every file we touch) uses a single password, and the IV of a file only changes when it is
+# re-encrypted, so repeatedly opening the same saves derives the same keys over and over again.
+KEY_CACHE_SIZE = 4096
+# The default amount of ciphertext read and decrypted at a time when streaming.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# The default amount of ciphertext first decrypted by `peek`, smaller so it can stop sooner.
+DEFAULT_PEEK_CHUNK_SIZE = 1024
+# How much plaintext `peek` scans before a full parse would be quicker, as the rest is then most likely
+# the item arrays of a well stocked ship.
+_PEEK_SCAN_LIMIT = 16 * 1024
+
+
+class KeyCacheInfo(NamedTuple):
+    """
+    The statistics of the derived key cache.
+
+    Attributes
+    -----------
+    hits: :class:`int`
+        The keys that were already derived.
+    misses: :class:`int`
+        The keys that had to be derived.
+    maxsize: :class:`int` | ``None``
+        The most keys held before the least recently used are dropped.
+    currsize: :class:`int`
+        The keys currently held.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _derive_key(password: str, init_vector: bytes, /) -> bytes:
+    # Derive the key using PBKDF2 with SHA1 hash algorithm
+    return PBKDF2(password, init_vector, dkLen=16, count=100, hmac_hash_module=SHA1)
+
+
+def key_cache_info() -> KeyCacheInfo:
+    """
+    Returns the hit, miss and size statistics of the derived key cache.
+
+    Returns
+    --------
+    :class:`KeyCacheInfo`
+    """
+    return KeyCacheInfo(*_derive_key.cache_info())
+
+
+def clear_key_cache() -> None:
+    """
+    Clears the derived key cache and resets its statistics.
+    """
+    _derive_key.cache_clear()
+
 
 def encrypt(*, path: str | PathLike[str] | Path | None = None, data: bytes | None = None, password: str) -> bytes:
     if not path and not data:
@@ -50,8 +127,10 @@ def encrypt(*, path: str | PathLike[str] | Path | None = None, data: bytes | Non
         if not isinstance(path, Path):
             path = Path(path)
 
+        start = _start()
         with path.open("rb") as fp:
             data_to_encrypt = fp.read()
+        _stop("read", start, len(data_to_encrypt))
     else:
         data_to_encrypt = data
         assert data_to_encrypt  # guarded earlier
@@ -59,9 +138,12 @@ def encrypt(*, path: str | PathLike[str] | Path | None = None, data: bytes | Non
     # Generate a random IV (Initialization Vector)
     init_vector = Random.new().read(16)
 
-    # Derive the key using PBKDF2 with SHA1 hash algorithm
-    key = PBKDF2(password, init_vector, dkLen=16, count=100)
+    # Derive the key, this is cached so re-opening the file we just wrote is cheap
+    start = _start()
+    key = _derive_key(password, init_vector)
+    _stop("kdf", start)
 
+    start = _start()
     # Create AES cipher object
     cipher = AES.new(key, AES.MODE_CBC, init_vector)  # type: ignore # the upstream types aren't great
 
@@ -70,6 +152,7 @@ def encrypt(*, path: str | PathLike[str] | Path | None = None, data: bytes | Non
 
     # Encrypt the data
     encrypted_data = init_vector + cipher.encrypt(padded_data)
+    _stop("encrypt", start, len(encrypted_data))
 
     return encrypted_data
 
@@ -84,27 +167,356 @@ def decrypt(
         if not isinstance(path, Path):
             path = Path(path)
 
+        start = _start()
         with path.open("rb") as fp:
-            read_data = fp.read()
+            # read straight into a mutable buffer so we can decrypt it in place
+            buffer = bytearray(path.stat().st_size)
+            fp.readinto(buffer)
+        _stop("read", start, len(buffer))
     else:
-        read_data = data
-        assert read_data  # guarded earlier
+        assert data  # guarded earlier
+        buffer = bytearray(data)
+
+    return decrypt_into(buffer, password=password)
+
+
+def _unpad_view(view: memoryview, /) -> memoryview:
+    # PKCS7 unpadding, as `Crypto.Util.Padding.unpad` does, but returning a view rather than a copy
+    if not view or len(view) % AES.block_size:
+        raise ValueError("Input data is not padded.")
+
+    padding = view[-1]
+    # at most a block is copied to compare, the rest of the view is left alone
+    if not 1 <= padding <= AES.block_size or view[-padding:].tobytes() != bytes((padding,)) * padding:
+        raise ValueError("PKCS#7 padding is incorrect.")
+
+    return view[:-padding]
+
+
+def decrypt_into(buffer: bytearray | memoryview, /, *, password: str) -> Any:
+    """
+    Decrypts and parses an encrypted payload in place, without allocating any intermediate copies.
+
+    .. warning::
+        The contents of ``buffer`` are overwritten with the plaintext.
+
+    Parameters
+    -----------
+    buffer: :class:`bytearray` | :class:`memoryview`
+        A writable buffer containing the IV followed by the ciphertext.
+    password: :class:`str`
+        The password to derive the key from.
+
+    Returns
+    --------
+    Any
+        The parsed contents of the payload.
+    """
+    view = memoryview(buffer)
+    if view.readonly:
+        raise TypeError("The buffer to decrypt into must be writable, such as a bytearray.")
 
     # The initialisation vector is the first 16 bytes of the save file.
-    init_vector = read_data[:16]
-    # then we take the proceeding N bytes as the data
-    _to_decrypt = read_data[16:]
+    init_vector = bytes(view[:16])
+    # then we take the proceeding N bytes as the data, as a view so nothing is copied
+    _to_decrypt = view[16:]
 
     # create the decryption key from the provided data
-    decryption_key = PBKDF2(password, init_vector, dkLen=16, count=100)
+    start = _start()
+    decryption_key = _derive_key(password, init_vector)
+    _stop("kdf", start)
 
+    start = _start()
     # with the key we create the needed cipher
     cipher = AES.new(decryption_key, AES.MODE_CBC, init_vector)  # type: ignore # the upstream types aren't great
 
-    # and now we decrypt the data
-    decrypted_data = unpad(cipher.decrypt(_to_decrypt), AES.block_size, style="pkcs7")
+    # and now we decrypt the data over itself
+    cipher.decrypt(_to_decrypt, output=_to_decrypt)
+    _stop("aes", start, len(_to_decrypt))
+
+    start = _start()
+    plaintext = _unpad_view(_to_decrypt)
+    _stop("unpad", start, len(plaintext))
+
+    # it's always UTF-8, which the JSON backends can read from the buffer directly
+    return _from_json(plaintext)
+
+
+def _make_reader(source: BinaryIO | bytes | bytearray | memoryview, /) -> Callable[[int], bytes | memoryview]:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        offset = 0
+
+        def read(size: int, /) -> memoryview:
+            nonlocal offset
+            chunk = view[offset : offset + size]  # slicing a memoryview doesn't copy
+            offset += len(chunk)
+            return chunk
+
+        return read
+
+    def read_file(size: int, /) -> bytes:
+        data = source.read(size)
+        # unbuffered streams are allowed to return short reads, and we need whole blocks
+        while data and len(data) < size:
+            more = source.read(size - len(data))
+            if not more:
+                break
+            data += more
+        return data
+
+    return read_file
+
+
+def _block_multiple(size: int, /) -> int:
+    return max(size - size % AES.block_size, AES.block_size)
+
+
+def iter_decrypt(
+    source: BinaryIO | bytes | bytearray | memoryview, /, *, password: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Decrypts the given file object or buffer chunk by chunk, yielding the plaintext as it goes.
+
+    The PKCS7 padding is removed from the final chunk only, so at most one chunk of ciphertext is held at a time.
+
+    Parameters
+    -----------
+    source: :class:`typing.BinaryIO` | :class:`bytes` | :class:`bytearray` | :class:`memoryview`
+        A binary file object opened for reading, or a buffer, containing the IV followed by the ciphertext.
+    password: :class:`str`
+        The password to derive the key from.
+    chunk_size: :class:`int`
+        The amount of ciphertext to decrypt at a time. Rounded down to a multiple of the AES block size.
+
+    Yields
+    -------
+    :class:`bytes`
+        The decrypted plaintext, in order.
+    """
+    return _decrypt_chunks(source, password=password, sizes=itertools.repeat(chunk_size))
+
+
+def _growing_sizes(start: int, limit: int, /) -> Iterator[int]:
+    # doubles the chunk size up to the limit, so a short scan stays cheap and a long one isn't
+    # dominated by the overhead of each call into the cipher
+    size = start
+    while size < limit:
+        yield size
+        size *= 2
+
+    yield from itertools.repeat(limit)
+
+
+def _decrypt_chunks(
+    source: BinaryIO | bytes | bytearray | memoryview, /, *, password: str, sizes: Iterator[int]
+) -> Iterator[bytes]:
+    read = _make_reader(source)
+
+    # The initialisation vector is the first 16 bytes of the save file.
+    init_vector = bytes(read(16))
+    if len(init_vector) != 16:
+        raise ValueError("The data is too short to contain an initialisation vector.")
+
+    cipher = AES.new(_derive_key(password, init_vector), AES.MODE_CBC, init_vector)  # type: ignore # the upstream types aren't great
+
+    # we always hold one chunk back, so we know which one is last and carries the padding
+    current = read(_block_multiple(next(sizes)))
+    while True:
+        following = read(_block_multiple(next(sizes)))
+        if not following:
+            yield unpad(cipher.decrypt(current), AES.block_size, style="pkcs7")
+            return
+
+        yield cipher.decrypt(current)
+        current = following
+
+
+def decrypt_stream(
+    source: BinaryIO | bytes | bytearray | memoryview, /, *, password: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Any:
+    """
+    Decrypts and parses the given file object or buffer without holding the whole ciphertext in memory.
+
+    Parameters
+    -----------
+    source: :class:`typing.BinaryIO` | :class:`bytes` | :class:`bytearray` | :class:`memoryview`
+        A binary file object opened for reading, or a buffer, containing the IV followed by the ciphertext.
+    password: :class:`str`
+        The password to derive the key from.
+    chunk_size: :class:`int`
+        The amount of ciphertext to decrypt at a time.
+
+    Returns
+    --------
+    Any
+        The parsed contents of the file.
+    """
+    plaintext = bytearray()
+    for chunk in iter_decrypt(source, password=password, chunk_size=chunk_size):
+        plaintext += chunk
+
+    # both JSON backends accept the bytearray directly, no need to decode it first
+    return _from_json(plaintext)
+
+
+def peek(
+    source: BinaryIO | bytes | bytearray | memoryview,
+    /,
+    keys: Iterable[str],
+    *,
+    password: str,
+    chunk_size: int = DEFAULT_PEEK_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """
+    Decrypts the given file object or buffer only as far as needed to find the given top level keys,
+    and parses only their values.
+
+    This is cheaper than loading the whole file when only a few values are needed, such as the credits of every save.
+    Decryption stops once every key is found, and the values of other keys are skipped over without being parsed
+    or buffered. The game doesn't write the keys in any particular order though, so a wanted key may come after
+    the large item arrays. Once that much has been scanned, a buffer or seekable file is parsed in full instead,
+    which is quicker; anything else carries on being scanned.
+
+    Parameters
+    -----------
+    source: :class:`typing.BinaryIO` | :class:`bytes` | :class:`bytearray` | :class:`memoryview`
+        A binary file object opened for reading, or a buffer, containing the IV followed by the ciphertext.
+    keys: Iterable[:class:`str`]
+        The top level keys to look for, such as ``"GroupCredits"``.
+    password: :class:`str`
+        The password to derive the key from.
+    chunk_size: :class:`int`
+        The amount of ciphertext to decrypt first. Each following chunk is twice the size of the last,
+        up to :data:`DEFAULT_CHUNK_SIZE`.
+
+    Returns
+    --------
+    dict[:class:`str`, Any]
+        The parsed value of each key found. Keys that aren't within the file are left out.
+    """
+    wanted = set(keys)
+    found: dict[str, Any] = {}
+    if not wanted:
+        return found
+
+    # where to read the source again from for a full parse, if it can be
+    origin: int | None = 0
+    if not isinstance(source, (bytes, bytearray, memoryview)):
+        origin = source.tell() if source.seekable() else None
+
+    scanner = _MemberScanner(wanted)
+    scanned = 0
+    sizes = _growing_sizes(chunk_size, max(chunk_size, DEFAULT_CHUNK_SIZE))
+    for chunk in _decrypt_chunks(source, password=password, sizes=sizes):
+        scanned += len(chunk)
+        if scanned > _PEEK_SCAN_LIMIT and origin is not None:
+            # the wanted keys are most likely behind the item arrays, which a full parse gets through far quicker
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                contents = decrypt_into(bytearray(source), password=password)
+            else:
+                source.seek(origin)
+                contents = decrypt_stream(source, password=password)
+            found.update((key, contents[key]) for key in wanted if key in contents)
+            break
+
+        for key, value in scanner.feed(chunk):
+            if value is not None and key in wanted:
+                found[key] = _from_json(value)
+                wanted.discard(key)
+                if not wanted:
+                    return found
+
+        if scanner.done:
+            break
+
+    return found
+
+
+def _encrypt_one(source: BatchSource, /, *, password: str) -> bytes:
+    if isinstance(source, bytes):
+        return encrypt(data=source, password=password)
+    return encrypt(path=source, password=password)
+
+
+def _decrypt_one(source: BatchSource, /, *, password: str) -> Any:
+    if isinstance(source, bytes):
+        return decrypt(data=source, password=password)
+    return decrypt(path=source, password=password)
+
+
+def _read_and_decrypt(path: str | PathLike[str] | Path, /, *, password: str) -> tuple[bytes, Any]:
+    start = _start()
+    data = Path(path).read_bytes()
+    _stop("read", start, len(data))
+    return data, decrypt(data=data, password=password)
+
+
+def encrypt_many(
+    sources: Iterable[BatchSource],
+    /,
+    *,
+    password: str,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    """
+    Encrypts many payloads or files, spread over a process pool.
+
+    Parameters
+    -----------
+    sources: Iterable[:class:`bytes` | :class:`~pathlib.Path` | :class:`str`]
+        The raw payloads, or paths to the files, to encrypt.
+    password: :class:`str`
+        The password to derive the keys from.
+    max_workers: :class:`int` | ``None``
+        The amount of worker processes to use when no ``executor`` is given.
+    executor: :class:`~concurrent.futures.Executor` | ``None``
+        An executor to run the work on. It is not shut down afterwards.
+    ordered: :class:`bool`
+        Whether to yield results in input order, or as they finish. Defaults to ``True``.
+
+    Returns
+    --------
+    Iterator[:class:`~great_asset.utils.BatchResult`]
+        One result per source, errors are reported on the result rather than raised.
+    """
+    return _run_batch(
+        partial(_encrypt_one, password=password), sources, max_workers=max_workers, executor=executor, ordered=ordered
+    )
+
+
+def decrypt_many(
+    sources: Iterable[BatchSource],
+    /,
+    *,
+    password: str,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    """
+    Decrypts and parses many payloads or files, spread over a process pool.
 
-    # and it's always UTF-8
-    resolved_data = decrypted_data.decode("utf-8")
+    Parameters
+    -----------
+    sources: Iterable[:class:`bytes` | :class:`~pathlib.Path` | :class:`str`]
+        The encrypted payloads, or paths to the files, to decrypt.
+    password: :class:`str`
+        The password to derive the keys from.
+    max_workers: :class:`int` | ``None``
+        The amount of worker processes to use when no ``executor`` is given.
+    executor: :class:`~concurrent.futures.Executor` | ``None``
+        An executor to run the work on. It is not shut down afterwards.
+    ordered: :class:`bool`
+        Whether to yield results in input order, or as they finish. Defaults to ``True``.
 
-    return _from_json(resolved_data)
+    Returns
+    --------
+    Iterator[:class:`~great_asset.utils.BatchResult`]
+        One result per source, errors are reported on the result rather than raised.
+    """
+    return _run_batch(
+        partial(_decrypt_one, password=password), sources, max_workers=max_workers, executor=executor, ordered=ordered
+    )
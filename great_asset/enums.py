@@ -24,6 +24,14 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 from enum import Enum
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from .utils import _iter_bits  # type: ignore[reportPrivateUsage]
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from typing_extensions import Self
 
 __all__ = (
     "ShipUnlock",
@@ -35,7 +43,95 @@ __all__ = (
 )
 
 
-class ShipUnlock(Enum):
+class _Lookup:
+    # filled in for each enum once it has been created, see `_build_lookups` below
+    _by_id: ClassVar[Sequence[Any]]
+    _by_name: ClassVar[Mapping[str, Any]]
+    _mask: ClassVar[int]
+    _bit: int
+
+    @property
+    def bit(self) -> int:
+        """The bit for this member within a bitmask, i.e. ``1 << id``."""
+        return self._bit
+
+    @classmethod
+    def from_id(cls, value: int, /) -> Self | None:
+        """
+        Look up a member by its id within the save file, returning ``None`` for unknown ids rather than raising.
+
+        Parameters
+        -----------
+        value: :class:`int`
+            The id to look up.
+        """
+        if 0 <= value < len(cls._by_id):
+            return cls._by_id[value]
+        return None
+
+    @classmethod
+    def from_ids(cls, values: Iterable[int], /) -> list[Self]:
+        """
+        Look up many members by their ids within the save file at once, skipping any unknown ids.
+
+        Parameters
+        -----------
+        values: Iterable[:class:`int`]
+            The ids to look up.
+        """
+        table = cls._by_id
+        size = len(table)
+        return [member for value in values if 0 <= value < size and (member := table[value]) is not None]
+
+    @classmethod
+    def to_mask(cls, members: Iterable[Self] | None = None, /) -> int:
+        """
+        Build a bitmask from members, where bit ``n`` is set for the member with id ``n``.
+        Without any members, the mask of every known member is returned.
+
+        Parameters
+        -----------
+        members: Iterable[Self] | ``None``
+            The members to include.
+
+        Returns
+        --------
+        :class:`int`
+        """
+        if members is None:
+            return cls._mask
+
+        mask = 0
+        for member in members:
+            mask |= member._bit
+        return mask
+
+    @classmethod
+    def from_mask(cls, mask: int, /) -> list[Self]:
+        """
+        Look up the members whose bits are set within a bitmask, in id order, skipping any unknown bits.
+
+        Parameters
+        -----------
+        mask: :class:`int`
+            The bitmask to read.
+        """
+        return cls.from_ids(_iter_bits(mask))
+
+    @classmethod
+    def from_name(cls, name: str, /) -> Self | None:
+        """
+        Look up a member (or alias) by its name, returning ``None`` for unknown names rather than raising.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name to look up.
+        """
+        return cls._by_name.get(name)
+
+
+class ShipUnlock(_Lookup, Enum):
     cozy_lights = 4, "Cozy lights"
     teleporter = 5, "Teleporter"
     television = 6, "Television"
@@ -64,6 +160,12 @@ class ShipUnlock(Enum):
         self._serialised_value: int = value
         self._serialised_name: str = serialised_name
 
+        # the keys within the save file for this unlock, built once rather than each time they're needed
+        self._stored_key: str = f"ShipUnlockStored_{serialised_name}"
+        self._moved_key: str = f"ShipUnlockMoved_{serialised_name}"
+        self._position_key: str = f"ShipUnlockPos_{serialised_name}"
+        self._rotation_key: str = f"ShipUnlockRot_{serialised_name}"
+
     @property
     def serialised_value(self) -> int:
         return self._serialised_value
@@ -72,12 +174,40 @@ class ShipUnlock(Enum):
     def serialised_name(self) -> str:
         return self._serialised_name
 
+    @property
+    def stored_key(self) -> str:
+        return self._stored_key
+
+    @property
+    def moved_key(self) -> str:
+        return self._moved_key
+
+    @property
+    def position_key(self) -> str:
+        return self._position_key
+
+    @property
+    def rotation_key(self) -> str:
+        return self._rotation_key
+
+    @classmethod
+    def from_serialised_name(cls, name: str, /) -> ShipUnlock | None:
+        """
+        Look up an unlock by the name used for it within the save file, such as ``"Teleporter"``.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The serialised name to look up.
+        """
+        return _SHIP_UNLOCK_BY_SERIALISED_NAME.get(name)
+
     @staticmethod
     def all() -> list[ShipUnlock]:
         return list(ShipUnlock)
 
 
-class ExtraUnlock(Enum):
+class ExtraUnlock(_Lookup, Enum):
     orange_suit = 0
     green_suit = 1
     hazard_suit = 2
@@ -89,7 +219,7 @@ class ExtraUnlock(Enum):
         return list(ExtraUnlock)
 
 
-class BestiaryEntry(Enum):
+class BestiaryEntry(_Lookup, Enum):
     snare_flea = 0
     bracken = 1
     thumper = 2
@@ -122,7 +252,7 @@ class BestiaryEntry(Enum):
         return list(BestiaryEntry)
 
 
-class Item(Enum):
+class Item(_Lookup, Enum):
     binoculars = 0  # not yet implemented
     boom_box = 1
     cardboard_box = 2
@@ -140,7 +270,7 @@ class Item(Enum):
     stun_gun = 15
 
 
-class Scrap(Enum):
+class Scrap(_Lookup, Enum):
     apparatus = 7
     magic_7_ball = 16
     airhorn = 17
@@ -196,7 +326,7 @@ class Scrap(Enum):
     whoopie_cushion = 67
 
 
-class Moon(Enum):
+class Moon(_Lookup, Enum):
     experimentation = 0
     assurance = 1
     vow = 2
@@ -206,3 +336,26 @@ class Moon(Enum):
     dine = 6
     offense = 7
     titan = 8
+
+
+def _build_lookups(enum: type[Enum], ids: Mapping[int, Any], /) -> None:
+    # a dense table indexed by id is quicker than the value lookup the Enum metaclass does, and never raises
+    table: list[Enum | None] = [None] * (max(ids) + 1)
+    mask = 0
+    for value, member in ids.items():
+        table[value] = member
+        member._bit = 1 << value  # type: ignore # set on the member once the enum exists
+        mask |= 1 << value
+
+    enum._by_id = tuple(table)  # type: ignore # set on the class once it exists
+    enum._by_name = dict(enum.__members__)  # type: ignore # set on the class once it exists
+    enum._mask = mask  # type: ignore # set on the class once it exists
+
+
+_build_lookups(ShipUnlock, {member.serialised_value: member for member in ShipUnlock})
+for _enum in (ExtraUnlock, BestiaryEntry, Item, Scrap, Moon):
+    _build_lookups(_enum, {member.value: member for member in _enum})
+
+_SHIP_UNLOCK_BY_SERIALISED_NAME: dict[str, ShipUnlock] = {member.serialised_name: member for member in ShipUnlock}
+
+del _enum
@@ -23,15 +23,104 @@ DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
 
+from array import array
 from typing import TYPE_CHECKING, NamedTuple
 
+from .enums import Scrap
+from .vector import VectorArray
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from .types_.shared import InnerVectorValue
+    from .vector import Vector
+
+__all__ = (
+    "GrabbableScrap",
+    "ShipItems",
+)
 
-__all__ = ("GrabbableScrap",)
+SCRAP_IDS = frozenset(scrap.value for scrap in Scrap)
 
 
 class GrabbableScrap(NamedTuple):
     id: int
     value: int
     pos: InnerVectorValue
+
+
+class ShipItems:
+    """
+    Columnar storage of the grabbable items within the ship.
+
+    The ids and scrap values are held in :class:`array.array` of C ints, and the positions
+    in a :class:`~great_asset.VectorArray`, rather than as a Python object per item.
+
+    Like the game, the scrap values are handed out in order to each item that is scrap,
+    any item that isn't (such as tools) has no value.
+
+    Attributes
+    -----------
+    ids: :class:`array.array`
+        The item id of every item.
+    values: :class:`array.array`
+        The value of every piece of scrap, in the order the scrap appears in :attr:`ids`.
+    positions: :class:`~great_asset.VectorArray`
+        The position of every item, aligned with :attr:`ids`.
+    """
+
+    __slots__ = (
+        "ids",
+        "positions",
+        "values",
+    )
+
+    def __init__(self, ids: Iterable[int] = (), values: Iterable[int] = (), positions: VectorArray | None = None) -> None:
+        self.ids: array[int] = array("i", ids)
+        self.values: array[int] = array("i", values)
+        self.positions: VectorArray = positions if positions is not None else VectorArray()
+
+    def __repr__(self) -> str:
+        return f"<ShipItems items={len(self.ids)} scrap={len(self.values)}>"
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_payload(cls, ids: Iterable[int], values: Iterable[int], positions: Iterable[InnerVectorValue]) -> ShipItems:
+        return cls(ids, values, VectorArray.from_dicts(positions))
+
+    def append(self, item_id: int, position: Vector, value: int | None = None) -> None:
+        self.ids.append(item_id)
+        self.positions.append(position)
+        if value is not None:
+            self.values.append(value)
+
+    def extend(self, item_id: int, positions: VectorArray, values: Iterable[int] | None = None) -> None:
+        self.ids.extend(array("i", (item_id,)) * len(positions))
+        self.positions.extend(positions)
+        if values is not None:
+            self.values.extend(values)
+
+    def scrap(self) -> Iterator[GrabbableScrap]:
+        values = iter(self.values)
+        positions = self.positions
+
+        for idx, item_id in enumerate(self.ids):
+            if item_id not in SCRAP_IDS:
+                continue
+
+            value = next(values, None)
+            if value is None:
+                return  # the game treats any scrap past the last value as worthless, and so do we
+
+            yield GrabbableScrap(item_id, value, positions[idx].serialise())
+
+    def serialise_ids(self) -> list[int]:
+        return self.ids.tolist()
+
+    def serialise_values(self) -> list[int]:
+        return self.values.tolist()
+
+    def serialise_positions(self) -> list[InnerVectorValue]:
+        return self.positions.to_dicts()
@@ -0,0 +1,280 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Callable, Literal, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+__all__ = (
+    "Metrics",
+    "Recorder",
+    "Stage",
+    "StageStats",
+    "StageTiming",
+    "Trace",
+    "_start",
+    "_stop",
+    "get_recorder",
+    "recording",
+    "set_recorder",
+)
+
+# "read": reading a file from disk, "kdf": deriving the key, "aes": decrypting, "unpad": removing the padding,
+# "parse": decoding and parsing the JSON, "validate": checking the payload is the expected kind of file,
+# "upsert": applying pending changes to the payload, "serialise": dumping the JSON, "encrypt": padding and encrypting,
+# "write": writing a file to disk
+Stage = Literal["read", "kdf", "aes", "unpad", "parse", "validate", "upsert", "serialise", "encrypt", "write"]
+# called with the stage, its duration in nanoseconds and the amount of bytes it handled (0 where that doesn't apply)
+Recorder = Callable[[Stage, int, int], Any]
+RecorderT = TypeVar("RecorderT", bound=Recorder)
+
+_recorder: Recorder | None = None
+
+
+def get_recorder() -> Recorder | None:
+    """
+    Get the recorder currently receiving the timings, ``None`` if instrumentation is disabled.
+
+    Returns
+    --------
+    Callable[[:class:`str`, :class:`int`, :class:`int`], Any] | ``None``
+    """
+    return _recorder
+
+
+def set_recorder(recorder: Recorder | None, /) -> None:
+    """
+    Set the recorder every stage of loading and writing files reports its timing to.
+
+    This is disabled by default, and costs a single global lookup per stage whilst disabled.
+    Only the work done within this process is recorded, not that done by process pools.
+
+    Parameters
+    -----------
+    recorder: Callable[[:class:`str`, :class:`int`, :class:`int`], Any] | ``None``
+        Called with the stage, its duration in nanoseconds and the amount of bytes it handled,
+        such as a :class:`Metrics` or a :class:`Trace`. ``None`` disables instrumentation.
+    """
+    global _recorder
+    _recorder = recorder
+
+
+@contextmanager
+def recording(recorder: RecorderT, /) -> Generator[RecorderT, None, None]:
+    """
+    A context manager that sets the recorder for the duration of the block, restoring the previous one afterwards.
+
+    Parameters
+    -----------
+    recorder: Callable[[:class:`str`, :class:`int`, :class:`int`], Any]
+        The recorder to use.
+    """
+    previous = _recorder
+    set_recorder(recorder)
+    try:
+        yield recorder
+    finally:
+        set_recorder(previous)
+
+
+def _start() -> int:
+    return perf_counter_ns() if _recorder is not None else 0
+
+
+def _stop(stage: Stage, start: int, nbytes: int = 0, /) -> None:
+    recorder = _recorder
+    # a zero start means instrumentation was off when the stage began
+    if recorder is not None and start:
+        recorder(stage, perf_counter_ns() - start, nbytes)
+
+
+class StageTiming(NamedTuple):
+    """
+    A single recorded stage.
+
+    Attributes
+    -----------
+    stage: :class:`str`
+        The name of the stage.
+    duration: :class:`int`
+        How long the stage took, in nanoseconds.
+    nbytes: :class:`int`
+        The amount of bytes the stage handled.
+    """
+
+    stage: Stage
+    duration: int
+    nbytes: int
+
+
+class StageStats(NamedTuple):
+    """
+    The aggregated timings of a stage.
+
+    Attributes
+    -----------
+    runs: :class:`int`
+        The times the stage was recorded.
+    total: :class:`int`
+        The total time spent in the stage, in nanoseconds.
+    minimum: :class:`int`
+        The quickest run of the stage, in nanoseconds.
+    maximum: :class:`int`
+        The slowest run of the stage, in nanoseconds.
+    nbytes: :class:`int`
+        The total amount of bytes the stage handled.
+    histogram: dict[:class:`int`, :class:`int`]
+        The amount of runs by power of two bucket, where bucket ``n`` holds durations below ``2 ** n`` nanoseconds.
+    """
+
+    runs: int
+    total: int
+    minimum: int
+    maximum: int
+    nbytes: int
+    histogram: dict[int, int]
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.runs if self.runs else 0.0
+
+
+class Trace:
+    """
+    A recorder that keeps every stage in the order it happened, for looking at a single operation.
+
+    .. code-block:: python3
+
+        with recording(Trace()) as trace:
+            SaveFile.from_path(path)
+
+        for timing in trace.timings:
+            print(timing.stage, timing.duration)
+    """
+
+    __slots__ = ("timings",)
+
+    def __init__(self) -> None:
+        self.timings: list[StageTiming] = []
+
+    def __call__(self, stage: Stage, duration: int, nbytes: int, /) -> None:
+        self.timings.append(StageTiming(stage, duration, nbytes))
+
+    def total(self, stage: Stage | None = None, /) -> int:
+        """
+        The total time spent, in nanoseconds, in a stage or in every stage.
+
+        Parameters
+        -----------
+        stage: :class:`str` | ``None``
+            The stage to total, ``None`` for every stage.
+        """
+        return sum(timing.duration for timing in self.timings if stage is None or timing.stage == stage)
+
+
+class Metrics:
+    """
+    A recorder that aggregates the timings of each stage into histograms, for looking across a batch of operations.
+    It is safe to share between threads.
+    """
+
+    __slots__ = ("_lock", "_stats")
+
+    def __init__(self) -> None:
+        # stage -> [runs, total, minimum, maximum, nbytes, histogram]
+        self._stats: dict[str, list[Any]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def __call__(self, stage: Stage, duration: int, nbytes: int, /) -> None:
+        bucket = duration.bit_length()
+
+        with self._lock:
+            stats = self._stats.get(stage)
+            if stats is None:
+                self._stats[stage] = [1, duration, duration, duration, nbytes, {bucket: 1}]
+                return
+
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = min(stats[2], duration)
+            stats[3] = max(stats[3], duration)
+            stats[4] += nbytes
+            histogram: dict[int, int] = stats[5]
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+
+    def __repr__(self) -> str:
+        return f"<Metrics stages={sorted(self._stats)}>"
+
+    def stages(self) -> dict[Stage, StageStats]:
+        """
+        Get a snapshot of the aggregated timings of every stage recorded so far.
+
+        Returns
+        --------
+        dict[:class:`str`, :class:`StageStats`]
+        """
+        with self._lock:
+            return {
+                stage: StageStats(runs, total, minimum, maximum, nbytes, dict(histogram))  # type: ignore # keys are stages
+                for stage, (runs, total, minimum, maximum, nbytes, histogram) in self._stats.items()
+            }
+
+    def percentile(self, stage: Stage, percent: float, /) -> int:
+        """
+        Estimate a percentile of the durations of a stage from its histogram, as the upper bound of its bucket.
+
+        Parameters
+        -----------
+        stage: :class:`str`
+            The stage to look at.
+        percent: :class:`float`
+            The percentile, from 0 to 100.
+
+        Returns
+        --------
+        :class:`int`
+            The duration in nanoseconds, 0 if the stage hasn't been recorded.
+        """
+        stats = self.stages().get(stage)
+        if stats is None:
+            return 0
+
+        wanted = stats.runs * percent / 100
+        seen = 0
+        for bucket in sorted(stats.histogram):
+            seen += stats.histogram[bucket]
+            if seen >= wanted:
+                return min(1 << bucket, stats.maximum)
+        return stats.maximum
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._stats.clear()
@@ -24,23 +24,46 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import logging
 import random
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generic, TypeVar, Union
 
 from . import CRYPTO_PASSWORD
-from .crypt import decrypt, encrypt
+from .crypt import _decrypt_one, _read_and_decrypt, decrypt, encrypt  # type: ignore[reportPrivateUsage] we allow this here.
 from .enums import BestiaryEntry, ExtraUnlock, Item, Moon, Scrap, ShipUnlock
-from .item import GrabbableScrap
-from .utils import MISSING, SaveValue, _to_json, resolve_save_path  # type: ignore[reportPrivateUsage] we allow this here.
-from .vector import Vector
+from .item import SCRAP_IDS, ShipItems
+from .metrics import _start, _stop  # type: ignore[reportPrivateUsage] we allow this here.
+from .schema import CHALLENGE_FILE_SCHEMA, CONFIG_FILE_SCHEMA, SAVE_FILE_SCHEMA
+from .utils import (  # type: ignore[reportPrivateUsage] we allow this here.
+    MISSING,
+    BatchResult,
+    DumpProfile,
+    Durability,
+    SaveValue,
+    _iter_bits,
+    _run_batch,
+    _to_json,
+    _to_mask,
+    _write_file,
+    resolve_save_path,
+)
+from .vector import Vector, VectorArray
 
 if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Iterable, Iterator, Mapping
+    from concurrent.futures import Executor
     from os import PathLike
     from types import TracebackType
 
     from typing_extensions import Self
 
+    from .cache import PayloadCache
+    from .schema import Schema, ValidationMode
     from .types_.challenge_file import ChallengeFile as ChallengeFileType
     from .types_.config_file import ConfigFile as ConfigFileType
     from .types_.save_file import (
@@ -49,8 +72,56 @@ if TYPE_CHECKING:
     from .types_.shared import *
 
 SaveT = TypeVar("SaveT", "SaveFileType", "ConfigFileType", "ChallengeFileType")
+T = TypeVar("T")
+DebugSink = Union[str, "PathLike[str]", Path, Callable[[bytes], Any]]
 
+# where the decrypted payload used to be dumped unconditionally, pass this to `set_debug_sink` for the old behaviour
 TEMP_FILE = Path("./_previously_decrypted_file.json")
+# the keys holding the items on the ship, these are always (re)written together
+_SHIP_ITEM_KEYS = ("shipScrapValues", "shipGrabbableItemIDs", "shipGrabbableItemPos")
+_INT_ARRAY_TYPE = "System.Int32[],mscorlib"
+_VECTOR_ARRAY_TYPE = "UnityEngine.Vector3[],UnityEngine.CoreModule"
+# the fields `SaveFile.apply` accepts by name, named after the properties reading them, and their key within the file
+_SAVE_FIELDS = {
+    "credits": "GroupCredits",
+    "current_moon": "CurrentPlanetID",
+    "steps_taken": "Stats_StepsTaken",
+    "deaths": "Stats_Deaths",
+    "elapsed_days": "Stats_DaysSpent",
+    "deadline": "DeadlineTime",
+    "profit_quota": "ProfitQuota",
+    "quotas_passed": "QuotasPassed",
+    "current_quota_progress": "QuotaFulfilled",
+    "current_seed": "RandomSeed",
+}
+
+# the settings `ConfigFile` keeps as plain attributes, by their key within the file
+_CONFIG_SETTINGS = {
+    "SpiderSafeMode": "arachnophobia_mode",
+    "InvertYAxis": "y_axis_inverted",
+    "ScreenMode": "screen_mode",
+    "FPSCap": "fps_mode",
+    "CurrentMic": "current_mic",
+    "PushToTalk": "push_to_talk",
+    "MicEnabled": "mic_enabled",
+    "LookSens": "mouse_sensitivity",
+    "MasterVolume": "master_volume",
+    "Gamma": "gamma",
+    "PlayerFinishedSetup": "finished_setup",
+    "StartInOnlineMode": "start_online",
+}
+
+# and those it keeps as whole entries, as they may be missing from the file
+_CONFIG_ENTRIES = {
+    "PlayerXPNum": "_player_xp",
+    "PlayerLevel": "_player_level",
+    "TimesLanded": "_times_landed",
+    "HostSettings_Public": "_is_host_public",
+    "HostSettings_Name": "_host_name",
+    "PlayedDungeonEntrance0": "_played_entrance_0",
+    "PlayedDungeonEntrance1": "_played_entrance_1",
+}
+
 TIPS = [
     "LC_MoveObjectsTip",
     "LC_StorageTip",
@@ -66,15 +137,187 @@ __all__ = (
     "SaveFile",
     "ConfigFile",
     "ChallengeFile",
+    "set_debug_sink",
+    "set_async_executor",
+    "set_payload_cache",
+    "set_validation_mode",
 )
 
+_log = logging.getLogger(__name__)
+
+_debug_sink: DebugSink | None = None
+_debug_executor: ThreadPoolExecutor | None = None
+
+_payload_cache: PayloadCache | None = None
+_validation_mode: ValidationMode = "required"
+
+_async_executor: Executor | None = None
+_async_limit: int = 8
+# asyncio primitives belong to a single event loop, so each loop gets its own semaphore
+_async_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+
+
+def set_debug_sink(sink: DebugSink | None, /) -> None:
+    """
+    Set the global sink that receives the decrypted JSON payload of every file written.
+
+    This is disabled by default, and individual files can override it with their
+    :attr:`~great_asset.SaveFile.debug_sink`.
+
+    Parameters
+    -----------
+    sink: :class:`~pathlib.Path` | :class:`str` | Callable[[:class:`bytes`], Any] | ``None``
+        A path to write the payload to, or a callable to pass it to. ``None`` disables the sink.
+        The sink is written to in a background thread so it does not hold up the actual write.
+    """
+    global _debug_sink
+    _debug_sink = sink
+
+
+def set_payload_cache(cache: PayloadCache | None, /) -> None:
+    """
+    Set the cache every file loaded looks its decrypted payload up in, so identical files are only decrypted once.
+
+    This is disabled by default.
+
+    Parameters
+    -----------
+    cache: :class:`~great_asset.cache.PayloadCache` | ``None``
+        The cache to use. ``None`` disables caching.
+    """
+    global _payload_cache
+    _payload_cache = cache
+
+
+def set_validation_mode(mode: ValidationMode, /) -> None:
+    """
+    Set how thoroughly the contents of every file loaded are validated.
+
+    Parameters
+    -----------
+    mode: Literal[``"off"``, ``"required"``, ``"full"``]
+        ``"off"`` skips validation, ``"required"`` (the default) checks the keys required by the file's type are
+        present and ``"full"`` also checks the ``__type`` tag and type of the value of every known key,
+        which is worth it for files from untrusted sources.
+    """
+    if mode not in ("off", "required", "full"):
+        raise ValueError(f"Unknown validation mode: {mode!r}")
+
+    global _validation_mode
+    _validation_mode = mode
+
+
+def _decrypt_payload(data: bytes, /) -> Any:
+    return decrypt(data=data, password=CRYPTO_PASSWORD)
+
+
+def _deadline_value(deadline: int | float, /) -> int:
+    # an int is a number of days, a float the raw minutes, which the file only stores whole
+    return round(deadline) if isinstance(deadline, float) else deadline * 1080
+
+
+def set_async_executor(executor: Executor | None, /, *, limit: int | None = None) -> None:
+    """
+    Set the executor the asynchronous methods, such as :meth:`~great_asset.SaveFile.async_from_path`,
+    run their blocking file I/O, decryption and encryption on.
+
+    Parameters
+    -----------
+    executor: :class:`~concurrent.futures.Executor` | ``None``
+        The executor to use. ``None`` uses the event loop's default executor.
+        A :class:`~concurrent.futures.ProcessPoolExecutor` also works, at the cost of copying the payloads between processes.
+    limit: :class:`int` | ``None``
+        The most blocking operations allowed to run at once per event loop. Defaults to leaving it unchanged (8 initially).
+    """
+    global _async_executor, _async_limit
+    _async_executor = executor
+
+    if limit is not None:
+        if limit < 1:
+            raise ValueError("The concurrency limit must be at least 1.")
+        _async_limit = limit
+        _async_semaphores.clear()
+
+
+async def _run_limited(executor: Executor | None, call: Callable[[], T], /) -> T:
+    # imported here as asyncio is slow to import, and only needed by those already using it
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+
+    semaphore = _async_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _async_semaphores[loop] = asyncio.Semaphore(_async_limit)
+
+    async with semaphore:
+        return await loop.run_in_executor(executor, call)
+
+
+async def _run_blocking(executor: Executor | None, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    return await _run_limited(executor or _async_executor, partial(func, *args, **kwargs))
+
+
+async def _run_in_thread(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    # for work on objects that only exist within this process, such as the payload cache, which can't be sent
+    # to a process pool. the loop's default executor is always a thread pool
+    return await _run_limited(None, partial(func, *args, **kwargs))
+
+
+def _encode_payload(payload: Any, /, *, profile: DumpProfile = "pretty") -> tuple[bytes, bytes]:
+    # returns the encoded JSON as well as the encrypted file, for the debug sink
+    encoded = _to_json(payload, profile=profile)
+    return encoded, encrypt(data=encoded, password=CRYPTO_PASSWORD)
+
+
+def _apply_to_path(
+    cls: type[SaveFile],
+    path: Path | PathLike[Any] | str,
+    /,
+    *,
+    changes: dict[str, Any],
+    profile: DumpProfile,
+    durability: Durability,
+) -> frozenset[str]:
+    # runs within the worker processes of `SaveFile.apply_to_many`, so it has to be importable from here
+    file = cls.from_path(path)
+    file.apply(**changes)
+
+    changed = file.modified_keys
+    if changed:
+        file.write(path=Path(path), profile=profile, atomic=True, durability=durability)
+    return changed
+
+
+def _write_debug_payload(sink: DebugSink, payload: bytes, /) -> None:
+    try:
+        if callable(sink):
+            sink(payload)
+        else:
+            Path(sink).write_bytes(payload)
+    except Exception:
+        _log.exception("Writing to the debug sink %r failed.", sink)
+
+
+def _emit_debug_payload(sink: DebugSink, payload: bytes, /) -> None:
+    global _debug_executor
+    # one worker keeps the payloads in the order they were written
+    if _debug_executor is None:
+        _debug_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="great_asset-debug-sink")
+
+    _debug_executor.submit(_write_debug_payload, sink, payload)
+
 
 class _BaseSaveFile(Generic[SaveT]):
+    # what the decrypted contents are validated against, set by each kind of file
+    _schema: ClassVar[Schema]
+
     _inner_data: SaveT
     _file_type: str
     _extra_data: dict[str, Any]
     _written: bool
     _skip_parsing: bool
+    _debug_sink: DebugSink | None
+    _dirty: set[str]
 
     __slots__ = (
         "_inner_data",
@@ -83,14 +326,30 @@ class _BaseSaveFile(Generic[SaveT]):
         "_written",
         "_skip_parsing",
         "_raw_data",
+        "_debug_sink",
+        "_dirty",
     )
 
     def __init__(self, data: bytes, /) -> None:
+        self._prepare(data)
+        self._parse_file()
+
+    def _prepare(self, data: bytes, /) -> None:
         self._skip_parsing = False
         self._written = False
+        self._debug_sink = MISSING
+        # the keys changed since the file was loaded or last written
+        self._dirty = set()
 
         self._raw_data: bytes = data
-        self._parse_file()
+
+    @classmethod
+    def _from_decrypted(cls, data: bytes, decrypted: SaveT, /) -> Self:
+        # used when the decryption has already happened elsewhere, e.g. in a worker process
+        self = cls.__new__(cls)
+        self._prepare(data)
+        self._parse_file(decrypted)
+        return self
 
     def __enter__(self) -> Self:
         return self
@@ -101,6 +360,47 @@ class _BaseSaveFile(Generic[SaveT]):
         if not self._written and not exc_type:
             self.write()
 
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        if not self._written and not exc_type:
+            await self.async_write()
+
+    @property
+    def debug_sink(self) -> DebugSink | None:
+        """
+        The sink that receives the decrypted JSON payload whenever this file is written.
+
+        Defaults to the global sink set with :func:`~great_asset.save_file.set_debug_sink`, which is disabled by default.
+        Setting this to ``None`` disables it for this file only.
+
+        Returns
+        --------
+        :class:`~pathlib.Path` | :class:`str` | Callable[[:class:`bytes`], Any] | ``None``
+        """
+        return _debug_sink if self._debug_sink is MISSING else self._debug_sink
+
+    @debug_sink.setter
+    def debug_sink(self, sink: DebugSink | None) -> None:
+        self._debug_sink = sink
+
+    @property
+    def modified_keys(self) -> frozenset[str]:
+        """
+        The keys within the file that have been changed since it was loaded or last written.
+
+        Returns
+        --------
+        frozenset[:class:`str`]
+        """
+        return frozenset(self._dirty)
+
+    def _mark_dirty(self, *keys: str) -> None:
+        self._dirty.update(keys)
+
     @classmethod
     def from_path(cls, path: Path | PathLike[Any] | str) -> Self:
         if not isinstance(path, Path):
@@ -109,65 +409,367 @@ class _BaseSaveFile(Generic[SaveT]):
         if not path.exists():
             raise FileNotFoundError("The passed file is not found.")
 
-        return cls(path.read_bytes())
+        start = _start()
+        data = path.read_bytes()
+        _stop("read", start, len(data))
 
-    def _parse_file(self) -> None:
-        if self._skip_parsing:
+        return cls(data)
+
+    @classmethod
+    async def async_from_path(cls, path: Path | PathLike[Any] | str, /, *, executor: Executor | None = None) -> Self:
+        """
+        The asynchronous version of :meth:`from_path`.
+
+        Reading and decrypting the file are run on an executor (see :func:`set_async_executor`),
+        so the event loop is never blocked.
+
+        Parameters
+        -----------
+        path: :class:`~pathlib.Path` | :class:`str`
+            The path of the file to load.
+        executor: :class:`~concurrent.futures.Executor` | ``None``
+            The executor to run the work on, overriding the one set with :func:`set_async_executor`.
+        """
+        cache = _payload_cache
+        if cache is None:
+            data, decrypted = await _run_blocking(executor, _read_and_decrypt, path, password=CRYPTO_PASSWORD)
+            return cls._from_decrypted(data, decrypted)
+
+        data = await _run_blocking(executor, Path(path).read_bytes)
+        # looking up hashes the file and may read the disk tier, and storing may write to it
+        decrypted = await _run_in_thread(cache.get, data)
+        if decrypted is None:
+            decrypted = await _run_blocking(executor, _decrypt_payload, data)
+            await _run_in_thread(cache.put, data, decrypted)
+            decrypted = decrypted.copy()
+
+        return cls._from_decrypted(data, decrypted)
+
+    @classmethod
+    def load_many(
+        cls,
+        paths: Iterable[Path | PathLike[Any] | str],
+        /,
+        *,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+        ordered: bool = True,
+    ) -> Iterator[BatchResult]:
+        """
+        Load many files at once, decrypting and parsing them over a process pool.
+
+        Parameters
+        -----------
+        paths: Iterable[:class:`~pathlib.Path` | :class:`str`]
+            The paths of the files to load.
+        max_workers: :class:`int` | ``None``
+            The amount of worker processes to use when no ``executor`` is given.
+        executor: :class:`~concurrent.futures.Executor` | ``None``
+            An executor to run the work on. It is not shut down afterwards.
+        ordered: :class:`bool`
+            Whether to yield results in input order, or as they finish. Defaults to ``True``.
+
+        Returns
+        --------
+        Iterator[:class:`~great_asset.utils.BatchResult`]
+            One result per path, holding the loaded file or the error raised whilst loading it.
+        """
+        cache = _payload_cache
+        if cache is not None:
+            yield from cls._load_many_cached(cache, paths, max_workers=max_workers, executor=executor, ordered=ordered)
             return
 
-        data = decrypt(data=self._raw_data, password=CRYPTO_PASSWORD)
+        results = _run_batch(
+            partial(_read_and_decrypt, password=CRYPTO_PASSWORD),
+            paths,
+            max_workers=max_workers,
+            executor=executor,
+            ordered=ordered,
+        )
 
-        self._validate_contents(data)
+        for result in results:
+            if result.error is None:
+                try:
+                    result = result._replace(result=cls._from_decrypted(*result.result))
+                except Exception as exc:
+                    result = result._replace(result=None, error=exc)
 
-        self._inner_data = data
+            yield result
 
-    def _upsert_value(self, key_name: str, value: Any) -> None:
-        if value is MISSING:
-            return  # If the value is the sentinel type, do nothing and move onto the next
-
-        if isinstance(value, int):
-            _type = "int"
-        elif isinstance(value, list):
-            if value and isinstance(value[0], int):
-                _type = "System.Int32[],mscorlib"
-            elif value and isinstance(value[0], dict):
-                _type = "UnityEngine.Vector3[],UnityEngine.CoreModule"
+    @classmethod
+    def _load_many_cached(
+        cls,
+        cache: PayloadCache,
+        paths: Iterable[Path | PathLike[Any] | str],
+        /,
+        *,
+        max_workers: int | None,
+        executor: Executor | None,
+        ordered: bool,
+    ) -> Iterator[BatchResult]:
+        # the files are read here so they can be looked up, only the first of each distinct file still
+        # missing from the cache is sent to the pool, and its duplicates share the payload it decrypts to
+        sources = list(paths)
+        finished: dict[int, BatchResult] = {}
+        raw: dict[int, bytes] = {}
+        # each distinct file still to decrypt, its cache key, and every index that is waiting on it
+        waiting: dict[bytes, list[int]] = {}
+        to_decrypt: list[bytes] = []
+        keys: list[bytes] = []
+
+        def finish(idx: int, payload: Any, error: BaseException | None) -> None:
+            # the raw bytes are only held until the file is done with, however that went
+            data = raw.pop(idx, None)
+            if error is None and data is not None:
+                try:
+                    finished[idx] = BatchResult(idx, sources[idx], cls._from_decrypted(data, payload), None)
+                except Exception as exc:
+                    finished[idx] = BatchResult(idx, sources[idx], None, exc)
             else:
-                raise ValueError("Unexpected or unknown array type passed for `value`")
-        elif isinstance(value, bool):
-            _type = "bool"
+                finished[idx] = BatchResult(idx, sources[idx], None, error)
+
+        next_idx = 0
+
+        def flush() -> Iterator[BatchResult]:
+            nonlocal next_idx
+            if not ordered:
+                yield from finished.values()
+                finished.clear()
+                return
+
+            while next_idx in finished:
+                yield finished.pop(next_idx)
+                next_idx += 1
+
+        for idx, path in enumerate(sources):
+            try:
+                raw[idx] = data = Path(path).read_bytes()
+            except Exception as exc:
+                finish(idx, None, exc)
+                continue
+
+            # each file is hashed once, for both looking it up and storing it
+            key = cache.key(data)
+            payload = cache.get(data, key=key)
+            if payload is not None:
+                finish(idx, payload, None)
+                continue
+
+            if key not in waiting:
+                waiting[key] = []
+                to_decrypt.append(data)
+                keys.append(key)
+            waiting[key].append(idx)
+
+        yield from flush()
+
+        if not to_decrypt:
+            return
+
+        results = _run_batch(
+            partial(_decrypt_one, password=CRYPTO_PASSWORD),
+            to_decrypt,
+            max_workers=max_workers,
+            executor=executor,
+            ordered=ordered,
+        )
+        for result in results:
+            key = keys[result.position]
+            if result.error is None:
+                cache.put(result.source, result.result, key=key)
+
+            for idx in waiting.pop(key):
+                finish(idx, None if result.error else dict(result.result), result.error)
+
+            yield from flush()
+
+    def _parse_file(self, data: SaveT | None = None, /) -> None:
+        if self._skip_parsing:
+            return
+
+        payload: SaveT
+        if data is None:
+            cache = _payload_cache
+            payload = _decrypt_payload(self._raw_data) if cache is None else cache.load(self._raw_data, _decrypt_payload)
         else:
-            raise ValueError("Unexpected type passed for `value`: %r (%s)", value, type(value))
+            payload = data
 
-        try:
-            self._inner_data[key_name]["value"] = value
-        except KeyError:
-            self._inner_data[key_name] = {"__type": _type, "value": value}
+        start = _start()
+        self._validate_contents(payload)
+        _stop("validate", start)
 
-    def _dump(self, path: Path, /) -> None:
-        decrypted_result = _to_json(self._inner_data)
+        self._inner_data = payload
 
-        encoded = decrypted_result.encode()
+    def _upsert_value(self, key_name: str, value: Any) -> None:
+        self._upsert_values(((key_name, value),))
 
-        with TEMP_FILE.open("wb") as fp:
-            fp.write(encoded)
+    def _upsert_values(self, items: Iterable[tuple[str, Any]], /) -> None:
+        # locals, as this runs for every key of every save
+        data = self._inner_data
+        dirty = self._dirty
+        setter = self._schema.setter
 
-        encrypted_result = encrypt(data=encoded, password=CRYPTO_PASSWORD)
+        for key, value in items:
+            if value is MISSING:
+                continue  # If the value is the sentinel type, do nothing and move onto the next
 
-        with path.open("wb") as fp:
-            fp.write(encrypted_result)
+            entry = data.get(key)
+            tag, coerce = setter(key, value, None if entry is None else entry["__type"])
+            try:
+                value = coerce(value)
+            except ValueError as exc:
+                raise ValueError(f"Unexpected value for {key!r}: {exc}") from None
 
-    def write(self, *, path: Path | None = None) -> None:
-        for key, value in self._extra_data.items():
-            self._upsert_value(key, value)
+            if entry is not None and entry["__type"] == tag and entry["value"] == value:
+                continue  # nothing changed, so there is nothing to re-serialise
+
+            # replaced rather than changed in place, the payload may be a shallow copy shared with the payload cache
+            data[key] = {"__type": tag, "value": value}
+            dirty.add(key)
+
+    def _reload(self, keys: Iterable[str], /) -> None:
+        # called after keys were set directly, for subclasses holding their own copy of some values
+        pass
+
+    def apply(self, mapping: Mapping[str, Any], /) -> None:
+        """
+        Set many keys of the file at once.
+
+        The ``__type`` tag of each key is taken from the types describing the file, and values are
+        coerced to match it, e.g. ``1`` to ``1.0`` for a float. Keys the types don't know about keep the tag
+        already within the file, or have it inferred from the value if they are new.
+
+        Parameters
+        -----------
+        mapping: Mapping[:class:`str`, Any]
+            The keys to set, and their new values.
+
+        Raises
+        -------
+        ValueError
+            A value doesn't fit the type of its key.
+        """
+        self._upsert_values(mapping.items())
+        self._reload(mapping.keys())
+
+    def _serialise(self, *, profile: DumpProfile = "pretty") -> bytes:
+        encoded, encrypted = _encode_payload(self._inner_data, profile=profile)
+
+        sink = self.debug_sink
+        if sink is not None:
+            _emit_debug_payload(sink, encoded)
+
+        return encrypted
+
+    def write(
+        self,
+        *,
+        path: Path | None = None,
+        profile: DumpProfile = "pretty",
+        atomic: bool = True,
+        durability: Durability = "none",
+    ) -> bytes:
+        """
+        A function to write the changes made to the save file, optionally to disk.
+
+        Only the changes made through this class are tracked, a save file without any changes is not re-serialised
+        or re-encrypted and the bytes it was loaded from are returned (and written) as-is.
+
+        Parameters
+        -----------
+        path: :class:`~pathlib.Path` | ``None``
+            The path to write the encrypted save file to. If ``None`` only the internal data structure is updated.
+        profile: Literal[``"compact"``, ``"pretty"``, ``"sorted"``]
+            How to format the JSON before encrypting it. ``"compact"`` produces the smallest file the game will read,
+            ``"pretty"`` is indented with sorted keys and ``"sorted"`` is compact with sorted keys. Defaults to ``"pretty"``.
+        atomic: :class:`bool`
+            Whether to write to a temporary file next to ``path`` and then rename it over ``path``,
+            so a crash mid-write never leaves a truncated save behind. Defaults to ``True``.
+        durability: Literal[``"none"``, ``"file"``, ``"directory"``]
+            Whether to ``fsync`` nothing, the written file, or the file and its directory before returning.
+            Stronger durability costs throughput. Defaults to ``"none"``.
+
+        Returns
+        --------
+        :class:`bytes`
+            The encrypted save file.
+        """
+        start = _start()
+        self._flush()
+        _stop("upsert", start)
+
+        # an unmodified file is already represented by the bytes we loaded it from
+        if self._dirty:
+            self._raw_data = self._serialise(profile=profile)
+            self._dirty.clear()
 
         if path:
-            self._dump(path)
+            _write_file(path, self._raw_data, atomic=atomic, durability=durability)
 
         self._written = True
+        return self._raw_data
+
+    async def async_write(
+        self,
+        *,
+        path: Path | None = None,
+        profile: DumpProfile = "pretty",
+        atomic: bool = True,
+        durability: Durability = "none",
+        executor: Executor | None = None,
+    ) -> bytes:
+        """
+        The asynchronous version of :meth:`write`.
+
+        The serialising, encrypting and writing to disk are run on an executor (see :func:`set_async_executor`)
+        so the event loop is never blocked. The file should not be modified until this has finished.
+
+        Parameters
+        -----------
+        path: :class:`~pathlib.Path` | ``None``
+            The path to write the encrypted save file to. If ``None`` only the internal data structure is updated.
+        profile: Literal[``"compact"``, ``"pretty"``, ``"sorted"``]
+            How to format the JSON before encrypting it. Defaults to ``"pretty"``.
+        atomic: :class:`bool`
+            Whether to write to a temporary file next to ``path`` and then rename it over ``path``. Defaults to ``True``.
+        durability: Literal[``"none"``, ``"file"``, ``"directory"``]
+            Whether to ``fsync`` nothing, the written file, or the file and its directory before returning.
+            Defaults to ``"none"``.
+        executor: :class:`~concurrent.futures.Executor` | ``None``
+            The executor to run the work on, overriding the one set with :func:`set_async_executor`.
+
+        Returns
+        --------
+        :class:`bytes`
+            The encrypted save file.
+        """
+        start = _start()
+        self._flush()
+        _stop("upsert", start)
+
+        if self._dirty:
+            written = set(self._dirty)
+            encoded, self._raw_data = await _run_blocking(executor, _encode_payload, self._inner_data, profile=profile)
+            self._dirty.difference_update(written)
+
+            sink = self.debug_sink
+            if sink is not None:
+                _emit_debug_payload(sink, encoded)
+
+        if path:
+            await _run_blocking(executor, _write_file, path, self._raw_data, atomic=atomic, durability=durability)
+
+        self._written = True
+        return self._raw_data
+
+    def _flush(self) -> None:
+        # move any pending changes into the payload, ready to be serialised
+        for key, value in self._extra_data.items():
+            self._upsert_value(key, value)
+        self._extra_data.clear()
 
     def _validate_contents(self, data: SaveT, /) -> None:
-        raise NotImplementedError
+        self._schema.validate(data, mode=_validation_mode)
 
 
 class SaveFile(_BaseSaveFile["SaveFileType"]):
@@ -180,40 +782,20 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         The data read from the save file.
     """
 
+    _schema = SAVE_FILE_SCHEMA
+
     # late init variable types
     _extra_data: dict[str, Any]
-
-    _credits: int
-    _current_planet_id: int
-    _deadline: float
-    _deaths: int
-    _elapsed_days: int
-    _quotas_met: int
-    _quota_threshold: int
-    _seed: int
-    _steps_taken: int
+    _ship_items: ShipItems | None
 
     __slots__ = (
         "_inner_data",
         "_extra_data",
-        "_credits",
-        "_current_planet_id",
-        "_current_quota_progress",
-        "_deadline",
-        "_deaths",
-        "_elapsed_days",
-        "_quotas_met",
-        "_quota_threshold",
-        "_seed",
-        "_steps_taken",
         # these values need a richer interface
         "_enemy_scans",
         "_ship_item_save_data",
         "_unlocked_ship_objects",
-        "_scrap",
-        "__ship_grabbable_items",
-        "__ship_grabbable_item_positions",
-        "__ship_scrap",
+        "_ship_items",
     )
 
     @classmethod
@@ -230,72 +812,174 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
 
         return cls.from_path(path)
 
-    def _validate_contents(self, data: SaveFileType, /) -> None:
-        _required_keys = (
-            "GroupCredits",
-            "DeadlineTime",
-            "Stats_StepsTaken",
-            "Stats_DaysSpent",
-            "ProfitQuota",
-            "CurrentPlanetID",
-        )
-        if any(key not in data for key in _required_keys):
-            raise ValueError("This doesn't appear to be a valid Lethal Company save file!")
-
     def _generate_seed(self, *, max: int = 99999999, min: int = 10000000) -> int:
         return random.randint(min, max)
 
-    def _parse_file(self) -> None:
-        super()._parse_file()
+    def _parse_file(self, data: SaveFileType | None = None, /) -> None:
+        super()._parse_file(data)
 
-        self._credits = self._inner_data["GroupCredits"]["value"]
-        self._current_planet_id = self._inner_data["CurrentPlanetID"]["value"]
-        self._current_quota_progress = self._inner_data["QuotaFulfilled"]["value"]
-        self._deadline = self._inner_data["DeadlineTime"]["value"]
-        self._deaths = self._inner_data["Stats_Deaths"]["value"]
-        self._elapsed_days = self._inner_data["Stats_DaysSpent"]["value"]
-        self._quotas_met = self._inner_data["QuotasPassed"]["value"]
-        self._quota_threshold = self._inner_data["ProfitQuota"]["value"]
-        self._seed = self._inner_data["RandomSeed"]["value"]
-        self._steps_taken = self._inner_data["Stats_StepsTaken"]["value"]
+        # the simple values are read straight from the payload when accessed, and the items on the ship
+        # are only parsed when they're first needed, so only reading a few values stays cheap
 
         # TODO: richer interface here.
-        self._enemy_scans = self._inner_data.get("EnemyScans", {"__type": "System.Int32[],mscorlib", "value": []})
+        # these are ordered sets (dicts with no values), to keep the order from the file whilst making membership,
+        # adding and removing O(1) and never duplicating an id
+        self._enemy_scans: dict[int, None] = dict.fromkeys(self._inner_data.get("EnemyScans", {"value": []})["value"])
         self._ship_item_save_data = self._inner_data.get(
             "shipItemSaveData", {"__type": "System.Int32[],mscorlib", "value": []}
         )
-        self._unlocked_ship_objects = self._inner_data.get(
-            "UnlockedShipObjects", {"__type": "System.Int32[],mscorlib", "value": []}
+        self._unlocked_ship_objects: dict[int, None] = dict.fromkeys(
+            self._inner_data.get("UnlockedShipObjects", {"value": []})["value"]
         )
 
-        self.__ship_grabbable_items = self._inner_data.get(
-            "shipGrabbableItemIDs", {"__type": "System.Int32[],mscorlib", "value": []}
-        )
-        self.__ship_grabbable_item_positions = self._inner_data.get(
-            "shipGrabbableItemPos", {"__type": "UnityEngine.Vector3[],UnityEngine.CoreModule", "value": []}
-        )
-        self.__ship_scrap = self._inner_data.get("shipScrapValues", {"__type": "System.Int32[],mscorlib", "value": []})
-        self._parse_scrap_mapping()
+        self._ship_items = None
 
         # this key is mostly laziness for now
         # we'll serialise anything in here into the final payload
         # for now this will just be how we add the UnlockedStored_X keys
         self._extra_data = {}
 
-    def _parse_scrap_mapping(self) -> None:
-        # shipGrabbableItems contains all touchable items on the ship, including tools which have no value
-        # shipScrapValues are an array of values assigned to each piece of scrap
-        # it works because GrabbableItems[1]: ScrapValues[1], each index aligns and that's how the values are assigned, like a zip
-        # once the scrapvalues runs out of elements, the rest of the items are treated as no value, like tools
-        self._scrap: list[GrabbableScrap] = []
+    def apply(self, mapping: Mapping[str, Any] | None = None, /, **changes: Any) -> None:
+        """
+        Set many values of the save file at once, in a single pass.
 
-        for item, value, pos in zip(
-            self.__ship_grabbable_items["value"], self.__ship_scrap["value"], self.__ship_grabbable_item_positions["value"]
-        ):
-            self._scrap.append(GrabbableScrap(item, value, pos))
+        Each field is named after the property reading it and takes what its ``update_*`` method does,
+        e.g. ``save.apply(credits=1500, current_moon=Moon.titan, deadline=3)``.
 
-        self.__ship_grabbable_items["value"] = self.__ship_grabbable_items["value"][len(self._scrap) :]
-        self.__ship_grabbable_item_positions["value"] = self.__ship_grabbable_item_positions["value"][len(self._scrap) :]
+        Parameters
+        -----------
+        mapping: Mapping[:class:`str`, Any] | ``None``
+            Keys of the file to set directly, with their ``__type`` tags taken from the types describing the file.
+        credits: :class:`int`
+            See :meth:`update_credits`.
+        current_moon: :class:`~great_asset.Moon`
+            See :meth:`update_current_moon`.
+        steps_taken: :class:`int`
+            See :meth:`update_steps_taken`.
+        deaths: :class:`int`
+            See :meth:`update_deaths`.
+        elapsed_days: :class:`int`
+            See :meth:`update_elapsed_days`.
+        deadline: :class:`int` | :class:`float`
+            See :meth:`update_deadline`.
+        profit_quota: :class:`int`
+            See :meth:`update_profit_quota`.
+        quotas_passed: :class:`int`
+            See :meth:`update_quotas_met`.
+        current_quota_progress: :class:`int`
+            See :meth:`update_current_quota_progress`.
+        current_seed: :class:`int` | ``None``
+            See :meth:`update_current_seed`.
+
+        Raises
+        -------
+        TypeError
+            An unknown field was given.
+        ValueError
+            A value doesn't fit the type of its key.
+        """
+        items: list[tuple[str, Any]] = list(mapping.items()) if mapping else []
+
+        for name, value in changes.items():
+            try:
+                key = _SAVE_FIELDS[name]
+            except KeyError:
+                raise TypeError(f"apply() got an unexpected field {name!r}") from None
+
+            if name == "current_moon":
+                value = value.value
+            elif name == "deadline":
+                value = _deadline_value(value)
+            elif name == "current_seed" and value is None:
+                value = self._generate_seed()
+
+            items.append((key, value))
+
+        self._upsert_values(items)
+        self._reload(key for key, _ in items)
+
+    @classmethod
+    def apply_to_many(
+        cls,
+        paths: Iterable[Path | PathLike[Any] | str],
+        changes: Mapping[str, Any],
+        /,
+        *,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+        ordered: bool = True,
+        profile: DumpProfile = "pretty",
+        durability: Durability = "none",
+    ) -> Iterator[BatchResult]:
+        """
+        Apply the same changes to many save files, over a process pool.
+
+        Each file is read, decrypted, changed with :meth:`apply`, encrypted and atomically written back in place
+        by a single worker. Files the changes leave as they were are not written.
+
+        Parameters
+        -----------
+        paths: Iterable[:class:`~pathlib.Path` | :class:`str`]
+            The paths of the save files to change.
+        changes: Mapping[:class:`str`, Any]
+            The fields to set, as passed to :meth:`apply`.
+        max_workers: :class:`int` | ``None``
+            The amount of worker processes to use when no ``executor`` is given.
+        executor: :class:`~concurrent.futures.Executor` | ``None``
+            An executor to run the work on. It is not shut down afterwards.
+        ordered: :class:`bool`
+            Whether to yield results in input order, or as each file finishes. Defaults to ``True``.
+        profile: Literal[``"compact"``, ``"pretty"``, ``"sorted"``]
+            How to format the JSON before encrypting it, see :meth:`write`. Defaults to ``"pretty"``.
+        durability: Literal[``"none"``, ``"file"``, ``"directory"``]
+            Whether to ``fsync`` nothing, each written file, or each file and its directory. Defaults to ``"none"``.
+
+        Raises
+        -------
+        TypeError
+            An unknown field was given, raised before any file is touched.
+
+        Returns
+        --------
+        Iterator[:class:`~great_asset.utils.BatchResult`]
+            One result per path, as each file is done with. Each holds the keys that were changed within the file,
+            or the error raised whilst changing it, which leaves that file untouched.
+        """
+        unknown = set(changes).difference(_SAVE_FIELDS)
+        if unknown:
+            raise TypeError(f"apply_to_many() got unexpected fields: {', '.join(sorted(unknown))}")
+
+        return _run_batch(
+            partial(_apply_to_path, cls, changes=dict(changes), profile=profile, durability=durability),
+            paths,
+            max_workers=max_workers,
+            executor=executor,
+            ordered=ordered,
+        )
+
+    def _reload(self, keys: Iterable[str], /) -> None:
+        keys = set(keys)
+        if "EnemyScans" in keys:
+            self._enemy_scans = dict.fromkeys(self._inner_data.get("EnemyScans", {"value": []})["value"])
+        if "UnlockedShipObjects" in keys:
+            self._unlocked_ship_objects = dict.fromkeys(self._inner_data.get("UnlockedShipObjects", {"value": []})["value"])
+        if not keys.isdisjoint(_SHIP_ITEM_KEYS):
+            # parsed again from the new values when next needed
+            self._ship_items = None
+
+    def _parse_ship_items(self) -> ShipItems:
+        if self._ship_items is not None:
+            return self._ship_items
+
+        # shipGrabbableItemIDs contains all touchable items on the ship, including tools which have no value
+        # shipScrapValues are an array of values, handed out in order to each item that is scrap
+        # shipGrabbableItemPos aligns with the ids, one position per item
+        self._ship_items = ShipItems.from_payload(
+            self._inner_data.get("shipGrabbableItemIDs", {"value": []})["value"],
+            self._inner_data.get("shipScrapValues", {"value": []})["value"],
+            self._inner_data.get("shipGrabbableItemPos", {"value": []})["value"],
+        )
+        return self._ship_items
 
     @property
     def credits(self) -> int:
@@ -306,7 +990,7 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         --------
         :class:`int`
         """
-        return self._credits
+        return self._inner_data["GroupCredits"]["value"]
 
     @property
     def current_moon(self) -> Moon:
@@ -317,7 +1001,7 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         --------
         :class:`~great_asset.Moon`
         """
-        return Moon(self._current_planet_id)
+        return Moon(self._inner_data["CurrentPlanetID"]["value"])
 
     @property
     def steps_taken(self) -> int:
@@ -328,7 +1012,7 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         --------
         :class:`int`
         """
-        return self._steps_taken
+        return self._inner_data["Stats_StepsTaken"]["value"]
 
     @property
     def deaths(self) -> int:
@@ -339,7 +1023,7 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         --------
         :class:`int`
         """
-        return self._deaths
+        return self._inner_data["Stats_Deaths"]["value"]
 
     @property
     def elapsed_days(self) -> int:
@@ -350,7 +1034,7 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         --------
         :class:`int`
         """
-        return self._elapsed_days
+        return self._inner_data["Stats_DaysSpent"]["value"]
 
     @property
     def deadline(self) -> int:
@@ -366,7 +1050,7 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         --------
         :class:`int`
         """
-        return round(self._deadline / 1080)
+        return round(self._inner_data["DeadlineTime"]["value"] / 1080)
 
     @property
     def raw_deadline(self) -> float:
@@ -377,7 +1061,7 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         --------
         :class:`float`
         """
-        return self._deadline
+        return self._inner_data["DeadlineTime"]["value"]
 
     @property
     def profit_quota(self) -> int:
@@ -388,7 +1072,7 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         --------
         :class:`int`
         """
-        return self._quota_threshold
+        return self._inner_data["ProfitQuota"]["value"]
 
     @property
     def quotas_passed(self) -> int:
@@ -399,7 +1083,7 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         --------
         :class:`int`
         """
-        return self._quotas_met
+        return self._inner_data["QuotasPassed"]["value"]
 
     @property
     def current_quota_progress(self) -> int:
@@ -410,7 +1094,7 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         --------
         :class:`int`
         """
-        return self._current_quota_progress
+        return self._inner_data["QuotaFulfilled"]["value"]
 
     @property
     def current_seed(self) -> int:
@@ -421,7 +1105,31 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         --------
         :class:`int`
         """
-        return self._seed
+        return self._inner_data["RandomSeed"]["value"]
+
+    @property
+    def unlocked_mask(self) -> int:
+        """
+        Get the unlocked ship objects as a bitmask, where bit ``n`` is set when the object with id ``n`` is unlocked.
+        This covers both :class:`~great_asset.ShipUnlock` and :class:`~great_asset.ExtraUnlock`, which share ids,
+        so it can be compared against :meth:`ShipUnlock.to_mask` or :meth:`ExtraUnlock.to_mask` directly.
+
+        Returns
+        --------
+        :class:`int`
+        """
+        return _to_mask(self._unlocked_ship_objects)
+
+    @property
+    def bestiary_mask(self) -> int:
+        """
+        Get the unlocked bestiary entries as a bitmask, where bit ``n`` is set when the entry with id ``n`` is unlocked.
+
+        Returns
+        --------
+        :class:`int`
+        """
+        return _to_mask(self._enemy_scans)
 
     def update_credits(self, new_credits: int, /) -> None:
         """Update the credits value within the save file.
@@ -432,7 +1140,6 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
             The new credits value.
         """
         self._upsert_value("GroupCredits", new_credits)
-        self._credits = new_credits
 
     def update_current_moon(self, moon: Moon, /) -> None:
         """
@@ -444,7 +1151,6 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
             The planet to update to.
         """
         self._upsert_value("CurrentPlanetID", moon.value)
-        self._current_planet_id = moon.value
 
     def update_steps_taken(self, new_steps: int, /) -> None:
         """
@@ -456,7 +1162,6 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
             The amount of steps to have taken.
         """
         self._upsert_value("Stats_StepsTaken", new_steps)
-        self._steps_taken = new_steps
 
     def update_deaths(self, new_deaths: int, /) -> None:
         """
@@ -468,7 +1173,6 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
             The new value for total deaths.
         """
         self._upsert_value("Stats_Deaths", new_deaths)
-        self._deaths = new_deaths
 
     def update_elapsed_days(self, new_elapsed_days: int, /) -> None:
         """
@@ -480,7 +1184,6 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
             The elapsed days value.
         """
         self._upsert_value("Stats_DaysSpent", new_elapsed_days)
-        self._elapsed_days = new_elapsed_days
 
     def update_deadline(self, new_deadline: int | float, /) -> None:
         """
@@ -490,12 +1193,9 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         -----------
         new_deadline: :class:`int` | :class:`float`
             New deadline/time remaining in days or minutes.
+            The file stores whole minutes, so a :class:`float` is rounded to the nearest one.
         """
-        if not isinstance(new_deadline, float):
-            new_deadline = new_deadline * 1080
-
-        self._upsert_value("DeadlineTime", new_deadline)
-        self._deadline = new_deadline
+        self._upsert_value("DeadlineTime", _deadline_value(new_deadline))
 
     def update_profit_quota(self, new_profit_quota: int, /) -> None:
         """
@@ -507,7 +1207,6 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
             The profit quota to set.
         """
         self._upsert_value("ProfitQuota", new_profit_quota)
-        self._quota_threshold = new_profit_quota
 
     def update_quotas_met(self, new_quotas_met: int, /) -> None:
         """
@@ -519,7 +1218,6 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
             The quotas met to set.
         """
         self._upsert_value("QuotasPassed", new_quotas_met)
-        self._quotas_met = new_quotas_met
 
     def update_current_quota_progress(self, new_quota_progress: int, /) -> None:
         """
@@ -531,7 +1229,6 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
             The quota progress to set.
         """
         self._upsert_value("QuotaFulfilled", new_quota_progress)
-        self._current_quota_progress = new_quota_progress
 
     def update_current_seed(self, new_seed: int | None = None, /) -> None:
         """
@@ -545,7 +1242,19 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         seed = new_seed or self._generate_seed()
 
         self._upsert_value("RandomSeed", seed)
-        self._seed = seed
+
+    def _add_ids(self, key: str, index: dict[int, None], ids: Iterable[int], /) -> None:
+        size = len(index)
+        index.update(dict.fromkeys(ids))
+        if len(index) != size:
+            self._mark_dirty(key)
+
+    def _remove_ids(self, key: str, index: dict[int, None], ids: Iterable[int], /) -> None:
+        size = len(index)
+        for id_ in ids:
+            index.pop(id_, None)
+        if len(index) != size:
+            self._mark_dirty(key)
 
     def unlock_ship_upgrades(self, *items: ShipUnlock) -> None:
         """
@@ -561,8 +1270,9 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
             The items unlocked will be added into storage, please access them from the terminal to place them.
         """
         for item in items:
-            self._unlocked_ship_objects["value"].append(item.serialised_value)
-            self._extra_data[f"ShipUnlockStored_{item.serialised_name}"] = True
+            self._extra_data[item.stored_key] = True
+
+        self._add_ids("UnlockedShipObjects", self._unlocked_ship_objects, (item.serialised_value for item in items))
 
     def unlock_all_ship_upgrades(self) -> None:
         """
@@ -580,22 +1290,62 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
             The items to remove from the ship.
         """
         for item in items:
-            try:
-                self._unlocked_ship_objects["value"].remove(item.serialised_value)
-            except ValueError:
-                pass
-            self._extra_data[f"ShipUnlockStored_{item.serialised_name}"] = False
+            self._extra_data[item.stored_key] = False
+
+        self._remove_ids("UnlockedShipObjects", self._unlocked_ship_objects, (item.serialised_value for item in items))
+
+    def has_ship_upgrades(self, *items: ShipUnlock) -> bool:
+        """
+        Check whether all of the given upgrades are unlocked for the ship.
+
+        Parameters
+        -----------
+        *items: :class:`~great_asset.ShipUnlock`
+            The upgrades to check for.
+
+        Returns
+        --------
+        :class:`bool`
+        """
+        return all(item.serialised_value in self._unlocked_ship_objects for item in items)
 
     def unlock_extras(self, *items: ExtraUnlock) -> None:
         """
         Unlock other items within the ship or for the player(s).
+        These are added to what is already unlocked.
 
         Parameters
         -----------
         *items: :class:`~great_asset.ExtraUnlock`
             The items to unlock.
         """
-        self._unlocked_ship_objects["value"] = list({i.value for i in items})
+        self._add_ids("UnlockedShipObjects", self._unlocked_ship_objects, (item.value for item in items))
+
+    def remove_extras(self, *items: ExtraUnlock) -> None:
+        """
+        Remove other items from within the ship or for the player(s).
+
+        Parameters
+        -----------
+        *items: :class:`~great_asset.ExtraUnlock`
+            The items to remove.
+        """
+        self._remove_ids("UnlockedShipObjects", self._unlocked_ship_objects, (item.value for item in items))
+
+    def has_extras(self, *items: ExtraUnlock) -> bool:
+        """
+        Check whether all of the given extras are unlocked.
+
+        Parameters
+        -----------
+        *items: :class:`~great_asset.ExtraUnlock`
+            The extras to check for.
+
+        Returns
+        --------
+        :class:`bool`
+        """
+        return all(item.value in self._unlocked_ship_objects for item in items)
 
     def unlock_all_ship_extras(self) -> None:
         """
@@ -606,13 +1356,40 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
     def unlock_bestiary_entries(self, *entries: BestiaryEntry) -> None:
         """
         Unlock bestiary entries on the ship terminal.
+        These are added to the entries already unlocked.
 
         Parameters
         -----------
         *entries: :class:`~great_asset.BestiaryEntry`
             The entries to unlock.
         """
-        self._enemy_scans["value"] = list({e.value for e in entries})
+        self._add_ids("EnemyScans", self._enemy_scans, (entry.value for entry in entries))
+
+    def remove_bestiary_entries(self, *entries: BestiaryEntry) -> None:
+        """
+        Remove bestiary entries from the ship terminal.
+
+        Parameters
+        -----------
+        *entries: :class:`~great_asset.BestiaryEntry`
+            The entries to remove.
+        """
+        self._remove_ids("EnemyScans", self._enemy_scans, (entry.value for entry in entries))
+
+    def has_bestiary_entries(self, *entries: BestiaryEntry) -> bool:
+        """
+        Check whether all of the given bestiary entries are unlocked.
+
+        Parameters
+        -----------
+        *entries: :class:`~great_asset.BestiaryEntry`
+            The entries to check for.
+
+        Returns
+        --------
+        :class:`bool`
+        """
+        return all(entry.value in self._enemy_scans for entry in entries)
 
     def unlock_all_bestiary_entries(self) -> None:
         """
@@ -620,6 +1397,41 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
         """
         return self.unlock_bestiary_entries(*BestiaryEntry.all())
 
+    def update_unlocked_mask(self, mask: int, /) -> None:
+        """
+        Set exactly which ship objects are unlocked from a bitmask, such as one from :attr:`unlocked_mask`.
+        Objects already unlocked keep their place, and the stored flag of each ship upgrade added or removed is updated.
+
+        Parameters
+        -----------
+        mask: :class:`int`
+            The bitmask of unlocked objects.
+        """
+        current = self.unlocked_mask
+        added = mask & ~current
+        removed = current & ~mask
+
+        for item in ShipUnlock.from_mask(added):
+            self._extra_data[item.stored_key] = True
+        for item in ShipUnlock.from_mask(removed):
+            self._extra_data[item.stored_key] = False
+
+        self._remove_ids("UnlockedShipObjects", self._unlocked_ship_objects, _iter_bits(removed))
+        self._add_ids("UnlockedShipObjects", self._unlocked_ship_objects, _iter_bits(added))
+
+    def update_bestiary_mask(self, mask: int, /) -> None:
+        """
+        Set exactly which bestiary entries are unlocked from a bitmask, such as one from :attr:`bestiary_mask`.
+
+        Parameters
+        -----------
+        mask: :class:`int`
+            The bitmask of unlocked entries.
+        """
+        current = self.bestiary_mask
+        self._remove_ids("EnemyScans", self._enemy_scans, _iter_bits(current & ~mask))
+        self._add_ids("EnemyScans", self._enemy_scans, _iter_bits(mask & ~current))
+
     def spawn_items(self, *items: tuple[Item | Scrap, Vector | None], value_min: int = 30, value_max: int = 90) -> None:
         """
         Spawn items within the world or ship.
@@ -630,69 +1442,104 @@ class SaveFile(_BaseSaveFile["SaveFileType"]):
             A series of tuples with the item and it's position to spawn in.
             Using ``None`` as the second value will spawn at a default area near the door of the ship internally.
         """
+        ship_items = self._parse_ship_items()
         cupboard_position = self._inner_data.get("ShipUnlockPos_Cupboard")
 
         for item, position in items:
             vec = position or Vector.in_cupboard(cupboard_position=cupboard_position)
             if isinstance(item, Scrap):
-                value = random.randint(value_min, value_max)
-                self._scrap.append(GrabbableScrap(item.value, value, vec.serialise()))
-                continue
+                ship_items.append(item.value, vec, random.randint(value_min, value_max))
+            else:
+                ship_items.append(item.value, vec)
+
+        if items:
+            self._mark_dirty(*_SHIP_ITEM_KEYS)
+
+    def spawn_many(
+        self,
+        item: Item | Scrap,
+        count: int,
+        /,
+        *,
+        region: tuple[Vector, Vector] | None = None,
+        value_min: int = 30,
+        value_max: int = 90,
+    ) -> None:
+        """
+        Spawn many of the same item at once, generating every position (and value) in one batched pass.
+
+        Parameters
+        -----------
+        item: :class:`~great_asset.Item` | :class:`~great_asset.Scrap`
+            The item to spawn.
+        count: :class:`int`
+            How many to spawn.
+        region: tuple[:class:`~great_asset.Vector`, :class:`~great_asset.Vector`] | ``None``
+            Two opposite corners of the box to spawn the items within.
+            Using ``None`` spawns them on the shelves of the cupboard, wherever it is.
+        value_min: :class:`int`
+            The minimum value of spawned scrap. Defaults to ``30``.
+        value_max: :class:`int`
+            The maximum value of spawned scrap. Defaults to ``90``.
+        """
+        if count <= 0:
+            return
+
+        if region is None:
+            positions = VectorArray.in_cupboard(count, cupboard_position=self._inner_data.get("ShipUnlockPos_Cupboard"))
+        else:
+            positions = VectorArray.random_in_box(count, *region)
+
+        values = random.choices(range(value_min, value_max + 1), k=count) if isinstance(item, Scrap) else None
 
-            self.__ship_grabbable_items["value"].append(item.value)
-            self.__ship_grabbable_item_positions["value"].append(vec.serialise())
+        self._parse_ship_items().extend(item.value, positions, values)
+        self._mark_dirty(*_SHIP_ITEM_KEYS)
 
     def get_current_items(self) -> list[Item]:
         """
         Get the current items that exist within the ship in the save file.
+        Items with an id we don't know of (e.g. from mods) are skipped.
 
         Returns
         --------
         list[:class:`~great_asset.Item`]
         """
-        return [Item(item) for item in self.__ship_grabbable_items["value"]]
+        return Item.from_ids(item for item in self._parse_ship_items().ids if item not in SCRAP_IDS)
 
     def get_current_scrap(self) -> list[Scrap]:
         """
         Get the current scrap that exist within the ship in the save file.
+        Scrap with an id we don't know of (e.g. from mods) is skipped.
 
         Returns
         --------
         list[:class:`~great_asset.Scrap`]
         """
-        return [Scrap(item.id) for item in self._scrap]
+        return Scrap.from_ids(item.id for item in self._parse_ship_items().scrap())
 
-    def write(self, *, path: Path | None = None) -> None:
-        """
-        A function to write the save file data to the internal data structure.
-
-        Parameters
-        -----------
-        dump_to_file: :class:`bool`
-            Whether to overwrite the passed file with the changes. Defaults to ``True``.
-        overwrite: :class:`bool`
-            Whether to overwrite the existing save file with the changes. Defaults to ``True``.
-            Irrelevant if ``dump_to_file`` is ``False``.
-            Creates a file with the same name with the file extension of ``".over"``.
-        """
-        # manually handle the more complex types:
-        self._upsert_value("UnlockedShipObjects", list(set(self._unlocked_ship_objects["value"])))
-        self._inner_data["EnemyScans"] = self._enemy_scans
-        self._inner_data["shipItemSaveData"] = self._ship_item_save_data
+    def _flush(self) -> None:
+        # manually handle the more complex types, only if they were touched:
+        if "UnlockedShipObjects" in self._dirty:
+            self._inner_data["UnlockedShipObjects"] = {"__type": _INT_ARRAY_TYPE, "value": list(self._unlocked_ship_objects)}
 
-        for item in self._scrap:
-            self.__ship_scrap["value"].insert(0, item.value)
-            self.__ship_grabbable_items["value"].insert(0, item.id)
-            self.__ship_grabbable_item_positions["value"].insert(0, item.pos)
+        if "EnemyScans" in self._dirty:
+            self._inner_data["EnemyScans"] = {"__type": _INT_ARRAY_TYPE, "value": list(self._enemy_scans)}
 
-        self._inner_data["shipScrapValues"] = self.__ship_scrap
-        self._inner_data["shipGrabbableItemIDs"] = self.__ship_grabbable_items
-        self._inner_data["shipGrabbableItemPos"] = self.__ship_grabbable_item_positions
+        if self._ship_items is not None and self._dirty.intersection(_SHIP_ITEM_KEYS):
+            ship_items = self._ship_items
+            self._inner_data["shipScrapValues"] = {"__type": _INT_ARRAY_TYPE, "value": ship_items.serialise_values()}
+            self._inner_data["shipGrabbableItemIDs"] = {"__type": _INT_ARRAY_TYPE, "value": ship_items.serialise_ids()}
+            self._inner_data["shipGrabbableItemPos"] = {
+                "__type": _VECTOR_ARRAY_TYPE,
+                "value": ship_items.serialise_positions(),
+            }
 
-        super().write(path=path)
+        super()._flush()
 
 
 class ConfigFile(_BaseSaveFile["ConfigFileType"]):
+    _schema = CONFIG_FILE_SCHEMA
+
     _extra_data: dict[str, Any]
 
     # late init types
@@ -714,41 +1561,33 @@ class ConfigFile(_BaseSaveFile["ConfigFileType"]):
     _times_landed: IntValue
     _is_host_public: BoolValue
     _host_name: StringValue
-    _played_extrance_0: BoolValue
+    _played_entrance_0: BoolValue
     _played_entrance_1: BoolValue
     _tips: dict[str, BoolValue]
 
-    def _validate_contents(self, data: ConfigFileType, /) -> None:
-        _required_keys = ("SelectedFile", "FPSCap", "Gamma", "LookSens", "ScreenMode")
-        if any(key not in data for key in _required_keys):
-            raise ValueError("This doesn't appear to be a valid Lethal Company config file!")
-
-    def _parse_file(self) -> None:
-        super()._parse_file()
-
-        self.arachnophobia_mode = self._inner_data["SpiderSafeMode"]["value"]
-        self.y_axis_inverted = self._inner_data["InvertYAxis"]["value"]
-        self.screen_mode = self._inner_data["ScreenMode"]["value"]
-        self.fps_mode = self._inner_data["FPSCap"]["value"]
-        self.current_mic = self._inner_data["CurrentMic"]["value"]
-        self.push_to_talk = self._inner_data["PushToTalk"]["value"]
-        self.mic_enabled = self._inner_data["MicEnabled"]["value"]
-        self.mouse_sensitivity = self._inner_data["LookSens"]["value"]
-        self.master_volume = self._inner_data["MasterVolume"]["value"]
-        self.gamma = self._inner_data["Gamma"]["value"]
-        self.finished_setup = self._inner_data["PlayerFinishedSetup"]["value"]
-        self.start_online = self._inner_data["StartInOnlineMode"]["value"]
-
-        self._player_xp = self._inner_data.get("PlayerXPNum", MISSING)
-        self._player_level = self._inner_data.get("PlayerLevel", MISSING)
-        self._times_landed = self._inner_data.get("TimesLanded", MISSING)
-        self._is_host_public = self._inner_data.get("HostSettings_Public", MISSING)
-        self._host_name = self._inner_data.get("HostSettings_Name", MISSING)
-        self._played_entrance_0 = self._inner_data.get("PlayedDungeonEntrance0", MISSING)
-        self._played_entrance_1 = self._inner_data.get("PlayedDungeonEntrance1", MISSING)
-        self._tips = {tip: self._inner_data.get(tip, MISSING) for tip in TIPS}
+    def _parse_file(self, data: ConfigFileType | None = None, /) -> None:
+        super()._parse_file(data)
+
+        self._load_settings()
         self._extra_data = {}
 
+    def _load_settings(self) -> None:
+        for key, attribute in _CONFIG_SETTINGS.items():
+            setattr(self, attribute, self._inner_data[key]["value"])
+        for key, attribute in _CONFIG_ENTRIES.items():
+            setattr(self, attribute, self._inner_data.get(key, MISSING))
+        self._tips = {tip: self._inner_data.get(tip, MISSING) for tip in TIPS}
+
+    def _reload(self, keys: Iterable[str], /) -> None:
+        # only the keys given, so changes made through the setters that aren't written yet are kept
+        for key in keys:
+            if key in _CONFIG_SETTINGS:
+                setattr(self, _CONFIG_SETTINGS[key], self._inner_data[key]["value"])
+            elif key in _CONFIG_ENTRIES:
+                setattr(self, _CONFIG_ENTRIES[key], self._inner_data.get(key, MISSING))
+            elif key in self._tips:
+                self._tips[key] = self._inner_data.get(key, MISSING)
+
     @property
     def player_xp(self) -> int:
         if self._player_xp is not MISSING:
@@ -830,34 +1669,20 @@ class ConfigFile(_BaseSaveFile["ConfigFileType"]):
         if 0 <= value <= 1:
             self.gamma = value
 
-    def write(self, *, path: Path | None = None) -> None:
-        self._upsert_value("SpiderSafeMode", self.arachnophobia_mode)
-        self._upsert_value("InvertYAxis", self.y_axis_inverted)
-        self._upsert_value("ScreenMode", self.screen_mode)
-        self._upsert_value("FPSCap", self.fps_mode)
-        self._upsert_value("CurrentMic", self.current_mic)
-        self._upsert_value("PushToTalk", self.push_to_talk)
-        self._upsert_value("MicEnabled", self.mic_enabled)
-        self._upsert_value("LookSens", self.mouse_sensitivity)
-        self._upsert_value("MasterVolume", self.master_volume)
-        self._upsert_value("Gamma", self.gamma)
-        self._upsert_value("PlayerFinishedSetup", self.finished_setup)
-        self._upsert_value("StartInOnlineMode", self.start_online)
-        self._upsert_value("PlayerXPNum", self._player_xp)
-        self._upsert_value("PlayerLevel", self._player_level)
-        self._upsert_value("TimesLanded", self._times_landed)
-        self._upsert_value("HostSettings_Public", self._is_host_public)
-        self._upsert_value("HostSettings_Name", self._host_name)
-        self._upsert_value("PlayedDungeonEntrance0", self._played_entrance_0)
-        self._upsert_value("PlayedDungeonEntrance1", self._played_entrance_1)
-
-        for idx, tip in enumerate(self._tips):
-            self._upsert_value(TIPS[idx], tip)
-
-        super().write(path=path)
+    def _flush(self) -> None:
+        changes: dict[str, Any] = {key: getattr(self, attribute) for key, attribute in _CONFIG_SETTINGS.items()}
+        # these are held as whole entries, or MISSING when the file doesn't have them
+        entries: dict[str, Any] = {key: getattr(self, attribute) for key, attribute in _CONFIG_ENTRIES.items()}
+        entries.update(self._tips)
+        changes.update((key, entry["value"]) for key, entry in entries.items() if entry is not MISSING)
+        self._upsert_values(changes.items())
+
+        super()._flush()
 
 
 class ChallengeFile(_BaseSaveFile["ChallengeFileType"]):
+    _schema = CHALLENGE_FILE_SCHEMA
+
     _profit_earned: int
     _finished_challenge: bool
     _submitted_score: bool
@@ -874,13 +1699,8 @@ class ChallengeFile(_BaseSaveFile["ChallengeFileType"]):
         "_set_challenge_file_money",
     )
 
-    def _validate_contents(self, data: ChallengeFileType) -> None:
-        _required_keys = ("ProfitEarned", "FinishedChallenge", "SubmittedScore")
-        if any(key not in data for key in _required_keys):
-            raise ValueError("This doesn't appear to be a valid Challenge file.")
-
-    def _parse_file(self) -> None:
-        super()._parse_file()
+    def _parse_file(self, data: ChallengeFileType | None = None, /) -> None:
+        super()._parse_file(data)
 
         self._profit_earned = self._inner_data["ProfitEarned"]["value"]
         self._finished_challenge = self._inner_data["FinishedChallenge"]["value"]
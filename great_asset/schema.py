@@ -0,0 +1,453 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, ForwardRef, List, Literal, NamedTuple, Tuple, cast, get_args, get_origin
+
+from .types_.challenge_file import ChallengeFile
+from .types_.config_file import ConfigFile
+from .types_.save_file import SaveFile
+from .types_.shared import (
+    ArrayIntValue,
+    ArrayVectorValue,
+    BoolValue,
+    FloatValue,
+    InnerVectorValue,
+    IntValue,
+    StringValue,
+    VectorValue,
+)
+from .vector import Vector, VectorArray
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+__all__ = (
+    "CHALLENGE_FILE_SCHEMA",
+    "CONFIG_FILE_SCHEMA",
+    "SAVE_FILE_SCHEMA",
+    "Schema",
+    "ValidationMode",
+    "compile_schema",
+)
+
+# "off" skips validation, "required" only checks the required keys are present
+# and "full" also checks the `__type` tag and the type of the value of every known key.
+ValidationMode = Literal["off", "required", "full"]
+Checker = Callable[[Any], bool]
+Coercer = Callable[[Any], Any]
+# the `__type` tag of an entry and how to turn a Python value into its `value`
+Setter = Tuple[str, Coercer]
+
+
+class _RequiredMarker:
+    # stands in for `Required`/`NotRequired` when evaluating string annotations, as neither exists at runtime before 3.11
+    __slots__ = ("required",)
+
+    def __init__(self, required: bool) -> None:
+        self.required = required
+
+    def __getitem__(self, item: Any) -> _Qualified:
+        return _Qualified(self.required, item)
+
+
+class _Qualified(NamedTuple):
+    # what `Required[...]`/`NotRequired[...]` evaluate to in place of the real thing
+    required: bool
+    annotation: Any
+
+
+def _evaluate(annotation: Any, namespace: dict[str, Any], /) -> Any:
+    if isinstance(annotation, ForwardRef):
+        annotation = annotation.__forward_arg__
+    if isinstance(annotation, str):
+        # these are only ever our own annotations, and `list[...]` can't be subscripted at runtime before 3.9
+        scope = {**namespace, "Required": _RequiredMarker(True), "NotRequired": _RequiredMarker(False), "list": List}
+        annotation = eval(annotation, scope)
+    return annotation
+
+
+def _unwrap_required(annotation: Any, /) -> tuple[bool | None, Any]:
+    if isinstance(annotation, _Qualified):
+        return annotation.required, annotation.annotation
+
+    # the real `Required`/`NotRequired`, from typing or typing_extensions
+    name = getattr(get_origin(annotation) or getattr(annotation, "__origin__", None), "_name", None)
+    if name in ("Required", "NotRequired"):
+        return name == "Required", get_args(annotation)[0]
+
+    return None, annotation
+
+
+def _is_typed_dict(annotation: Any, /) -> bool:
+    return hasattr(annotation, "__total__") and isinstance(annotation, type) and issubclass(annotation, dict)
+
+
+def _fields(typed_dict: type, /) -> dict[str, tuple[bool, Any]]:
+    # key -> (required, annotation), with the annotations evaluated in the namespace of the module defining them
+    namespace = vars(sys.modules[typed_dict.__module__])
+    mangled_prefix = f"_{typed_dict.__name__}__"
+
+    fields: dict[str, tuple[bool, Any]] = {}
+    for key, annotation in typed_dict.__annotations__.items():
+        required, annotation = _unwrap_required(_evaluate(annotation, namespace))
+
+        # `__type` within a class body is name mangled, e.g. to `_IntValue__type`
+        if key.startswith(mangled_prefix):
+            key = "__" + key[len(mangled_prefix) :]
+
+        fields[key] = (typed_dict.__total__ if required is None else required, annotation)  # type: ignore # checked above
+    return fields
+
+
+_SCALARS: dict[Any, str] = {
+    int: "type({0}) is int",
+    # JSON doesn't distinguish between `1` and `1.0`
+    float: "type({0}) in _FLOAT",
+    bool: "type({0}) is bool",
+    str: "type({0}) is str",
+}
+
+
+def _expression(annotation: Any, target: str, constants: dict[str, Any], depth: int = 0, /) -> str:
+    # builds a single boolean expression checking `target` against `annotation`, with no calls besides builtins
+    scalar = _SCALARS.get(annotation)
+    if scalar is not None:
+        return scalar.format(target)
+
+    origin = get_origin(annotation)
+
+    if origin is Literal:
+        allowed = get_args(annotation)
+        if len(allowed) == 1:
+            return f"{target} == {allowed[0]!r}"
+        name = f"_c{len(constants)}"
+        constants[name] = frozenset(allowed)
+        return f"{target} in {name}"
+
+    if origin is list:
+        (item,) = get_args(annotation)
+        var = f"_i{depth}"
+        return f"(type({target}) is list and all({_expression(item, var, constants, depth + 1)} for {var} in {target}))"
+
+    if _is_typed_dict(annotation):
+        # bound once with the walrus operator, so the checks below don't repeat the lookups leading to it
+        var = f"_d{depth}"
+        checks = [f"type({var} := {target}) is dict"]
+        for key, (required, field) in _fields(annotation).items():
+            check = _expression(field, f"{var}[{key!r}]", constants, depth + 1)
+            checks.append(f"{key!r} in {var} and {check}" if required else f"({key!r} not in {var} or {check})")
+        return "(" + " and ".join(checks) + ")"
+
+    raise TypeError(f"Unsupported annotation within a save file schema: {annotation!r}")
+
+
+# most keys share the same few types, so each is only compiled once
+@lru_cache(maxsize=None)
+def _compile_checker(annotation: Any, /) -> Checker:
+    constants: dict[str, Any] = {"_FLOAT": (float, int)}
+    source = f"def check(_value):\n    return {_expression(annotation, '_value', constants)}\n"
+
+    namespace: dict[str, Any] = {**constants}
+    # the source is built from our own annotations only
+    exec(compile(source, f"<schema {getattr(annotation, '__name__', annotation)}>", "exec"), namespace)
+    return namespace["check"]
+
+
+def _coerce_int(value: Any, /) -> int:
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise ValueError(f"expected an int, got {value!r}")
+
+
+def _coerce_float(value: Any, /) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    raise ValueError(f"expected a float, got {value!r}")
+
+
+def _coerce_bool(value: Any, /) -> bool:
+    if isinstance(value, bool):
+        return value
+    # the game itself only ever writes booleans, but 0 and 1 are unambiguous enough
+    if type(value) is int and value in (0, 1):
+        return bool(value)
+    raise ValueError(f"expected a bool, got {value!r}")
+
+
+def _coerce_str(value: Any, /) -> str:
+    if isinstance(value, str):
+        return value
+    raise ValueError(f"expected a str, got {value!r}")
+
+
+def _coerce_vector(value: Any, /) -> InnerVectorValue:
+    if isinstance(value, Vector):
+        return value.serialise()
+    if isinstance(value, dict):
+        try:
+            return {"x": _coerce_float(value["x"]), "y": _coerce_float(value["y"]), "z": _coerce_float(value["z"])}
+        except KeyError:
+            pass
+    raise ValueError(f"expected a Vector, got {value!r}")
+
+
+def _coerce_vector_array(value: Any, /) -> list[InnerVectorValue]:
+    if isinstance(value, VectorArray):
+        return value.to_dicts()
+    if isinstance(value, (list, tuple)):
+        return [_coerce_vector(item) for item in value]  # pyright: ignore[reportUnknownVariableType]
+    raise ValueError(f"expected a VectorArray or a list of Vectors, got {value!r}")
+
+
+_COERCERS: dict[Any, Coercer] = {
+    int: _coerce_int,
+    float: _coerce_float,
+    bool: _coerce_bool,
+    str: _coerce_str,
+    InnerVectorValue: _coerce_vector,
+}
+
+
+@lru_cache(maxsize=None)
+def _coercer(annotation: Any, /) -> Coercer:
+    coercer = _COERCERS.get(annotation)
+    if coercer is not None:
+        return coercer
+
+    if get_origin(annotation) is list:
+        (item,) = get_args(annotation)
+        if item is InnerVectorValue:
+            return _coerce_vector_array
+
+        coerce_item = _coercer(item)
+
+        def coerce_list(value: Any, /) -> list[Any]:
+            if not isinstance(value, (list, tuple)):
+                raise ValueError(f"expected a list, got {value!r}")
+            return [coerce_item(item) for item in value]  # pyright: ignore[reportUnknownVariableType]
+
+        return coerce_list
+
+    raise TypeError(f"Unsupported value annotation within a save file schema: {annotation!r}")
+
+
+@lru_cache(maxsize=None)
+def _setter(annotation: Any, /) -> Setter | None:
+    # only the `{"__type": ..., "value": ...}` entries can be set, which is every top level key so far
+    if not _is_typed_dict(annotation):
+        return None
+
+    fields = _fields(annotation)
+    if set(fields) != {"__type", "value"} or get_origin(fields["__type"][1]) is not Literal:
+        return None
+
+    (tag,) = get_args(fields["__type"][1])
+    return tag, _coercer(fields["value"][1])
+
+
+# every kind of entry by its tag, for keys a schema doesn't know about but that are already within the file
+_TAG_SETTERS: dict[str, Setter] = {
+    setter[0]: setter
+    for setter in map(
+        _setter,
+        (StringValue, IntValue, FloatValue, BoolValue, ArrayIntValue, VectorValue, ArrayVectorValue),
+    )
+    if setter is not None
+}
+
+
+def _infer_setter(value: Any, /) -> Setter:
+    # for keys that are new to both the schema and the file, so the value is all there is to go on.
+    # `bool` is a subclass of `int`, so it has to be checked first
+    if isinstance(value, bool):
+        return _TAG_SETTERS["bool"]
+    if isinstance(value, int):
+        return _TAG_SETTERS["int"]
+    if isinstance(value, float):
+        return _TAG_SETTERS["float"]
+    if isinstance(value, str):
+        return _TAG_SETTERS["string"]
+    if isinstance(value, Vector):
+        return _TAG_SETTERS["Vector3"]
+    if isinstance(value, VectorArray):
+        return _TAG_SETTERS["UnityEngine.Vector3[],UnityEngine.CoreModule"]
+    if isinstance(value, (list, tuple)):
+        return _infer_array_setter(cast("Sequence[Any]", value))
+
+    raise ValueError(f"Unexpected type passed for `value`: {value!r} ({type(value)})")
+
+
+def _infer_array_setter(items: Sequence[Any], /) -> Setter:
+    # every item is checked, rather than guessing from the first
+    if items and all(isinstance(item, int) and not isinstance(item, bool) for item in items):
+        return _TAG_SETTERS["System.Int32[],mscorlib"]
+    if items and all(isinstance(item, (Vector, dict)) for item in items):
+        return _TAG_SETTERS["UnityEngine.Vector3[],UnityEngine.CoreModule"]
+    raise ValueError(f"Unexpected or unknown array type passed for `value`: {items!r}")
+
+
+class Schema:
+    """
+    A validator for a kind of file, compiled from the :class:`~typing.TypedDict` describing it.
+
+    Parameters
+    -----------
+    name: :class:`str`
+        The name of the kind of file, used within error messages.
+    typed_dict: type
+        The :class:`~typing.TypedDict` describing the top level of the file.
+    """
+
+    __slots__ = ("_checkers", "_fields", "_setters", "name", "required")
+
+    def __init__(self, name: str, typed_dict: type, /) -> None:
+        fields = _fields(typed_dict)
+
+        self.name: str = name
+        self.required: frozenset[str] = frozenset(key for key, (is_required, _) in fields.items() if is_required)
+        self._fields: dict[str, tuple[bool, Any]] = fields
+        # each key and the check of its entry, i.e. of the `__type` tag and `value` together.
+        # compiled on first use, so files that are never fully validated never pay for it
+        self._checkers: Mapping[str, Checker] | None = None
+        # each key and its setter, built on first use for the same reason
+        self._setters: dict[str, Setter] | None = None
+
+    def _compile(self) -> Mapping[str, Checker]:
+        checkers = self._checkers = {key: _compile_checker(field) for key, (_, field) in self._fields.items()}
+        return checkers
+
+    def _compile_setters(self) -> dict[str, Setter]:
+        setters: dict[str, Setter] = {}
+        for key, (_, field) in self._fields.items():
+            setter = _setter(field)
+            if setter is not None:
+                setters[key] = setter
+
+        self._setters = setters
+        return setters
+
+    def __repr__(self) -> str:
+        return f"<Schema name={self.name!r} keys={len(self._fields)} required={len(self.required)}>"
+
+    def setter(self, key: str, value: Any, /, current: str | None = None) -> Setter:
+        """
+        Get the ``__type`` tag and coercion for a value being set on a key.
+
+        Keys this schema knows about use the types it was compiled from. Otherwise the tag of the
+        ``current`` entry is kept if there is one, and the tag is inferred from ``value`` if not.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key being set.
+        value: Any
+            The value being set.
+        current: Optional[:class:`str`]
+            The ``__type`` tag of the entry already within the file, if any.
+
+        Raises
+        -------
+        ValueError
+            A tag couldn't be inferred from ``value``.
+
+        Returns
+        --------
+        tuple[:class:`str`, Callable[[Any], Any]]
+            The tag, and a callable turning ``value`` into what is stored under ``"value"``.
+            It raises :class:`ValueError` for values that don't fit the tag.
+        """
+        setters = self._setters
+        if setters is None:
+            setters = self._compile_setters()
+
+        setter = setters.get(key)
+        if setter is not None:
+            return setter
+
+        if current is not None:
+            setter = _TAG_SETTERS.get(current)
+            if setter is not None:
+                return setter
+
+        return _infer_setter(value)
+
+    def validate(self, data: Any, /, *, mode: ValidationMode = "full") -> None:
+        """
+        Validate the decrypted contents of a file against this schema.
+
+        Keys this schema doesn't know about are allowed, as newer versions of the game add them.
+
+        Parameters
+        -----------
+        data: Any
+            The decrypted contents of the file.
+        mode: Literal[``"off"``, ``"required"``, ``"full"``]
+            How much to validate. Defaults to ``"full"``.
+
+        Raises
+        -------
+        ValueError
+            The contents don't match this schema.
+        """
+        if mode == "off":
+            return
+
+        if not isinstance(data, dict):
+            raise ValueError(f"This doesn't appear to be a valid {self.name}!")
+
+        missing = self.required.difference(data)  # pyright: ignore[reportUnknownArgumentType]
+        if missing:
+            raise ValueError(f"This doesn't appear to be a valid {self.name}! Missing keys: {', '.join(sorted(missing))}")
+
+        if mode == "full":
+            checkers = self._checkers or self._compile()
+            for key, entry in data.items():  # pyright: ignore[reportUnknownVariableType]
+                check = checkers.get(key)  # pyright: ignore[reportUnknownArgumentType]
+                if check is not None and not check(entry):
+                    raise ValueError(f"This doesn't appear to be a valid {self.name}! Invalid entry for {key!r}: {entry!r}")
+
+
+def compile_schema(name: str, typed_dict: type, /) -> Schema:
+    """
+    Compile a :class:`Schema` from a :class:`~typing.TypedDict`.
+
+    Parameters
+    -----------
+    name: :class:`str`
+        The name of the kind of file, used within error messages.
+    typed_dict: type
+        The :class:`~typing.TypedDict` describing the top level of the file.
+    """
+    return Schema(name, typed_dict)
+
+
+SAVE_FILE_SCHEMA = compile_schema("Lethal Company save file", SaveFile)
+CONFIG_FILE_SCHEMA = compile_schema("Lethal Company config file", ConfigFile)
+CHALLENGE_FILE_SCHEMA = compile_schema("Challenge file", ChallengeFile)
@@ -23,14 +23,17 @@ DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
 
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypedDict
 
 from .shared import *
 
+if TYPE_CHECKING:
+    from typing_extensions import Required
+
 __all__ = ("ConfigFile",)
 
 
-class ConfigFile(TypedDict):
+class ConfigFile(TypedDict, total=False):
     TimesLanded: IntValue
     PlayerXPNum: IntValue
     PlayerLevel: IntValue
@@ -40,18 +43,18 @@ class ConfigFile(TypedDict):
     LastVerPlayed: IntValue
     SpiderSafeMode: BoolValue
     InvertYAxis: BoolValue
-    ScreenMode: IntValue
-    FPSCap: IntValue
+    ScreenMode: Required[IntValue]
+    FPSCap: Required[IntValue]
     Bindings: StringValue
     CurrentMic: StringValue
     PushToTalk: BoolValue
     MicEnabled: BoolValue
-    LookSens: IntValue
+    LookSens: Required[IntValue]
     MasterVolume: FloatValue
-    Gamma: FloatValue
+    Gamma: Required[FloatValue]
     StartInOnlineMode: BoolValue
     PlayerFinishedSetup: BoolValue
-    SelectedFile: IntValue
+    SelectedFile: Required[IntValue]
     LC_MoveObjectsTip: BoolValue
     LC_StorageTip: BoolValue
     LC_EclipseTip: BoolValue
@@ -24,113 +24,114 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TypedDict
-
-from typing_extensions import Required
+from typing import TYPE_CHECKING, TypedDict
 
 from .shared import *
 
+if TYPE_CHECKING:
+    from typing_extensions import Required
+
 __all__ = ("SaveFile",)
 
 
 SaveFile = TypedDict(
     "SaveFile",
     {
-        "CurrentPlanetID": Required[IntValue],
-        "DeadlineTime": Required[IntValue],
-        "EnemyScans": Required[ArrayIntValue],
-        "FileGameVers": Required[IntValue],
-        "GroupCredits": Required[IntValue],
-        "ProfitQuota": Required[IntValue],
-        "QuotaFulfilled": Required[IntValue],
-        "QuotasPassed": Required[IntValue],
-        "RandomSeed": Required[IntValue],
-        "ShipUnlockStored_Cozy lights": Required[BoolValue],
+        "CurrentPlanetID": "Required[IntValue]",
+        "DeadlineTime": "Required[IntValue]",
+        "EnemyScans": ArrayIntValue,
+        "FileGameVers": IntValue,
+        "GroupCredits": "Required[IntValue]",
+        "ProfitQuota": "Required[IntValue]",
+        "QuotaFulfilled": "Required[IntValue]",
+        "QuotasPassed": "Required[IntValue]",
+        "RandomSeed": "Required[IntValue]",
+        "ShipUnlockStored_Cozy lights": BoolValue,
         "ShipUnlockMoved_Cozy lights": BoolValue,
         "ShipUnlockPos_Cozy lights": VectorValue,
         "ShipUnlockRot_Cozy lights": VectorValue,
-        "ShipUnlockStored_Teleporter": Required[BoolValue],
+        "ShipUnlockStored_Teleporter": BoolValue,
         "ShipUnlockMoved_Teleporter": BoolValue,
         "ShipUnlockPos_Teleporter": VectorValue,
         "ShipUnlockRot_Teleporter": VectorValue,
-        "ShipUnlockStored_Television": Required[BoolValue],
+        "ShipUnlockStored_Television": BoolValue,
         "ShipUnlockMoved_Television": BoolValue,
         "ShipUnlockPos_Television": VectorValue,
         "ShipUnlockRot_Television": VectorValue,
-        "ShipUnlockStored_Cupboard": Required[BoolValue],
+        "ShipUnlockStored_Cupboard": BoolValue,
         "ShipUnlockMoved_Cupboard": BoolValue,
         "ShipUnlockPos_Cupboard": VectorValue,
         "ShipUnlockRot_Cupboard": VectorValue,
-        "ShipUnlockStored_File Cabinet": Required[BoolValue],
+        "ShipUnlockStored_File Cabinet": BoolValue,
         "ShipUnlockMoved_File Cabinet": BoolValue,
         "ShipUnlockPos_File Cabinet": VectorValue,
         "ShipUnlockRot_File Cabinet": VectorValue,
-        "ShipUnlockStored_Toilet": Required[BoolValue],
+        "ShipUnlockStored_Toilet": BoolValue,
         "ShipUnlockMoved_Toilet": BoolValue,
         "ShipUnlockPos_Toilet": VectorValue,
         "ShipUnlockRot_Toilet": VectorValue,
-        "ShipUnlockStored_Shower": Required[BoolValue],
+        "ShipUnlockStored_Shower": BoolValue,
         "ShipUnlockMoved_Shower": BoolValue,
         "ShipUnlockPos_Shower": VectorValue,
         "ShipUnlockRot_Shower": VectorValue,
-        "ShipUnlockStored_Light switch": Required[BoolValue],
+        "ShipUnlockStored_Light switch": BoolValue,
         "ShipUnlockMoved_Light switch": BoolValue,
         "ShipUnlockPos_Light switch": VectorValue,
         "ShipUnlockRot_Light switch": VectorValue,
-        "ShipUnlockStored_Record player": Required[BoolValue],
+        "ShipUnlockStored_Record player": BoolValue,
         "ShipUnlockMoved_Record player": BoolValue,
         "ShipUnlockPos_Record player": VectorValue,
         "ShipUnlockRot_Record player": VectorValue,
-        "ShipUnlockStored_Table": Required[BoolValue],
+        "ShipUnlockStored_Table": BoolValue,
         "ShipUnlockMoved_Table": BoolValue,
         "ShipUnlockPos_Table": VectorValue,
         "ShipUnlockRot_Table": VectorValue,
-        "ShipUnlockStored_Romantic table": Required[BoolValue],
+        "ShipUnlockStored_Romantic table": BoolValue,
         "ShipUnlockMoved_Romantic table": BoolValue,
         "ShipUnlockPos_Romantic table": VectorValue,
         "ShipUnlockRot_Romantic table": VectorValue,
-        "ShipUnlockStored_Bunkbeds": Required[BoolValue],
+        "ShipUnlockStored_Bunkbeds": BoolValue,
         "ShipUnlockMoved_Bunkbeds": BoolValue,
         "ShipUnlockPos_Bunkbeds": VectorValue,
         "ShipUnlockRot_Bunkbeds": VectorValue,
-        "ShipUnlockStored_Terminal": Required[BoolValue],
+        "ShipUnlockStored_Terminal": BoolValue,
         "ShipUnlockMoved_Terminal": BoolValue,
         "ShipUnlockPos_Terminal": VectorValue,
         "ShipUnlockRot_Terminal": VectorValue,
-        "ShipUnlockStored_Signal translator": Required[BoolValue],
+        "ShipUnlockStored_Signal translator": BoolValue,
         "ShipUnlockMoved_Signal translator": BoolValue,
         "ShipUnlockPos_Signal translator": VectorValue,
         "ShipUnlockRot_Signal translator": VectorValue,
-        "ShipUnlockStored_Loud horn": Required[BoolValue],
+        "ShipUnlockStored_Loud horn": BoolValue,
         "ShipUnlockMoved_Loud horn": BoolValue,
         "ShipUnlockPos_Loud horn": VectorValue,
         "ShipUnlockRot_Loud horn": VectorValue,
-        "ShipUnlockStored_Inverse Teleporter": Required[BoolValue],
+        "ShipUnlockStored_Inverse Teleporter": BoolValue,
         "ShipUnlockMoved_Inverse Teleporter": BoolValue,
         "ShipUnlockPos_Inverse Teleporter": VectorValue,
         "ShipUnlockRot_Inverse Teleporter": VectorValue,
-        "ShipUnlockStored_JackOLantern": Required[BoolValue],
+        "ShipUnlockStored_JackOLantern": BoolValue,
         "ShipUnlockMoved_JackOLantern": BoolValue,
         "ShipUnlockPos_JackOLantern": VectorValue,
         "ShipUnlockRot_JackOLantern": VectorValue,
-        "ShipUnlockStored_Welcome mat": Required[BoolValue],
+        "ShipUnlockStored_Welcome mat": BoolValue,
         "ShipUnlockMoved_Welcome mat": BoolValue,
         "ShipUnlockPos_Welcome mat": VectorValue,
         "ShipUnlockRot_Welcome mat": VectorValue,
-        "ShipUnlockStored_Goldfish": Required[BoolValue],
+        "ShipUnlockStored_Goldfish": BoolValue,
         "ShipUnlockMoved_Goldfish": BoolValue,
         "ShipUnlockPos_Goldfish": VectorValue,
         "ShipUnlockRot_Goldfish": VectorValue,
-        "ShipUnlockStored_Plushie pajama man": Required[BoolValue],
+        "ShipUnlockStored_Plushie pajama man": BoolValue,
         "ShipUnlockMoved_Plushie pajama man": BoolValue,
         "ShipUnlockPos_Plushie pajama man": VectorValue,
         "ShipUnlockRot_Plushie pajama man": VectorValue,
-        "Stats_DaysSpent": Required[IntValue],
-        "Stats_Deaths": Required[IntValue],
-        "Stats_StepsTaken": Required[IntValue],
-        "Stats_ValueCollected": Required[IntValue],
-        "StoryLogs": Required[ArrayIntValue],
-        "UnlockedShipObjects": Required[ArrayIntValue],
+        "Stats_DaysSpent": "Required[IntValue]",
+        "Stats_Deaths": "Required[IntValue]",
+        "Stats_StepsTaken": "Required[IntValue]",
+        "Stats_ValueCollected": IntValue,
+        "StoryLogs": ArrayIntValue,
+        "UnlockedShipObjects": ArrayIntValue,
         "shipGrabbableItemIDs": ArrayIntValue,
         "shipGrabbableItemPos": ArrayVectorValue,
         "shipItemSaveData": ArrayIntValue,
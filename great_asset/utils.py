@@ -22,38 +22,320 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
+from __future__ import annotations
+
 import json
 import os
 import pathlib
 import platform
-from typing import Any, Literal
+import re
+import tempfile
+from concurrent.futures import as_completed
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal, NamedTuple
+
+from .metrics import _start, _stop  # type: ignore[reportPrivateUsage] we allow this here.
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
 
 __all__ = (
     "_to_json",
     "_from_json",
+    "_run_batch",
+    "_write_file",
+    "_iter_bits",
+    "_to_mask",
+    "_MemberScanner",
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonCodec",
+    "get_json_codec",
+    "set_json_codec",
     "MISSING",
     "SaveValue",
+    "DumpProfile",
+    "Durability",
+    "BatchResult",
     "resolve_save_path",
+    "mask_union",
+    "mask_intersection",
+    "popcount",
 )
 
 SaveValue = Literal[1, 2, 3, "1", "2", "3"]
+# "compact" is the smallest output the game still reads, "pretty" is indented with sorted keys,
+# and "sorted" is compact with sorted keys, for stable diffs and hashing.
+DumpProfile = Literal["compact", "pretty", "sorted"]
+# how hard we try to make a write survive a crash or power loss:
+# "none" leaves it to the OS, "file" fsyncs the file and "directory" also fsyncs its directory entry.
+Durability = Literal["none", "file", "directory"]
+
+# only checked for here, orjson itself is imported once the codec is first used
+HAS_ORJSON = find_spec("orjson") is not None
+
+
+class JSONCodec:
+    """
+    The interface for the JSON backends used to (de)serialise file contents.
+
+    Both directions work on :class:`bytes`, as that is what is encrypted and decrypted,
+    so each backend is free to take the cheapest route to and from them.
+    """
+
+    __slots__ = ()
+
+    def loads(self, data: bytes | bytearray | memoryview | str, /) -> Any:
+        """Loads a JSON document into a Python type."""
+        raise NotImplementedError
+
+    def dumps(self, obj: Any, /, *, profile: DumpProfile = "pretty") -> bytes:
+        """Dumps a Python type into a UTF-8 encoded JSON document, formatted as per ``profile``."""
+        raise NotImplementedError
+
+
+class StdlibJSONCodec(JSONCodec):
+    """A :class:`JSONCodec` backed by the standard library :mod:`json` module."""
+
+    __slots__ = ()
+
+    def loads(self, data: bytes | bytearray | memoryview | str, /) -> Any:
+        if isinstance(data, memoryview):
+            # the stdlib doesn't accept arbitrary buffers
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps(self, obj: Any, /, *, profile: DumpProfile = "pretty") -> bytes:
+        indent = 2 if profile == "pretty" else None
+        sort_keys = profile != "compact"
+
+        # the stdlib can only produce `str`, so we have to pay for the encode here
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=True, indent=indent, sort_keys=sort_keys).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """A :class:`JSONCodec` backed by :mod:`orjson`, which reads and writes :class:`bytes` natively."""
+
+    __slots__ = ("_orjson",)
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ModuleNotFoundError:
+            raise RuntimeError("orjson is not installed, please install the `speed` extra to use this codec.") from None
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes | bytearray | memoryview | str, /) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any, /, *, profile: DumpProfile = "pretty") -> bytes:
+        orjson = self._orjson
+        if profile == "pretty":
+            option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        elif profile == "sorted":
+            option = orjson.OPT_SORT_KEYS
+        else:
+            option = None
+
+        return orjson.dumps(obj, option=option)
+
+
+# picked on first use, so the backend is only imported when something is (de)serialised
+_codec: JSONCodec | None = None
+
+
+def _default_codec() -> JSONCodec:
+    global _codec
+    if _codec is None:
+        _codec = OrjsonCodec() if HAS_ORJSON else StdlibJSONCodec()
+    return _codec
+
+
+def get_json_codec() -> JSONCodec:
+    """
+    Returns the JSON backend currently in use.
+
+    Returns
+    --------
+    :class:`JSONCodec`
+    """
+    return _codec or _default_codec()
+
+
+def set_json_codec(codec: JSONCodec, /) -> None:
+    """
+    Sets the JSON backend to use for all (de)serialisation.
+
+    Parameters
+    -----------
+    codec: :class:`JSONCodec`
+        The backend to use.
+    """
+    global _codec
+    _codec = codec
+
+
+def _to_json(obj: Any, /, *, profile: DumpProfile = "pretty") -> bytes:
+    """A quick method that dumps a Python type to a JSON document."""
+    start = _start()
+    encoded = (_codec or _default_codec()).dumps(obj, profile=profile)
+    _stop("serialise", start, len(encoded))
+    return encoded
+
+
+def _from_json(data: bytes | bytearray | memoryview | str, /) -> Any:
+    """A quick method that loads a JSON document into a Python type."""
+    start = _start()
+    loaded = (_codec or _default_codec()).loads(data)
+    _stop("parse", start, len(data))
+    return loaded
+
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING_PATTERN = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_STRING = re.compile(_STRING_PATTERN, re.DOTALL)
+_SCALAR_END = re.compile(rb"[,}\] \t\n\r]")
+# what can be skipped over within a container without tracking how deeply nested it is: anything but strings and
+# brackets, whole strings, and whole containers holding no other containers, such as each vector in an array of them.
+# this leaves only the brackets of nested containers for Python to count.
+# each is written as an "unrolled loop", so a failed match never backtracks more than linearly
+_OTHER = rb'[^"{}\[\]]*'
+_FLAT = rb"[{\[]" + _OTHER + rb"(?:" + _STRING_PATTERN + _OTHER + rb")*[}\]]"
+_SKIP = re.compile(_OTHER + rb"(?:(?:" + _STRING_PATTERN + rb"|" + _FLAT + rb")" + _OTHER + rb")*", re.DOTALL)
+
+
+class _MemberScanner:
+    # Incrementally finds the members of a top level JSON object as its bytes arrive, without parsing the values.
+    # Only the values of wanted keys are kept and copied out, everything else is skipped over with regex matches
+    # and dropped from the buffer as it goes, however large it is.
+
+    __slots__ = ("_buffer", "_depth", "_key", "_pos", "_state", "_value_start", "_wanted")
+
+    def __init__(self, wanted: Iterable[str], /) -> None:
+        self._buffer = bytearray()
+        self._pos = 0
+        # "open" -> "key" -> "colon" -> "value" -> "next" -> "key" ... -> "done"
+        self._state = "open"
+        self._key = ""
+        # where the value being kept started, -1 whilst skipping one
+        self._value_start = -1
+        # how deeply nested the scan of a container value is so far, 0 when not within one
+        self._depth = 0
+        self._wanted = frozenset(wanted)
+
+    @property
+    def done(self) -> bool:
+        return self._state == "done"
 
-try:
-    import orjson
-except ModuleNotFoundError:
+    def feed(self, data: bytes | bytearray | memoryview, /) -> Iterator[tuple[str, bytes | None]]:
+        """Yields each member completed by ``data``, with its raw value if it is wanted and ``None`` otherwise."""
+        buffer = self._buffer
+        # drop everything already scanned, so the buffer only ever holds the member in progress,
+        # and only the start of it when its value is being kept
+        start = self._value_start if self._value_start >= 0 else self._pos
+        if start:
+            del buffer[:start]
+            self._pos -= start
+            if self._value_start >= 0:
+                self._value_start = 0
+        buffer += data
 
-    def _to_json(obj: Any, /) -> str:
-        """A quick method that dumps a Python type to JSON object."""
-        return json.dumps(obj, separators=(",", ":"), ensure_ascii=True, indent=2, sort_keys=True)
+        while self._state != "done":
+            pos = _WHITESPACE.match(buffer, self._pos).end()  # type: ignore # this always matches
+            if pos >= len(buffer):
+                self._pos = pos
+                return
 
-    _from_json = json.loads  # type: ignore # the overloads are too much for our use case.
-else:
+            state = self._state
+            char = buffer[pos]
 
-    def _to_json(obj: Any, /) -> str:
-        """A quick method that dumps a Python type to JSON object."""
-        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode("utf-8")
+            if state == "open":
+                if char != 0x7B:  # {
+                    raise ValueError("The payload is not a JSON object.")
+                self._pos = pos + 1
+                self._state = "key"
+            elif state == "key":
+                if char == 0x7D:  # }
+                    self._state = "done"
+                    return
+                match = _STRING.match(buffer, pos)
+                if match is None:
+                    self._pos = pos
+                    return  # the key isn't complete yet
+                raw = match.group()
+                self._key = raw[1:-1].decode() if b"\\" not in raw else json.loads(raw)
+                self._pos = match.end()
+                self._state = "colon"
+            elif state == "colon":
+                if char != 0x3A:  # :
+                    raise ValueError(f"Expected ':' at offset {pos}.")
+                self._pos = pos + 1
+                self._state = "value"
+            elif state == "value":
+                end = self._value_end(pos)
+                if end is None:
+                    return  # the value isn't complete yet
+                value_start = self._value_start
+                yield self._key, bytes(buffer[value_start:end]) if value_start >= 0 else None
+                self._pos = end
+                self._value_start = -1
+                self._state = "next"
+            else:  # next
+                if char == 0x7D:  # }
+                    self._state = "done"
+                    return
+                if char != 0x2C:  # ,
+                    raise ValueError(f"Expected ',' or '}}' at offset {pos}.")
+                self._pos = pos + 1
+                self._state = "key"
 
-    _from_json = orjson.loads  # type: ignore # this is guarded in an if.
+    def _value_end(self, pos: int, /) -> int | None:
+        buffer = self._buffer
+        depth = self._depth
+
+        if not depth:
+            if self._key in self._wanted:
+                self._value_start = pos
+            char = buffer[pos]
+
+            if char == 0x22:  # "
+                match = _STRING.match(buffer, pos)
+            elif char not in b"{[":
+                match = _SCALAR_END.search(buffer, pos)
+            else:
+                match = None
+                depth = 1
+                pos += 1
+
+            if not depth:
+                if match is None:
+                    # started again from the beginning once more has arrived
+                    self._pos = pos
+                    self._value_start = -1
+                    return None
+                return match.end() if char == 0x22 else match.start()
+
+        # a container, picking up from wherever the last feed got to
+        size = len(buffer)
+        while True:
+            pos = _SKIP.match(buffer, pos).end()  # type: ignore # this always matches
+            if pos >= size:
+                break
+
+            char = buffer[pos]
+            if char == 0x22:  # "
+                break  # a string that isn't complete yet, restarted from its opening quote
+
+            depth += 1 if char in b"{[" else -1
+            pos += 1
+            if not depth:
+                self._depth = 0
+                return pos
+
+        self._depth = depth
+        self._pos = pos
+        return None
 
 
 class _MissingSentinel:
@@ -75,6 +357,198 @@ class _MissingSentinel:
 MISSING: Any = _MissingSentinel()
 
 
+class BatchResult(NamedTuple):
+    """
+    The outcome of a single input within a batch operation.
+
+    Attributes
+    -----------
+    position: :class:`int`
+        The position of the input within the batch.
+    source: Any
+        The input this result was produced from.
+    result: Any
+        The result of the operation, ``None`` if it failed.
+    error: :class:`BaseException` | ``None``
+        The exception raised whilst handling this input, if any.
+    """
+
+    position: int
+    source: Any
+    result: Any
+    error: BaseException | None
+
+
+def _iter_bits(mask: int, /) -> Iterator[int]:
+    # yields the index of each set bit, lowest first, touching only the bits that are set
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _to_mask(ids: Iterable[int], /) -> int:
+    mask = 0
+    for id_ in ids:
+        mask |= 1 << id_
+    return mask
+
+
+def mask_union(masks: Iterable[int], /) -> int:
+    """
+    Combine many bitmasks, such as those from :attr:`~great_asset.SaveFile.unlocked_mask`, into one
+    with every bit that is set in any of them.
+
+    Parameters
+    -----------
+    masks: Iterable[:class:`int`]
+        The masks to combine.
+
+    Returns
+    --------
+    :class:`int`
+    """
+    result = 0
+    for mask in masks:
+        result |= mask
+    return result
+
+
+def mask_intersection(masks: Iterable[int], /) -> int:
+    """
+    Combine many bitmasks into one with only the bits that are set in all of them.
+    An empty iterable results in ``0``.
+
+    Parameters
+    -----------
+    masks: Iterable[:class:`int`]
+        The masks to combine.
+
+    Returns
+    --------
+    :class:`int`
+    """
+    iterator = iter(masks)
+    result = next(iterator, 0)
+    for mask in iterator:
+        result &= mask
+    return result
+
+
+def popcount(mask: int, /) -> int:
+    """
+    Count the bits set within a bitmask, i.e. how many members it holds.
+
+    Parameters
+    -----------
+    mask: :class:`int`
+        The mask to count.
+
+    Returns
+    --------
+    :class:`int`
+    """
+    # int.bit_count is 3.10+
+    return bin(mask).count("1")
+
+
+def _run_batch(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    /,
+    *,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    sources = list(items)
+
+    # we only own (and therefore shut down) the pool if we created it
+    owned = executor is None
+    if executor is None:
+        # imported here as it pulls in multiprocessing, which most uses of the package never need
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool: Executor = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        pool = executor
+
+    try:
+        futures: dict[Future[Any], int] = {pool.submit(func, source): idx for idx, source in enumerate(sources)}
+
+        for future in futures if ordered else as_completed(futures):
+            idx = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:
+                yield BatchResult(idx, sources[idx], None, exc)
+            else:
+                yield BatchResult(idx, sources[idx], result, None)
+    finally:
+        if owned:
+            pool.shutdown(wait=True)
+
+
+def _fsync_directory(path: pathlib.Path, /) -> None:
+    if os.name == "nt":
+        return  # Windows doesn't let us open a directory to flush it
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _create_temp_file(path: pathlib.Path, /) -> tuple[int, pathlib.Path]:
+    # a sibling of `path`, so the rename is atomic. unlike `tempfile.mkstemp`, which makes the file owner-only,
+    # this leaves the kernel to apply the umask just as `open` does, without reading or changing it
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    for _ in range(tempfile.TMP_MAX):
+        temp_path = path.with_name(f".{path.name}.{os.urandom(4).hex()}.tmp")
+        try:
+            return os.open(temp_path, flags, 0o666), temp_path
+        except FileExistsError:
+            continue
+
+    raise FileExistsError(f"No unused temporary file name was found next to {path}.")
+
+
+def _write_file(path: pathlib.Path, data: bytes, /, *, atomic: bool = True, durability: Durability = "none") -> None:
+    start = _start()
+
+    if not atomic:
+        with path.open("wb") as fp:
+            fp.write(data)
+            if durability != "none":
+                fp.flush()
+                os.fsync(fp.fileno())
+    else:
+        fd, temp_path = _create_temp_file(path)
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(data)
+                if durability != "none":
+                    fp.flush()
+                    os.fsync(fp.fileno())
+
+            # keep the permissions of the file we replace, a new file already has the ones `open` would give it
+            try:
+                temp_path.chmod(path.stat().st_mode)
+            except FileNotFoundError:
+                pass
+
+            temp_path.replace(path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    if durability == "directory":
+        _fsync_directory(path.parent)
+
+    _stop("write", start, len(data))
+
+
 def resolve_save_path(save_number: SaveValue, /) -> pathlib.Path:
     if platform.system() != "Windows":
         raise NotImplementedError("Currently we don't support non-Windows yet.")
@@ -23,8 +23,9 @@ DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
 
-from random import choice, uniform
-from typing import TYPE_CHECKING
+from array import array
+from random import choice, choices, random, uniform
+from typing import TYPE_CHECKING, Any, overload
 
 TOP_SHELF = 2.5
 UPPER_SHELF = 2.0
@@ -33,12 +34,39 @@ BOTTOM_SHELF = 1.0
 SHELVES = [TOP_SHELF, UPPER_SHELF, LOWER_SHELF, BOTTOM_SHELF]
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
     from .types_.save_file import InnerVectorValue, VectorValue
 
-__all__ = ("Vector",)
+__all__ = (
+    "Vector",
+    "VectorArray",
+)
+
+_numpy: Any = None
+
+
+def _import_numpy() -> Any:
+    # numpy is optional and heavy to import, so we only reach for it when it's actually used
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy  # pyright: ignore[reportMissingImports] # optional, and not a dependency
+        except ModuleNotFoundError:
+            _numpy = False
+        else:
+            _numpy = numpy
+
+    return _numpy
 
 
 class Vector:
+    __slots__ = (
+        "x",
+        "y",
+        "z",
+    )
+
     def __init__(self, x: float, y: float, z: float) -> None:
         self.x: float = float(x)
         self.y: float = float(y)
@@ -64,7 +92,247 @@ class Vector:
 
     @classmethod
     def from_dict(cls, payload: InnerVectorValue) -> Vector:
-        return cls(**payload)
+        return cls(payload["x"], payload["y"], payload["z"])
 
     def serialise(self) -> InnerVectorValue:
         return {"x": self.x, "y": self.y, "z": self.z}
+
+
+class VectorArray:
+    """
+    A packed array of vectors, stored contiguously as ``x, y, z`` doubles.
+
+    This avoids a Python object per position, and supports bulk operations over every vector at once.
+    These use NumPy when it is installed, and plain :class:`array.array` operations when it isn't.
+
+    Parameters
+    -----------
+    data: Iterable[:class:`float`]
+        Flat ``x, y, z`` triplets to initialise the array with.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Iterable[float] = (), /) -> None:
+        self._data: array[float] = array("d", data)
+        if len(self._data) % 3:
+            raise ValueError("VectorArray data must be made of x, y, z triplets.")
+
+    def __repr__(self) -> str:
+        return f"<VectorArray len={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self._data) // 3
+
+    @overload
+    def __getitem__(self, idx: int, /) -> Vector: ...
+
+    @overload
+    def __getitem__(self, idx: slice, /) -> VectorArray: ...
+
+    def __getitem__(self, idx: int | slice, /) -> Vector | VectorArray:
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            if step != 1:
+                raise ValueError("VectorArray does not support stepped slices.")
+            return VectorArray(self._data[start * 3 : stop * 3])
+
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("VectorArray index out of range")
+
+        offset = idx * 3
+        return Vector(self._data[offset], self._data[offset + 1], self._data[offset + 2])
+
+    def __iter__(self) -> Iterator[Vector]:
+        data = self._data
+        for offset in range(0, len(data), 3):
+            yield Vector(data[offset], data[offset + 1], data[offset + 2])
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, VectorArray) and self._data == other._data
+
+    __hash__ = None  # type: ignore # mutable, like list
+
+    @classmethod
+    def from_dicts(cls, payloads: Iterable[InnerVectorValue], /) -> VectorArray:
+        """
+        Create the array from the ``{"x", "y", "z"}`` mappings used within the save file.
+
+        Parameters
+        -----------
+        payloads: Iterable[dict[:class:`str`, :class:`float`]]
+            The positions to pack.
+        """
+        return cls(axis for payload in payloads for axis in (payload["x"], payload["y"], payload["z"]))
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector], /) -> VectorArray:
+        """
+        Create the array from :class:`Vector` instances.
+
+        Parameters
+        -----------
+        vectors: Iterable[:class:`Vector`]
+            The vectors to pack.
+        """
+        return cls(axis for vector in vectors for axis in (vector.x, vector.y, vector.z))
+
+    @classmethod
+    def random_in_box(
+        cls, count: int, lower: Vector, upper: Vector, /, *, heights: Sequence[float] | None = None
+    ) -> VectorArray:
+        """
+        Generate ``count`` random positions within a box in one batched pass.
+
+        Parameters
+        -----------
+        count: :class:`int`
+            The amount of positions to generate.
+        lower: :class:`Vector`
+            One corner of the box.
+        upper: :class:`Vector`
+            The opposite corner of the box.
+        heights: Sequence[:class:`float`] | ``None``
+            If given, each ``y`` is picked from these values (such as shelves) instead of between the corners.
+        """
+        numpy = _import_numpy()
+        if numpy:
+            rng = numpy.random.default_rng()
+            positions = rng.uniform((lower.x, lower.y, lower.z), (upper.x, upper.y, upper.z), size=(count, 3))
+            if heights:
+                positions[:, 1] = rng.choice(heights, size=count)
+
+            result = cls()
+            result._data.frombytes(positions.astype(numpy.float64).tobytes())
+            return result
+
+        data = array("d", bytes(8 * 3 * count))
+        for axis, low, high in ((0, lower.x, upper.x), (1, lower.y, upper.y), (2, lower.z, upper.z)):
+            if axis == 1 and heights:
+                data[1::3] = array("d", choices(heights, k=count))
+                continue
+
+            span = high - low
+            data[axis::3] = array("d", [low + span * random() for _ in range(count)])
+
+        return cls(data)
+
+    @classmethod
+    def in_cupboard(cls, count: int, /, cupboard_position: VectorValue | None = None) -> VectorArray:
+        """
+        Generate ``count`` random positions on the cupboard shelves in one batched pass,
+        as :meth:`Vector.in_cupboard` does for a single position.
+
+        Parameters
+        -----------
+        count: :class:`int`
+            The amount of positions to generate.
+        cupboard_position: dict | ``None``
+            The position of the cupboard from the save file, if it has been moved.
+        """
+        if cupboard_position:
+            position = Vector.from_dict(cupboard_position["value"])
+            lower = Vector(position.x - 0.5, BOTTOM_SHELF, position.z - 0.5)
+            upper = Vector(position.x, TOP_SHELF, position.z)
+        else:
+            lower = Vector(-3.5, BOTTOM_SHELF, -12.5)
+            upper = Vector(-3.0, TOP_SHELF, -12)
+
+        return cls.random_in_box(count, lower, upper, heights=SHELVES)
+
+    def to_dicts(self) -> list[InnerVectorValue]:
+        """
+        Unpack the array into the ``{"x", "y", "z"}`` mappings used within the save file.
+
+        Returns
+        --------
+        list[dict[:class:`str`, :class:`float`]]
+        """
+        data = self._data
+        return [{"x": data[offset], "y": data[offset + 1], "z": data[offset + 2]} for offset in range(0, len(data), 3)]
+
+    def append(self, vector: Vector, /) -> None:
+        self._data.extend((vector.x, vector.y, vector.z))
+
+    def extend(self, vectors: VectorArray | Iterable[Vector], /) -> None:
+        if isinstance(vectors, VectorArray):
+            self._data.extend(vectors._data)
+        else:
+            self._data.extend(axis for vector in vectors for axis in (vector.x, vector.y, vector.z))
+
+    def as_memoryview(self) -> memoryview[float]:
+        """
+        A zero-copy view over the packed doubles.
+
+        Returns
+        --------
+        :class:`memoryview`
+        """
+        return memoryview(self._data)
+
+    def as_numpy(self) -> Any:
+        """
+        A zero-copy NumPy view of the array, shaped ``(len, 3)``. Writes through the view change this array.
+
+        Raises
+        -------
+        RuntimeError
+            NumPy is not installed.
+
+        Returns
+        --------
+        :class:`numpy.ndarray`
+        """
+        numpy = _import_numpy()
+        if not numpy:
+            raise RuntimeError("NumPy is required for this, please install it.")
+
+        return numpy.frombuffer(self._data, dtype=numpy.float64).reshape(-1, 3)
+
+    def translate(self, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> None:
+        """
+        Move every vector in place by the given offsets.
+
+        Parameters
+        -----------
+        x: :class:`float`
+            The offset along the x axis.
+        y: :class:`float`
+            The offset along the y axis.
+        z: :class:`float`
+            The offset along the z axis.
+        """
+        if not self._data:
+            return
+
+        if _import_numpy():
+            self.as_numpy()[:] += (x, y, z)
+            return
+
+        data = self._data
+        for axis, offset in enumerate((x, y, z)):
+            if offset:
+                data[axis::3] = array("d", [value + offset for value in data[axis::3]])
+
+    def bounds(self) -> tuple[Vector, Vector]:
+        """
+        The axis-aligned bounding box containing every vector.
+
+        Raises
+        -------
+        ValueError
+            The array is empty.
+
+        Returns
+        --------
+        tuple[:class:`Vector`, :class:`Vector`]
+            The minimum and maximum corners.
+        """
+        if not self._data:
+            raise ValueError("An empty VectorArray has no bounds.")
+
+        data = self._data
+        axes = (data[0::3], data[1::3], data[2::3])
+        return Vector(*(min(axis) for axis in axes)), Vector(*(max(axis) for axis in axes))
@@ -0,0 +1,298 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from fnmatch import fnmatchcase
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, Tuple, Type, Union
+
+from .save_file import ChallengeFile, ConfigFile, SaveFile, _run_blocking  # type: ignore[reportPrivateUsage] we allow this here.
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
+    from concurrent.futures import Executor
+    from os import PathLike
+
+__all__ = (
+    "DEFAULT_PATTERNS",
+    "ChangeKind",
+    "FileState",
+    "SaveEvent",
+    "SaveWatcher",
+)
+
+AnySaveFile = Union[SaveFile, ConfigFile, ChallengeFile]
+ChangeKind = Literal["added", "modified", "removed"]
+Patterns = Tuple[Tuple[str, Type[AnySaveFile]], ...]
+
+# the files the game writes, and the class each is loaded as
+DEFAULT_PATTERNS: Patterns = (
+    ("LCSaveFile*", SaveFile),
+    ("LCChallengeFile*", ChallengeFile),
+    ("LCGeneralSaveData", ConfigFile),
+)
+
+
+class FileState(NamedTuple):
+    """
+    What a file looked like on disk when it was last seen, a change to any of these means it has to be reloaded.
+
+    Attributes
+    -----------
+    mtime_ns: :class:`int`
+        The modification time of the file, in nanoseconds.
+    size: :class:`int`
+        The size of the file, in bytes.
+    inode: :class:`int`
+        The inode of the file, which changes when a file is replaced rather than written to in place.
+    """
+
+    mtime_ns: int
+    size: int
+    inode: int
+
+
+class SaveEvent(NamedTuple):
+    """
+    A change to a file within a watched directory.
+
+    Attributes
+    -----------
+    kind: Literal[``"added"``, ``"modified"``, ``"removed"``]
+        What happened to the file.
+    path: :class:`~pathlib.Path`
+        The path of the file.
+    file: :class:`~great_asset.SaveFile` | :class:`~great_asset.ConfigFile` | :class:`~great_asset.ChallengeFile` | ``None``
+        The newly loaded file, ``None`` if it was removed or failed to load.
+    error: :class:`BaseException` | ``None``
+        The exception raised whilst loading the file, if any.
+    """
+
+    kind: ChangeKind
+    path: Path
+    file: AnySaveFile | None
+    error: BaseException | None
+
+
+def _scan(directory: Path, patterns: Patterns, /) -> dict[Path, tuple[FileState, type[AnySaveFile]]]:
+    # a single directory listing and a stat per matching file, this is all a poll costs when nothing has changed
+    found: dict[Path, tuple[FileState, type[AnySaveFile]]] = {}
+
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return found
+
+    for entry in entries:
+        cls = next((cls for pattern, cls in patterns if fnmatchcase(entry.name, pattern)), None)
+        if cls is None:
+            continue
+
+        try:
+            if not entry.is_file():
+                continue
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue  # removed since the listing
+
+        found[Path(entry.path)] = (FileState(stat.st_mtime_ns, stat.st_size, stat.st_ino), cls)
+
+    return found
+
+
+class SaveWatcher:
+    """
+    Watches a directory of save files, only reloading the files that have changed since they were last seen.
+
+    The latest version of every file is kept in :attr:`files`, each poll only costs a ``stat`` per file
+    unless one has changed.
+
+    Parameters
+    -----------
+    directory: :class:`~pathlib.Path` | :class:`str`
+        The directory to watch, such as the parent of :func:`~great_asset.utils.resolve_save_path`.
+    patterns: Sequence[tuple[:class:`str`, type]] | ``None``
+        Pairs of a file name pattern and the class to load matching files as, the first match wins.
+        Defaults to :data:`DEFAULT_PATTERNS`.
+    """
+
+    __slots__ = (
+        "_directory",
+        "_files",
+        "_patterns",
+        "_states",
+    )
+
+    def __init__(
+        self,
+        directory: Path | PathLike[Any] | str,
+        /,
+        *,
+        patterns: Sequence[tuple[str, type[AnySaveFile]]] | None = None,
+    ) -> None:
+        self._directory: Path = Path(directory)
+        self._patterns: Patterns = DEFAULT_PATTERNS if patterns is None else tuple(patterns)
+        self._states: dict[Path, FileState] = {}
+        self._files: dict[Path, AnySaveFile] = {}
+
+    def __repr__(self) -> str:
+        return f"<SaveWatcher directory={str(self._directory)!r} files={len(self._files)}>"
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def files(self) -> Mapping[Path, AnySaveFile]:
+        """
+        A read-only view of the latest successfully loaded version of each file, by path.
+
+        Returns
+        --------
+        Mapping[:class:`~pathlib.Path`, :class:`~great_asset.SaveFile` | :class:`~great_asset.ConfigFile` | :class:`~great_asset.ChallengeFile`]
+        """
+        return MappingProxyType(self._files)
+
+    def state(self, path: Path, /) -> FileState | None:
+        """
+        Get what a file looked like when it was last seen, ``None`` if it hasn't been seen.
+
+        Parameters
+        -----------
+        path: :class:`~pathlib.Path`
+            The path of the file.
+        """
+        return self._states.get(path)
+
+    def _diff(
+        self, found: dict[Path, tuple[FileState, type[AnySaveFile]]], /
+    ) -> tuple[list[tuple[ChangeKind, Path, type[AnySaveFile]]], list[SaveEvent]]:
+        changed: list[tuple[ChangeKind, Path, type[AnySaveFile]]] = []
+        for path, (state, cls) in found.items():
+            previous = self._states.get(path)
+            if previous != state:
+                # recorded before the file is read, so a write during the load is picked up on the next poll
+                self._states[path] = state
+                changed.append(("added" if previous is None else "modified", path, cls))
+
+        removed: list[SaveEvent] = []
+        for path in [path for path in self._states if path not in found]:
+            del self._states[path]
+            self._files.pop(path, None)
+            removed.append(SaveEvent("removed", path, None, None))
+
+        return changed, removed
+
+    def _loaded(self, kind: ChangeKind, path: Path, file: AnySaveFile | None, error: BaseException | None, /) -> SaveEvent:
+        if file is not None:
+            self._files[path] = file
+        return SaveEvent(kind, path, file, error)
+
+    def poll(self) -> list[SaveEvent]:
+        """
+        Check the directory once, reloading the files that have changed.
+
+        A file that fails to load, e.g. because it is part way through being written, keeps its previous version
+        within :attr:`files` and is reported with the error.
+
+        Returns
+        --------
+        list[:class:`SaveEvent`]
+            The changes found, which is empty if nothing has changed.
+        """
+        changed, events = self._diff(_scan(self._directory, self._patterns))
+
+        for kind, path, cls in changed:
+            try:
+                file = cls.from_path(path)
+            except Exception as exc:
+                events.append(self._loaded(kind, path, None, exc))
+            else:
+                events.append(self._loaded(kind, path, file, None))
+
+        return events
+
+    async def async_poll(self, *, executor: Executor | None = None) -> list[SaveEvent]:
+        """
+        The asynchronous version of :meth:`poll`, the directory scan and any reloads are run on an executor.
+
+        Parameters
+        -----------
+        executor: :class:`~concurrent.futures.Executor` | ``None``
+            The executor to run the work on, overriding the one set with :func:`~great_asset.save_file.set_async_executor`.
+
+        Returns
+        --------
+        list[:class:`SaveEvent`]
+            The changes found, which is empty if nothing has changed.
+        """
+        found = await _run_blocking(executor, _scan, self._directory, self._patterns)
+        changed, events = self._diff(found)
+
+        results = await asyncio.gather(
+            *(cls.async_from_path(path, executor=executor) for _, path, cls in changed), return_exceptions=True
+        )
+        for (kind, path, _), result in zip(changed, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                events.append(self._loaded(kind, path, None, result))
+            else:
+                events.append(self._loaded(kind, path, result, None))
+
+        return events
+
+    def watch(self, interval: float = 1.0) -> Iterator[SaveEvent]:
+        """
+        Poll the directory forever, yielding each change as it is found.
+
+        Parameters
+        -----------
+        interval: :class:`float`
+            The seconds to wait between polls. Defaults to ``1.0``.
+        """
+        while True:
+            yield from self.poll()
+            time.sleep(interval)
+
+    async def async_watch(self, interval: float = 1.0, *, executor: Executor | None = None) -> AsyncIterator[SaveEvent]:
+        """
+        The asynchronous version of :meth:`watch`.
+
+        Parameters
+        -----------
+        interval: :class:`float`
+            The seconds to wait between polls. Defaults to ``1.0``.
+        executor: :class:`~concurrent.futures.Executor` | ``None``
+            The executor to run the work on, overriding the one set with :func:`~great_asset.save_file.set_async_executor`.
+        """
+        while True:
+            for event in await self.async_poll(executor=executor):
+                yield event
+            await asyncio.sleep(interval)
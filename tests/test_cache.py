@@ -0,0 +1,149 @@
+# pyright: reportPrivateUsage=false
+# this is okay in tests
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from great_asset import SaveFile, save_file
+from great_asset.cache import PayloadCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+BASE_PATH = Path(__file__).parent / "save_files"
+
+
+@pytest.fixture
+def cache() -> Iterator[PayloadCache]:
+    cache = PayloadCache()
+    save_file.set_payload_cache(cache)
+    try:
+        yield cache
+    finally:
+        save_file.set_payload_cache(None)
+
+
+def test_identical_files_decrypt_once(cache: PayloadCache) -> None:
+    first = SaveFile.from_path(BASE_PATH / "LCSaveFile1")
+    second = SaveFile.from_path(BASE_PATH / "LCSaveFile1")
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+    assert first._inner_data == second._inner_data
+    assert first._inner_data is not second._inner_data
+
+
+def test_copy_on_write(cache: PayloadCache) -> None:
+    first = SaveFile.from_path(BASE_PATH / "LCSaveFile1")
+    credits = first.credits
+
+    first.update_credits(credits + 100)
+    first.unlock_all_ship_upgrades()
+    first.write()
+
+    second = SaveFile.from_path(BASE_PATH / "LCSaveFile1")
+    assert second.credits == credits
+    assert second.modified_keys == frozenset()
+
+
+def test_eviction() -> None:
+    data = (BASE_PATH / "LCSaveFile1").read_bytes()
+    cache = PayloadCache(max_bytes=len(data) + 10)
+
+    cache.put(data, {"a": 1})
+    cache.put(data + b"\0", {"b": 2})
+
+    assert cache.get(data) is None
+    assert cache.get(data + b"\0") == {"b": 2}
+    assert cache.info().current_bytes == len(data) + 1
+
+
+def test_disk_tier(tmp_path: Path) -> None:
+    data = (BASE_PATH / "LCSaveFile2").read_bytes()
+
+    PayloadCache(directory=tmp_path).load(data, lambda _: {"value": [1, 2, 3]})
+
+    cache = PayloadCache(directory=tmp_path)
+    assert cache.get(data) == {"value": [1, 2, 3]}
+    assert cache.info().disk_hits == 1
+
+    cache.clear(disk=True)
+    assert cache.get(data) is None
+
+
+def test_load_many_deduplicates(cache: PayloadCache, tmp_path: Path) -> None:
+    paths: list[Path] = []
+    for idx in range(6):
+        path = tmp_path / f"LCSaveFile{idx}"
+        shutil.copy(BASE_PATH / f"LCSaveFile{idx % 2 + 1}", path)
+        paths.append(path)
+    paths.append(tmp_path / "missing")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(SaveFile.load_many(paths, executor=executor))
+
+    assert [result.position for result in results] == list(range(7))
+    assert all(result.error is None for result in results[:6])
+    assert isinstance(results[6].error, FileNotFoundError)
+    assert results[0].result.credits == results[2].result.credits
+    assert cache.info().entries == 2
+
+    # the second time around every file is answered from the cache
+    assert all(result.error is None for result in SaveFile.load_many(paths[:6]))
+    assert cache.info().hits == 6
+
+
+def test_load_many_hashes_each_file_once(cache: PayloadCache, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    paths = [tmp_path / "LCSaveFile1", tmp_path / "LCSaveFile2", tmp_path / "LCSaveFile3"]
+    shutil.copy(BASE_PATH / "LCSaveFile1", paths[0])
+    shutil.copy(BASE_PATH / "LCSaveFile1", paths[1])
+    paths[2].write_bytes(b"not a save file")
+
+    hashed: list[bytes] = []
+    key = PayloadCache.key
+
+    def counting_key(data: bytes, /) -> bytes:
+        hashed.append(data)
+        return key(data)
+
+    monkeypatch.setattr(PayloadCache, "key", staticmethod(counting_key))
+    results = list(SaveFile.load_many(paths, max_workers=1))
+
+    assert len(hashed) == 3
+    assert [result.error is None for result in results] == [True, True, False]
+    assert cache.info().entries == 1
+
+
+def test_async_load_keeps_the_cache_off_the_loop(cache: PayloadCache, monkeypatch: pytest.MonkeyPatch) -> None:
+    threads: list[threading.Thread] = []
+    get, put = PayloadCache.get, PayloadCache.put
+
+    def tracked_get(self: PayloadCache, data: bytes) -> Any:
+        threads.append(threading.current_thread())
+        return get(self, data)
+
+    def tracked_put(self: PayloadCache, data: bytes, payload: Any) -> None:
+        threads.append(threading.current_thread())
+        put(self, data, payload)
+
+    monkeypatch.setattr(PayloadCache, "get", tracked_get)
+    monkeypatch.setattr(PayloadCache, "put", tracked_put)
+
+    async def main() -> None:
+        for _ in range(2):
+            await SaveFile.async_from_path(BASE_PATH / "LCSaveFile1")
+
+    asyncio.run(main())
+
+    # a miss then a hit
+    assert len(threads) == 3
+    assert threading.main_thread() not in threads
+    assert cache.info().hits == 1
@@ -0,0 +1,184 @@
+# pyright: reportPrivateUsage=false
+# this is okay in tests
+
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from great_asset import CRYPTO_PASSWORD, SaveFile
+from great_asset.crypt import (
+    clear_key_cache,
+    decrypt,
+    decrypt_into,
+    decrypt_many,
+    decrypt_stream,
+    encrypt,
+    encrypt_many,
+    iter_decrypt,
+    key_cache_info,
+    peek,
+)
+from great_asset.utils import _MemberScanner
+
+BASE_PATH = Path(__file__).parent
+SAVE_PATH = BASE_PATH / "save_files/LCSaveFile1"
+
+
+class TestKeyCache:
+    def test_repeated_loads_hit_cache(self) -> None:
+        clear_key_cache()
+
+        SaveFile.from_path(SAVE_PATH)
+        assert key_cache_info().misses == 1
+
+        SaveFile.from_path(SAVE_PATH)
+        info = key_cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_written_file_reuses_key(self, tmp_path: Path) -> None:
+        save = SaveFile.from_path(SAVE_PATH)
+        save.update_credits(1)
+
+        output = tmp_path / "LCSaveFile1"
+        save.write(path=output)
+
+        hits = key_cache_info().hits
+        assert SaveFile.from_path(output).credits == 1
+        assert key_cache_info().hits == hits + 1
+
+
+class TestBatch:
+    def test_decrypt_many_reports_errors(self) -> None:
+        sources = [SAVE_PATH, b"not a save file at all", SAVE_PATH.read_bytes()]
+
+        results = list(decrypt_many(sources, password=CRYPTO_PASSWORD, max_workers=2))
+
+        assert [result.position for result in results] == [0, 1, 2]
+        assert results[0].error is None
+        assert results[0].result["GroupCredits"]["value"] == 1605
+        assert isinstance(results[1].error, ValueError)
+        assert results[2].result == results[0].result
+
+    def test_encrypt_many_round_trip(self) -> None:
+        results = list(encrypt_many([b'{"a": 1}', b'{"b": 2}'], password=CRYPTO_PASSWORD, max_workers=2))
+
+        assert [decrypt(data=result.result, password=CRYPTO_PASSWORD) for result in results] == [{"a": 1}, {"b": 2}]
+
+    def test_load_many(self) -> None:
+        paths = [SAVE_PATH, BASE_PATH / "save_files/LCSaveFile2", BASE_PATH / "save_files/missing"]
+
+        results = list(SaveFile.load_many(paths, max_workers=2, ordered=False))
+
+        assert sorted(result.position for result in results) == [0, 1, 2]
+        by_index = {result.position: result for result in results}
+        assert by_index[0].result.credits == 1605
+        assert by_index[1].result.credits == 585
+        assert isinstance(by_index[2].error, FileNotFoundError)
+
+
+class TestStreaming:
+    @pytest.mark.parametrize("chunk_size", [16, 100, 4096, 1 << 20])
+    def test_stream_matches_decrypt(self, chunk_size: int) -> None:
+        expected = decrypt(path=SAVE_PATH, password=CRYPTO_PASSWORD)
+
+        with SAVE_PATH.open("rb") as fp:
+            assert decrypt_stream(fp, password=CRYPTO_PASSWORD, chunk_size=chunk_size) == expected
+
+        view = memoryview(SAVE_PATH.read_bytes())
+        assert decrypt_stream(view, password=CRYPTO_PASSWORD, chunk_size=chunk_size) == expected
+
+    def test_stream_rejects_truncated_data(self) -> None:
+        data = SAVE_PATH.read_bytes()
+
+        with pytest.raises(ValueError):
+            b"".join(iter_decrypt(data[:-5], password=CRYPTO_PASSWORD))
+
+
+class TestDecryptInto:
+    def test_in_place(self) -> None:
+        data = SAVE_PATH.read_bytes()
+        buffer = bytearray(data)
+
+        assert decrypt_into(buffer, password=CRYPTO_PASSWORD) == decrypt(data=data, password=CRYPTO_PASSWORD)
+        assert buffer[:16] == data[:16]
+        assert buffer[16:] != data[16:]
+
+    def test_rejects_readonly(self) -> None:
+        with pytest.raises(TypeError):
+            decrypt_into(memoryview(SAVE_PATH.read_bytes()), password=CRYPTO_PASSWORD)
+
+    def test_rejects_bad_padding(self) -> None:
+        buffer = bytearray(encrypt(data=b"{}", password=CRYPTO_PASSWORD))
+        buffer[-1] ^= 0xFF
+
+        with pytest.raises(ValueError):
+            decrypt_into(buffer, password=CRYPTO_PASSWORD)
+
+
+class _Unseekable(io.BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+
+class TestPeek:
+    @pytest.mark.parametrize("chunk_size", [16, 100, 1024])
+    def test_matches_decrypt(self, chunk_size: int) -> None:
+        data = SAVE_PATH.read_bytes()
+        full = decrypt(data=data, password=CRYPTO_PASSWORD)
+
+        assert peek(data, full.keys(), password=CRYPTO_PASSWORD, chunk_size=chunk_size) == full
+        assert peek(data, ["GroupCredits", "Missing"], password=CRYPTO_PASSWORD, chunk_size=chunk_size) == {
+            "GroupCredits": full["GroupCredits"]
+        }
+
+    def test_stops_early(self) -> None:
+        data = SAVE_PATH.read_bytes()
+        source = io.BytesIO(data)
+
+        result = peek(source, ["DeadlineTime"], password=CRYPTO_PASSWORD, chunk_size=64)
+
+        assert result == {"DeadlineTime": {"__type": "int", "value": 3240}}
+        assert source.tell() < len(data) // 4
+
+    def test_tricky_json(self) -> None:
+        payload: dict[str, Any] = {
+            "a": {"b": ["}", '\\"]', {"c": [[], {}]}]},
+            'd"e': "x",
+            "f": -1.5e3,
+            "g": None,
+            "h": [True],
+        }
+        data = encrypt(data=json.dumps(payload, indent=2).encode(), password=CRYPTO_PASSWORD)
+
+        assert peek(data, payload.keys(), password=CRYPTO_PASSWORD, chunk_size=16) == payload
+
+    # a pipe can't be seeked back once read from, so it is scanned to the end rather than parsed in full
+    @pytest.mark.parametrize("wrap", [bytes, io.BytesIO, _Unseekable])
+    def test_unsorted_large_save(self, wrap: Callable[[bytes], Any]) -> None:
+        # the game writes the item arrays first, so the key we want comes after all of them
+        items = [{"x": i, "y": 0.5, "z": -1.0} for i in range(5000)]
+        payload: dict[str, Any] = {"shipGrabbableItemPos": items, "shipScrapValues": list(range(5000)), "GroupCredits": 60}
+        data = encrypt(data=json.dumps(payload).encode(), password=CRYPTO_PASSWORD)
+
+        assert peek(wrap(data), ["GroupCredits", "Missing"], password=CRYPTO_PASSWORD) == {"GroupCredits": 60}
+
+    def test_skipped_values_arent_buffered(self) -> None:
+        scanner = _MemberScanner(["b"])
+        plaintext = json.dumps({"a": [{"x": [i, "]"]} for i in range(5000)], "b": [1, 2]}).encode()
+
+        members: list[tuple[str, bytes | None]] = []
+        largest = 0
+        for offset in range(0, len(plaintext), 1000):
+            members += scanner.feed(plaintext[offset : offset + 1000])
+            largest = max(largest, len(scanner._buffer))
+
+        assert members == [("a", None), ("b", b"[1, 2]")]
+        assert scanner.done
+        assert largest < 2000
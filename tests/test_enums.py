@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from great_asset import BestiaryEntry, ExtraUnlock, Item, Moon, Scrap, ShipUnlock
+from great_asset.utils import mask_intersection, mask_union, popcount
+
+
+class TestLookups:
+    def test_from_id(self) -> None:
+        assert Item.from_id(10) is Item.shovel
+        assert Scrap.from_id(7) is Scrap.apparatus
+        assert Moon.from_id(8) is Moon.titan
+        assert ShipUnlock.from_id(5) is ShipUnlock.teleporter
+        assert ShipUnlock.from_id(6) is ShipUnlock.television
+
+    def test_unknown_ids_do_not_raise(self) -> None:
+        assert Item.from_id(7) is None
+        assert Item.from_id(-1) is None
+        assert Scrap.from_id(10_000) is None
+        assert Item.from_ids([1, 7, 10, 99, -3]) == [Item.boom_box, Item.shovel]
+
+    def test_from_name(self) -> None:
+        assert BestiaryEntry.from_name("slime") is BestiaryEntry.hygroderes
+        assert Item.from_name("not_an_item") is None
+        assert ShipUnlock.from_serialised_name("Inverse Teleporter") is ShipUnlock.inverse_teleporter
+
+    def test_ship_unlock_keys(self) -> None:
+        assert ShipUnlock.teleporter.stored_key == "ShipUnlockStored_Teleporter"
+        assert ShipUnlock.cupboard.position_key == "ShipUnlockPos_Cupboard"
+        assert ShipUnlock.tv.rotation_key == "ShipUnlockRot_Television"
+        assert ShipUnlock.goldfish.moved_key == "ShipUnlockMoved_Goldfish"
+
+    def test_tables_cover_every_member(self) -> None:
+        for enum in (Item, Scrap, Moon, BestiaryEntry):
+            assert all(enum.from_id(member.value) is member for member in enum)
+
+
+def test_masks() -> None:
+    mask = ShipUnlock.to_mask([ShipUnlock.teleporter, ShipUnlock.goldfish])
+
+    assert mask == (1 << 5) | (1 << 22)
+    assert ShipUnlock.from_mask(mask | (1 << 1)) == [ShipUnlock.teleporter, ShipUnlock.goldfish]
+    assert popcount(ExtraUnlock.to_mask()) == len(ExtraUnlock)
+    assert mask_union([ShipUnlock.teleporter.bit, ShipUnlock.goldfish.bit]) == mask
+    assert mask_intersection([mask, ShipUnlock.goldfish.bit | 1]) == ShipUnlock.goldfish.bit
+    assert mask_intersection([]) == 0
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+
+def imported_modules(code: str) -> dict[str, int]:
+    # `-X importtime` reports every module imported, and the microseconds spent on it including its own imports
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import great_asset",
+        "import great_asset; great_asset.ShipUnlock; great_asset.Vector",
+    ],
+)
+def test_import_is_lazy(code: str) -> None:
+    modules = imported_modules(code)
+
+    for heavy in ("Crypto", "orjson", "multiprocessing", "asyncio", "great_asset.save_file", "great_asset.crypt"):
+        assert heavy not in modules, f"{heavy} was imported by {code!r}"
+
+
+def test_backends_load_on_first_use() -> None:
+    modules = imported_modules("from great_asset import SaveFile")
+
+    assert "great_asset.crypt" in modules
+    assert "multiprocessing" not in modules
+    assert "asyncio" not in modules
+    assert "orjson" not in modules
+
+
+def test_lazy_attributes() -> None:
+    import great_asset
+    from great_asset.save_file import SaveFile
+
+    assert great_asset.SaveFile is SaveFile
+    assert great_asset.save_file.SaveFile is SaveFile
+    assert "SaveFile" in dir(great_asset)
+
+    with pytest.raises(AttributeError):
+        great_asset.NotAThing  # the access is the test
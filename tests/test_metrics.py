@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from great_asset import SaveFile
+from great_asset.metrics import Metrics, Trace, get_recorder, recording
+
+BASE_PATH = Path(__file__).parent / "save_files"
+
+
+def test_disabled_by_default() -> None:
+    assert get_recorder() is None
+
+
+def test_trace_load_and_write(tmp_path: Path) -> None:
+    with recording(Trace()) as trace:
+        save = SaveFile.from_path(BASE_PATH / "LCSaveFile1")
+        save.update_credits(1)
+        save.write(path=tmp_path / "LCSaveFile1")
+
+    assert get_recorder() is None
+    assert [timing.stage for timing in trace.timings] == [
+        "read",
+        "kdf",
+        "aes",
+        "unpad",
+        "parse",
+        "validate",
+        "upsert",
+        "serialise",
+        "kdf",
+        "encrypt",
+        "write",
+    ]
+    assert trace.timings[0].nbytes == (BASE_PATH / "LCSaveFile1").stat().st_size
+    assert trace.total() == sum(timing.duration for timing in trace.timings)
+
+
+def test_metrics_aggregate() -> None:
+    metrics = Metrics()
+
+    with recording(metrics):
+        for _ in range(5):
+            SaveFile.from_path(BASE_PATH / "LCSaveFile2")
+
+    stages = metrics.stages()
+    assert stages["aes"].runs == 5
+    assert sum(stages["aes"].histogram.values()) == 5
+    assert stages["aes"].minimum <= metrics.percentile("aes", 50) <= stages["aes"].maximum
+    assert stages["read"].nbytes == 5 * (BASE_PATH / "LCSaveFile2").stat().st_size
+
+    metrics.reset()
+    assert metrics.stages() == {}
@@ -1,15 +1,18 @@
-# pyright: reportPrivateUsage=false
+# pyright: reportPrivateUsage=false, reportTypedDictNotRequiredAccess=false
 # this is okay in tests
 
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, cast
 
 import pytest
 
-from great_asset import Moon, SaveFile, Scrap, ShipUnlock
+from great_asset import BestiaryEntry, ExtraUnlock, Item, Moon, SaveFile, Scrap, ShipUnlock, Vector, save_file
+from great_asset.vector import SHELVES
 
 BASE_PATH = Path(__file__).parent
 
@@ -120,6 +123,15 @@ class TestSaveFile:
         assert save.raw_deadline == deadline * 1080
         assert save._inner_data["DeadlineTime"]["value"] == float(deadline * 1080)
 
+    def test_editing_raw_deadline(self) -> None:
+        save = make_save(1)
+
+        save.update_deadline(1620.4)
+
+        assert save.raw_deadline == 1620
+        assert save.deadline == 2
+        assert save._inner_data["DeadlineTime"] == {"__type": "int", "value": 1620}
+
     @pytest.mark.parametrize("quota", [(69), (420), (69420)])
     def test_editing_profit_quota(self, quota: int) -> None:
         save = make_save(2)
@@ -158,11 +170,11 @@ class TestSaveFile:
         save = make_save(1)
         serialised_name = f"ShipUnlockStored_{item.serialised_name}"
 
-        assert item.serialised_value not in save._unlocked_ship_objects["value"]
+        assert not save.has_ship_upgrades(item)
 
         save.unlock_ship_upgrades(item)
 
-        assert item.serialised_value in save._unlocked_ship_objects["value"]
+        assert save.has_ship_upgrades(item)
         assert serialised_name in save._extra_data
 
         save.write()
@@ -177,11 +189,294 @@ class TestSaveFile:
         # spawn something to check we have it exactly as desired.
         save.spawn_items((scrap, None), value_min=127, value_max=127)
 
-        assert save._scrap[-1].id == scrap.value
+        assert save.get_current_scrap()[-1] is scrap
 
         save.write()
 
         # get the index for the item
-        idx = save._inner_data["shipGrabbableItemIDs"]["value"].index(scrap.value)  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+        ids = save._inner_data["shipGrabbableItemIDs"]["value"]  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+        idx = ids.index(scrap.value)
+        # scrap values are handed out to each piece of scrap in order
+        value_idx = sum(1 for item_id in ids[:idx] if item_id in {scrap.value for scrap in Scrap})
+
+        assert save._inner_data["shipScrapValues"]["value"][value_idx] == 127  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+
+    def test_debug_sink(self, tmp_path: Path) -> None:
+        payloads: list[bytes] = []
+
+        save = make_save(1)
+        save.debug_sink = payloads.append
+        save.update_credits(1)
+        save.write(path=tmp_path / "LCSaveFile1")
+
+        sink_executor = save_file._debug_executor
+        assert sink_executor is not None
+        sink_executor.submit(lambda: None).result()  # wait for the queued write
+
+        assert len(payloads) == 1
+        assert b"GroupCredits" in payloads[0]
+
+    def test_no_debug_sink_by_default(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+
+        save = make_save(1)
+        assert save.debug_sink is None
+
+        save.write(path=tmp_path / "LCSaveFile1")
+
+        assert not (tmp_path / save_file.TEMP_FILE).exists()
+
+    def test_unmodified_write_is_noop(self, tmp_path: Path) -> None:
+        save = make_save(1)
+        original = save._raw_data
+
+        assert not save.modified_keys
+        assert save.write(path=tmp_path / "LCSaveFile1") is original
+        assert (tmp_path / "LCSaveFile1").read_bytes() == original
+
+    def test_write_tracks_changes(self) -> None:
+        save = make_save(2)
+
+        save.update_credits(save.credits)
+        assert not save.modified_keys
+
+        save.update_credits(1)
+        save.spawn_items((Scrap.bee_hive, None))
+        assert save.modified_keys == {"GroupCredits", "shipScrapValues", "shipGrabbableItemIDs", "shipGrabbableItemPos"}
+
+        written = save.write()
+        assert not save.modified_keys
+        assert written != make_save(2)._raw_data
+        assert save.write() is written
+
+    def test_repeated_writes_are_stable(self) -> None:
+        save = make_save(2)
+        save.spawn_items((Scrap.bee_hive, None), (Item.shovel, None))
+
+        save.write()
+        first = save._inner_data["shipGrabbableItemIDs"]["value"]  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+
+        save.update_credits(1)
+        save.write()
+        assert save._inner_data["shipGrabbableItemIDs"]["value"] == first  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+        assert len(save._inner_data["shipScrapValues"]["value"]) == len(save.get_current_scrap())  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+
+    def test_ship_items_parsed_lazily(self) -> None:
+        save = make_save(1)
+
+        assert save.credits == 1605
+        assert save._ship_items is None
+
+        assert save.get_current_scrap()
+        assert save._ship_items is not None
+
+    def test_ship_items_round_trip(self) -> None:
+        save = make_save(2)
+        keys = ("shipGrabbableItemIDs", "shipScrapValues", "shipGrabbableItemPos")
+        original = {key: save._inner_data[key]["value"] for key in keys}  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+
+        assert save.get_current_scrap() == [
+            Scrap.big_bolt,
+            Scrap.large_axel,
+            Scrap.bottles,
+            Scrap.big_bolt,
+            Scrap.airhorn,
+            Scrap.v_type_engine,
+        ]
+        assert save.get_current_items().count(Item.shovel) == 4
+
+        save.spawn_items((Item.shovel, Vector(1, 2, 3)), (Scrap.gold_bar, Vector(4, 5, 6)), value_min=50, value_max=50)
+        save.write()
+
+        assert save._inner_data["shipGrabbableItemIDs"]["value"] == [*original["shipGrabbableItemIDs"], 10, 36]  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+        assert save._inner_data["shipScrapValues"]["value"] == [*original["shipScrapValues"], 50]  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+        assert save._inner_data["shipGrabbableItemPos"]["value"] == [  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+            *original["shipGrabbableItemPos"],
+            {"x": 1.0, "y": 2.0, "z": 3.0},
+            {"x": 4.0, "y": 5.0, "z": 6.0},
+        ]
+
+    def test_spawn_many(self) -> None:
+        save = make_save(1)
+        scrap_before = len(save.get_current_scrap())
+        items_before = len(save.get_current_items())
+
+        save.spawn_many(Scrap.gold_bar, 500, value_min=10, value_max=20)
+        save.spawn_many(Item.shovel, 250, region=(Vector(0, 0, 0), Vector(1, 1, 1)))
+        save.write()
+
+        assert len(save.get_current_scrap()) == scrap_before + 500
+        assert len(save.get_current_items()) == items_before + 250
+
+        values = save._inner_data["shipScrapValues"]["value"]  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+        assert all(10 <= value <= 20 for value in values[-500:])
+
+        positions = save._inner_data["shipGrabbableItemPos"]["value"]  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+        assert len(positions) == len(save._inner_data["shipGrabbableItemIDs"]["value"])  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+        assert all(0 <= pos["x"] <= 1 and 0 <= pos["y"] <= 1 and 0 <= pos["z"] <= 1 for pos in positions[-250:])
+        assert all(pos["y"] in SHELVES for pos in positions[-750:-250])
+
+    def test_unlocks_are_deduplicated(self) -> None:
+        save = make_save(1)
+        before = list(save._inner_data["UnlockedShipObjects"]["value"])  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+
+        save.unlock_ship_upgrades(ShipUnlock.goldfish, ShipUnlock.goldfish)
+        save.unlock_ship_upgrades(ShipUnlock.goldfish)
+        save.write()
+
+        unlocked = save._inner_data["UnlockedShipObjects"]["value"]  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+        assert unlocked == [*before, ShipUnlock.goldfish.serialised_value]
+
+    def test_unlock_extras_merges(self) -> None:
+        save = make_save(1)
+        save.unlock_ship_upgrades(ShipUnlock.goldfish)
+        save.unlock_extras(ExtraUnlock.orange_suit)
+
+        assert save.has_ship_upgrades(ShipUnlock.goldfish)
+        assert save.has_extras(ExtraUnlock.orange_suit)
+
+        save.remove_extras(ExtraUnlock.orange_suit)
+
+        assert not save.has_extras(ExtraUnlock.orange_suit)
+        assert save.has_ship_upgrades(ShipUnlock.goldfish)
+
+    def test_bestiary_entries(self) -> None:
+        save = make_save(1)
+        entries = list(BestiaryEntry)[:2]
+
+        save.unlock_bestiary_entries(entries[0])
+        save.unlock_bestiary_entries(entries[1])
+
+        assert save.has_bestiary_entries(*entries)
+
+        save.remove_bestiary_entries(entries[0])
+        save.write()
+
+        assert not save.has_bestiary_entries(*entries)
+        assert entries[0].value not in save._inner_data["EnemyScans"]["value"]  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+        assert entries[1].value in save._inner_data["EnemyScans"]["value"]  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+
+    def test_unlock_masks(self) -> None:
+        save = make_save(1)
+        teleporters = ShipUnlock.to_mask([ShipUnlock.teleporter, ShipUnlock.inverse_teleporter])
+
+        save.update_unlocked_mask(save.unlocked_mask | teleporters)
+
+        assert save.has_ship_upgrades(ShipUnlock.teleporter, ShipUnlock.inverse_teleporter)
+        assert save.unlocked_mask & teleporters == teleporters
+
+        save.update_unlocked_mask(save.unlocked_mask & ~ShipUnlock.inverse_teleporter.bit)
+        save.write()
+
+        assert save.has_ship_upgrades(ShipUnlock.teleporter)
+        assert not save.has_ship_upgrades(ShipUnlock.inverse_teleporter)
+        assert save._inner_data[ShipUnlock.teleporter.stored_key]["value"] is True
+        assert save._inner_data[ShipUnlock.inverse_teleporter.stored_key]["value"] is False
+
+    def test_bestiary_mask(self) -> None:
+        save = make_save(1)
+        mask = BestiaryEntry.to_mask([BestiaryEntry.bracken, BestiaryEntry.jester])
+
+        save.update_bestiary_mask(mask)
+
+        assert save.bestiary_mask == mask
+        assert BestiaryEntry.from_mask(save.bestiary_mask) == [BestiaryEntry.bracken, BestiaryEntry.jester]
+
+    def test_async_round_trip(self, tmp_path: Path) -> None:
+        async def main() -> SaveFile:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                saves = await asyncio.gather(
+                    *(SaveFile.async_from_path(BASE_PATH / f"save_files/LCSaveFile{n}", executor=executor) for n in (1, 2))
+                )
+                for idx, save in enumerate(saves):
+                    save.update_credits(idx + 1000)
+                    await save.async_write(path=tmp_path / f"LCSaveFile{idx}", executor=executor)
+
+                async with await SaveFile.async_from_path(tmp_path / "LCSaveFile1") as save:
+                    save.update_deaths(3)
+
+            return save
+
+        save = asyncio.run(main())
+
+        assert save.modified_keys == frozenset()
+        assert SaveFile(save.write()).deaths == 3
+        assert SaveFile.from_path(tmp_path / "LCSaveFile0").credits == 1000
+        assert SaveFile.from_path(tmp_path / "LCSaveFile1").credits == 1001
+
+    def test_upserts_use_schema_tags(self) -> None:
+        save = make_save(1)
+        key = ShipUnlock.signal_translator.stored_key
+        save._inner_data.pop(key, None)
+
+        save.unlock_ship_upgrades(ShipUnlock.signal_translator)
+        save.write()
+
+        # a bool used to be tagged as an int, failing full validation
+        assert save._inner_data[key] == {"__type": "bool", "value": True}
+        save._schema.validate(save._inner_data, mode="full")
+
+    def test_apply(self) -> None:
+        save = make_save(1)
+
+        save.apply({"GroupCredits": 1234.0, "EnemyScans": [BestiaryEntry.jester.value], "SomeNewKey": 0.5})
+
+        assert save.credits == 1234
+        assert save._inner_data["GroupCredits"] == {"__type": "int", "value": 1234}
+        assert cast("dict[str, Any]", save._inner_data)["SomeNewKey"] == {"__type": "float", "value": 0.5}
+        # the ids held by the save are refreshed, rather than overwritten on the next write
+        save.write()
+        assert save.bestiary_mask == BestiaryEntry.jester.bit
+        assert save._inner_data["EnemyScans"]["value"] == [BestiaryEntry.jester.value]
+
+        with pytest.raises(ValueError, match="GroupCredits"):
+            save.apply({"GroupCredits": "lots"})
+
+    def test_apply_fields(self) -> None:
+        save = make_save(1)
+
+        save.apply({"Stats_Deaths": 7}, credits=2000, current_moon=Moon.titan, deadline=2)
+
+        assert save.credits == 2000
+        assert save.current_moon is Moon.titan
+        assert save.raw_deadline == 2160
+        assert save.deaths == 7
+        assert save.modified_keys == {"GroupCredits", "CurrentPlanetID", "DeadlineTime", "Stats_Deaths"}
+
+        # a float is the raw value, rounded as update_deadline does
+        save.apply(deadline=1620.4)
+        assert save.raw_deadline == 1620
+        assert save._inner_data["DeadlineTime"] == {"__type": "int", "value": 1620}
+
+        with pytest.raises(TypeError, match="creds"):
+            save.apply(creds=1)
+
+    def test_apply_to_many(self, tmp_path: Path) -> None:
+        paths = [tmp_path / "LCSaveFile1", tmp_path / "LCSaveFile2", tmp_path / "LCSaveFile3"]
+        paths[0].write_bytes((BASE_PATH / "save_files/LCSaveFile1").read_bytes())
+        paths[1].write_bytes((BASE_PATH / "save_files/LCSaveFile2").read_bytes())
+        paths[2].write_bytes(b"not a save file")
+
+        results = list(
+            SaveFile.apply_to_many(paths, {"credits": 1500, "profit_quota": 300, "deadline": 1620.4}, max_workers=2)
+        )
 
-        assert save._inner_data["shipScrapValues"]["value"][idx] == 127  # type: ignore[reportTypedDictNotRequiredAccess] # we know it's here.
+        assert [result.source for result in results] == paths
+        assert results[0].error is None and results[0].result == {"GroupCredits", "ProfitQuota", "DeadlineTime"}
+        assert results[1].error is None
+        assert results[2].error is not None
+        assert paths[2].read_bytes() == b"not a save file"
+
+        for path in paths[:2]:
+            save = SaveFile.from_path(path)
+            assert (save.credits, save.profit_quota, save.raw_deadline) == (1500, 300, 1620)
+
+        # nothing left to change, so nothing is written
+        unchanged = paths[0].read_bytes()
+        with ThreadPoolExecutor() as executor:
+            (result,) = SaveFile.apply_to_many(paths[:1], {"credits": 1500}, executor=executor)
+        assert result.result == frozenset()
+        assert paths[0].read_bytes() == unchanged
+
+        with pytest.raises(TypeError, match="creds"):
+            SaveFile.apply_to_many(paths, {"creds": 1})
@@ -0,0 +1,177 @@
+# pyright: reportPrivateUsage=false
+# this is okay in tests
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from great_asset import CRYPTO_PASSWORD, ChallengeFile, ConfigFile, SaveFile, Vector, save_file
+from great_asset.crypt import decrypt, encrypt
+from great_asset.schema import CHALLENGE_FILE_SCHEMA, CONFIG_FILE_SCHEMA, SAVE_FILE_SCHEMA
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+BASE_PATH = Path(__file__).parent / "save_files"
+
+
+@pytest.fixture
+def full_validation() -> Iterator[None]:
+    save_file.set_validation_mode("full")
+    try:
+        yield
+    finally:
+        save_file.set_validation_mode("required")
+
+
+def load(name: str) -> Any:
+    return decrypt(path=BASE_PATH / name, password=CRYPTO_PASSWORD)
+
+
+def test_schemas_from_typed_dicts() -> None:
+    assert SAVE_FILE_SCHEMA.required == {
+        "CurrentPlanetID",
+        "DeadlineTime",
+        "GroupCredits",
+        "ProfitQuota",
+        "QuotaFulfilled",
+        "QuotasPassed",
+        "RandomSeed",
+        "Stats_DaysSpent",
+        "Stats_Deaths",
+        "Stats_StepsTaken",
+    }
+    assert "shipGrabbableItemPos" not in SAVE_FILE_SCHEMA.required
+    assert CONFIG_FILE_SCHEMA.required == {"SelectedFile", "FPSCap", "Gamma", "LookSens", "ScreenMode"}
+    # these use string `Required[...]` annotations
+    assert CHALLENGE_FILE_SCHEMA.required == {"ProfitEarned", "FinishedChallenge", "SubmittedScore"}
+
+
+@pytest.mark.parametrize("number", [1, 2])
+def test_real_files_are_valid(number: int) -> None:
+    SAVE_FILE_SCHEMA.validate(load(f"LCSaveFile{number}"))
+    CHALLENGE_FILE_SCHEMA.validate(load(f"LCChallengeFile{number}"))
+
+
+@pytest.mark.parametrize(
+    ("key", "entry"),
+    [
+        ("GroupCredits", {"__type": "int", "value": "1000"}),
+        ("GroupCredits", {"__type": "float", "value": 1000}),
+        ("GroupCredits", {"value": 1000}),
+        ("ShipUnlockStored_Teleporter", {"__type": "bool", "value": 1}),
+        ("EnemyScans", {"__type": "System.Int32[],mscorlib", "value": [1, "2"]}),
+        ("shipGrabbableItemPos", {"__type": "UnityEngine.Vector3[],UnityEngine.CoreModule", "value": [{"x": 1, "y": 2}]}),
+    ],
+)
+def test_invalid_entries(key: str, entry: Any) -> None:
+    data = load("LCSaveFile1")
+    data[key] = entry
+
+    SAVE_FILE_SCHEMA.validate(data, mode="required")
+    with pytest.raises(ValueError, match=key):
+        SAVE_FILE_SCHEMA.validate(data, mode="full")
+
+
+def test_modes() -> None:
+    data = load("LCSaveFile1")
+    del data["GroupCredits"]
+
+    SAVE_FILE_SCHEMA.validate(data, mode="off")
+    with pytest.raises(ValueError, match="GroupCredits"):
+        SAVE_FILE_SCHEMA.validate(data, mode="required")
+
+
+@pytest.mark.parametrize("key", ["FileGameVers", "StoryLogs", "Stats_ValueCollected", "EnemyScans"])
+def test_older_saves_are_valid(key: str) -> None:
+    # only the keys the save file reads up front are required, older versions of the game don't write the rest
+    data = load("LCSaveFile1")
+    del data[key]
+
+    SAVE_FILE_SCHEMA.validate(data, mode="required")
+    SAVE_FILE_SCHEMA.validate(data, mode="full")
+    SaveFile(encrypted(data))
+
+
+def test_unknown_keys_are_allowed() -> None:
+    data = load("LCSaveFile1")
+    data["SomeNewKey"] = {"__type": "string", "value": "hello"}
+
+    SAVE_FILE_SCHEMA.validate(data)
+
+
+def encrypted(data: Any) -> bytes:
+    return encrypt(data=json.dumps(data).encode(), password=CRYPTO_PASSWORD)
+
+
+@pytest.mark.usefixtures("full_validation")
+def test_files_use_the_validation_mode() -> None:
+    data = load("LCSaveFile1")
+    SaveFile(encrypted(data))
+
+    data["GroupCredits"]["value"] = "lots"
+    with pytest.raises(ValueError, match="GroupCredits"):
+        SaveFile(encrypted(data))
+
+    with pytest.raises(ValueError, match="Challenge file"):
+        ChallengeFile(encrypted({}))
+
+
+def test_setters() -> None:
+    tag, coerce = SAVE_FILE_SCHEMA.setter("ShipUnlockStored_Teleporter", True)
+    assert tag == "bool" and coerce(True) is True
+
+    tag, coerce = SAVE_FILE_SCHEMA.setter("GroupCredits", 1.0)
+    assert tag == "int" and coerce(1.0) == 1
+    with pytest.raises(ValueError, match="expected an int"):
+        coerce("1000")
+
+    # keys the schema doesn't know keep the tag within the file, or have it inferred
+    assert SAVE_FILE_SCHEMA.setter("SomeNewKey", 1, "float")[0] == "float"
+    assert SAVE_FILE_SCHEMA.setter("SomeNewKey", True)[0] == "bool"
+    assert SAVE_FILE_SCHEMA.setter("SomeNewKey", 0.5)[0] == "float"
+    assert SAVE_FILE_SCHEMA.setter("SomeNewKey", "hi")[0] == "string"
+    assert SAVE_FILE_SCHEMA.setter("SomeNewKey", [1, 2])[0] == "System.Int32[],mscorlib"
+    assert SAVE_FILE_SCHEMA.setter("SomeNewKey", [Vector(1, 2, 3)])[0] == "UnityEngine.Vector3[],UnityEngine.CoreModule"
+    with pytest.raises(ValueError, match="array type"):
+        SAVE_FILE_SCHEMA.setter("SomeNewKey", [1, "2"])
+
+
+@pytest.mark.usefixtures("full_validation")
+def test_config_file_writes_valid_tags() -> None:
+    data: dict[str, Any] = {
+        "SelectedFile": {"__type": "int", "value": 0},
+        "FPSCap": {"__type": "int", "value": 2},
+        "Gamma": {"__type": "float", "value": 0.5},
+        "LookSens": {"__type": "int", "value": 10},
+        "ScreenMode": {"__type": "int", "value": 1},
+        "SpiderSafeMode": {"__type": "bool", "value": False},
+        "InvertYAxis": {"__type": "bool", "value": False},
+        "CurrentMic": {"__type": "string", "value": "Microphone"},
+        "PushToTalk": {"__type": "bool", "value": True},
+        "MicEnabled": {"__type": "bool", "value": True},
+        "MasterVolume": {"__type": "float", "value": 1.0},
+        "PlayerFinishedSetup": {"__type": "bool", "value": True},
+        "StartInOnlineMode": {"__type": "bool", "value": True},
+        "PlayerXPNum": {"__type": "int", "value": 12},
+        "LC_StorageTip": {"__type": "bool", "value": False},
+    }
+    config = ConfigFile(encrypted(data))
+    config.set_arachnophobia_mode(True)
+    config.set_master_volume(0)
+    config.set_player_xp(40)
+
+    written = decrypt(data=config.write(), password=CRYPTO_PASSWORD)
+    CONFIG_FILE_SCHEMA.validate(written)
+    assert written["SpiderSafeMode"] == {"__type": "bool", "value": True}
+    assert written["MasterVolume"] == {"__type": "float", "value": 0.0}
+    assert written["PlayerXPNum"] == {"__type": "int", "value": 40}
+    assert written["LC_StorageTip"] == {"__type": "bool", "value": False}
+
+    config.apply({"Gamma": 1, "LC_StorageTip": True})
+    assert config.gamma == 1.0
+    assert config.tips["LC_StorageTip"] is True
@@ -0,0 +1,140 @@
+# pyright: reportPrivateUsage=false
+# this is okay in tests
+
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from great_asset import SaveFile
+from great_asset.utils import (
+    HAS_ORJSON,
+    JSONCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    _write_file,
+    get_json_codec,
+    set_json_codec,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from great_asset.utils import DumpProfile, Durability
+
+BASE_PATH = Path(__file__).parent
+SAVE_PATH = BASE_PATH / "save_files/LCSaveFile1"
+
+CODECS: list[JSONCodec] = [StdlibJSONCodec()]
+if HAS_ORJSON:
+    CODECS.append(OrjsonCodec())
+
+
+@pytest.fixture()
+def restore_codec() -> Iterator[None]:
+    codec = get_json_codec()
+    yield
+    set_json_codec(codec)
+
+
+@pytest.mark.usefixtures("restore_codec")
+class TestJSONCodec:
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_codecs_work_on_bytes(self, codec: JSONCodec) -> None:
+        payload = {"b": [1, 2, 3], "a": {"__type": "int", "value": 1}}
+
+        dumped = codec.dumps(payload)
+
+        assert isinstance(dumped, bytes)
+        assert codec.loads(dumped) == payload
+        assert codec.loads(memoryview(dumped)) == payload
+        assert codec.loads(bytearray(dumped)) == payload
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_round_trip_save(self, codec: JSONCodec, tmp_path: Path) -> None:
+        set_json_codec(codec)
+
+        save = SaveFile.from_path(SAVE_PATH)
+        save.update_credits(1234)
+        save.write(path=tmp_path / "LCSaveFile1")
+
+        assert SaveFile.from_path(tmp_path / "LCSaveFile1").credits == 1234
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_profiles(self, codec: JSONCodec) -> None:
+        payload = {"b": [1, 2, 3], "a": {"__type": "int", "value": 1}}
+
+        compact = codec.dumps(payload, profile="compact")
+        pretty = codec.dumps(payload, profile="pretty")
+        ordered = codec.dumps(payload, profile="sorted")
+
+        assert len(compact) == len(ordered) < len(pretty)
+        assert ordered.index(b'"a"') < ordered.index(b'"b"')
+        assert codec.loads(compact) == codec.loads(pretty) == codec.loads(ordered) == payload
+
+    def test_compact_save_file(self, tmp_path: Path) -> None:
+        profiles: tuple[DumpProfile, ...] = ("pretty", "compact")
+        for profile in profiles:
+            save = SaveFile.from_path(SAVE_PATH)
+            save.update_credits(1)  # unmodified files aren't re-serialised
+            save.write(path=tmp_path / profile, profile=profile)
+
+        assert (tmp_path / "compact").stat().st_size < (tmp_path / "pretty").stat().st_size
+        assert SaveFile.from_path(tmp_path / "compact")._inner_data == SaveFile.from_path(tmp_path / "pretty")._inner_data
+
+
+class TestWriteFile:
+    @pytest.mark.parametrize("durability", ["none", "file", "directory"])
+    def test_atomic_write(self, durability: Durability, tmp_path: Path) -> None:
+        target = tmp_path / "LCSaveFile1"
+        target.write_bytes(b"old")
+
+        _write_file(target, b"new", durability=durability)
+
+        assert target.read_bytes() == b"new"
+        assert [path.name for path in tmp_path.iterdir()] == ["LCSaveFile1"]
+
+    def test_failed_atomic_write_keeps_original(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        target = tmp_path / "LCSaveFile1"
+        target.write_bytes(b"old")
+
+        def fail(fd: int) -> None:
+            raise OSError("disk on fire")
+
+        monkeypatch.setattr(os, "fsync", fail)
+
+        with pytest.raises(OSError, match="disk on fire"):
+            _write_file(target, b"new", durability="file")
+
+        assert target.read_bytes() == b"old"
+        assert [path.name for path in tmp_path.iterdir()] == ["LCSaveFile1"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="Windows has no umask")
+    def test_atomic_write_respects_umask(self, tmp_path: Path) -> None:
+        _write_file(tmp_path / "atomic", b"new")
+        _write_file(tmp_path / "plain", b"new", atomic=False)
+
+        assert (tmp_path / "atomic").stat().st_mode == (tmp_path / "plain").stat().st_mode
+
+        umask = os.umask(0o027)
+        try:
+            _write_file(tmp_path / "private", b"new")
+            (tmp_path / "atomic").chmod(0o604)
+            _write_file(tmp_path / "atomic", b"replaced")
+        finally:
+            os.umask(umask)
+
+        assert (tmp_path / "private").stat().st_mode & 0o777 == 0o640
+        # replacing a file keeps its permissions, whatever the umask
+        assert (tmp_path / "atomic").stat().st_mode & 0o777 == 0o604
+
+    def test_save_file_write_modes(self, tmp_path: Path) -> None:
+        for atomic in (True, False):
+            output = tmp_path / f"atomic-{atomic}"
+            SaveFile.from_path(SAVE_PATH).write(path=output, atomic=atomic, durability="file")
+
+            assert SaveFile.from_path(output).credits == 1605
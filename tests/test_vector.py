@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from great_asset import Vector, VectorArray, vector
+
+if TYPE_CHECKING:
+    from great_asset.types_.shared import InnerVectorValue
+
+POSITIONS: list[InnerVectorValue] = [{"x": 1.0, "y": 2.0, "z": 3.0}, {"x": -1.5, "y": 5.0, "z": 0.0}]
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    # runs the test with and without NumPy, as each has its own code path
+    if request.param == "numpy":
+        monkeypatch.setattr(vector, "_numpy", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(vector, "_numpy", False)
+    return request.param
+
+
+class TestVectorArray:
+    def test_round_trip(self) -> None:
+        array = VectorArray.from_dicts(POSITIONS)
+
+        assert len(array) == 2
+        assert array.to_dicts() == POSITIONS
+        assert VectorArray.from_vectors(array).to_dicts() == POSITIONS
+        assert array[-1].serialise() == POSITIONS[-1]
+
+    @pytest.mark.usefixtures("backend")
+    def test_translate_and_bounds(self) -> None:
+        array = VectorArray.from_dicts(POSITIONS)
+        array.translate(x=1, z=-1)
+
+        assert array.to_dicts() == [{"x": 2.0, "y": 2.0, "z": 2.0}, {"x": -0.5, "y": 5.0, "z": -1.0}]
+
+        lower, upper = array.bounds()
+        assert lower.serialise() == {"x": -0.5, "y": 2.0, "z": -1.0}
+        assert upper.serialise() == {"x": 2.0, "y": 5.0, "z": 2.0}
+
+    def test_memoryview_is_zero_copy(self) -> None:
+        array = VectorArray.from_dicts(POSITIONS)
+        view = array.as_memoryview()
+        view[0] = 10.0
+
+        assert array[0].x == 10.0
+
+    def test_vector_is_slotted(self) -> None:
+        with pytest.raises(AttributeError):
+            Vector.default().w = 1.0  # type: ignore[reportAttributeAccessIssue] # this is the point
+
+    @pytest.mark.usefixtures("backend")
+    def test_random_in_box(self) -> None:
+        lower, upper = Vector(-1.0, 0.0, 2.0), Vector(1.0, 4.0, 3.0)
+
+        array = VectorArray.random_in_box(100, lower, upper)
+        assert len(array) == 100
+        low, high = array.bounds()
+        assert lower.x <= low.x and lower.y <= low.y and lower.z <= low.z
+        assert high.x <= upper.x and high.y <= upper.y and high.z <= upper.z
+
+        shelves = VectorArray.random_in_box(100, lower, upper, heights=[0.5, 1.5])
+        assert {position.y for position in shelves} <= {0.5, 1.5}
+
+    def test_as_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        numpy = pytest.importorskip("numpy")
+        monkeypatch.setattr(vector, "_numpy", numpy)
+        array = VectorArray.from_dicts(POSITIONS)
+
+        view = array.as_numpy()
+        assert view.shape == (2, 3)
+        view[1, 2] = 7.0
+        assert array[1].z == 7.0
+
+    def test_as_numpy_without_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(vector, "_numpy", False)
+
+        with pytest.raises(RuntimeError, match="NumPy"):
+            VectorArray.from_dicts(POSITIONS).as_numpy()
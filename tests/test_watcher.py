@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import shutil
+from pathlib import Path
+
+from great_asset import ChallengeFile, SaveFile
+from great_asset.watcher import SaveWatcher
+
+BASE_PATH = Path(__file__).parent / "save_files"
+
+
+def test_poll(tmp_path: Path) -> None:
+    shutil.copy(BASE_PATH / "LCSaveFile1", tmp_path / "LCSaveFile1")
+    shutil.copy(BASE_PATH / "LCChallengeFile1", tmp_path / "LCChallengeFile1")
+    (tmp_path / "notes.txt").write_text("not a save")
+
+    watcher = SaveWatcher(tmp_path)
+    events = sorted(watcher.poll())
+
+    assert [(event.kind, event.path.name) for event in events] == [
+        ("added", "LCChallengeFile1"),
+        ("added", "LCSaveFile1"),
+    ]
+    assert isinstance(watcher.files[tmp_path / "LCSaveFile1"], SaveFile)
+    assert isinstance(watcher.files[tmp_path / "LCChallengeFile1"], ChallengeFile)
+
+    # nothing changed, so nothing is reloaded
+    assert watcher.poll() == []
+
+    save = watcher.files[tmp_path / "LCSaveFile1"]
+    assert isinstance(save, SaveFile)
+    save.update_credits(1234)
+    save.write(path=tmp_path / "LCSaveFile1")
+
+    (event,) = watcher.poll()
+    assert event.kind == "modified"
+    assert isinstance(event.file, SaveFile)
+    assert event.file.credits == 1234
+
+    (tmp_path / "LCChallengeFile1").unlink()
+
+    (event,) = watcher.poll()
+    assert event.kind == "removed"
+    assert tmp_path / "LCChallengeFile1" not in watcher.files
+
+
+def test_poll_keeps_last_good_file(tmp_path: Path) -> None:
+    path = tmp_path / "LCSaveFile1"
+    shutil.copy(BASE_PATH / "LCSaveFile1", path)
+
+    watcher = SaveWatcher(tmp_path)
+    watcher.poll()
+    original = watcher.files[path]
+
+    path.write_bytes(b"garbage, part way through a write")
+
+    (event,) = watcher.poll()
+    assert event.error is not None
+    assert watcher.files[path] is original
+
+
+def test_async_poll(tmp_path: Path) -> None:
+    shutil.copy(BASE_PATH / "LCSaveFile1", tmp_path / "LCSaveFile1")
+    shutil.copy(BASE_PATH / "LCSaveFile2", tmp_path / "LCSaveFile2")
+
+    watcher = SaveWatcher(tmp_path)
+    events = asyncio.run(watcher.async_poll())
+
+    assert sorted(event.path.name for event in events) == ["LCSaveFile1", "LCSaveFile2"]
+    assert all(event.error is None for event in events)
+    assert len(watcher.files) == 2